@@ -48,60 +48,75 @@ try:
 except (ModuleNotFoundError, ImportError):
     pass
 
-# Import modules that require pygame
-if __pygame_version__ is not None:
-    """
-    BaseImage: Provides basic image loading an manipulation with pygame
-    """
-    import pygame_menu.baseimage  # lgtm [py/import-and-import-from]
-    from pygame_menu.baseimage import BaseImage
-
-    """
-    Controls: Default controls of menu object and key definition
-    """
-    import pygame_menu.controls
-
-    """
-    Events: Menu events definition and locals
-    """
-    import pygame_menu.events
-
-    """
-    Fonts: Menu fonts
-    """
-    import pygame_menu.font
-
-    """
-    Locals: Local constants
-    """
-    import pygame_menu.locals
-
-    """
-    Menu: Menu class
-    """
-    from pygame_menu.menu import Menu
-
-    """
-    ScrollArea: Scrollarea class
-    """
-    import pygame_menu.scrollarea
-
-    """
-    Sound: Sound class
-    """
-    import pygame_menu.sound  # lgtm [py/import-and-import-from]
-    from pygame_menu.sound import Sound
-
-    """
-    Themes: Menu themes
-    """
-    import pygame_menu.themes  # lgtm [py/import-and-import-from]
-    from pygame_menu.themes import Theme
-
-    """
-    Widgets: Menu widgets
-    """
-    import pygame_menu.widgets
+"""
+Modules and common classes are imported on first access (PEP 562), thus,
+importing pygame_menu does not import all the widgets and the themes
+"""
+import importlib as _importlib
+import sys as _sys
+
+from typing import Any as _Any, List as _List
+
+_LAZY_CLASSES = {
+    'BaseImage': 'pygame_menu.baseimage',  # Provides basic image loading an manipulation with pygame
+    'Menu': 'pygame_menu.menu',  # Menu class
+    'Sound': 'pygame_menu.sound',  # Sound class
+    'Theme': 'pygame_menu.themes'  # Menu themes
+}
+
+_LAZY_MODULES = (
+    '_base',  # Base class of the Menu objects
+    '_decorator',  # Decorator of the Menu objects
+    '_timeline',  # Menu timeline
+    '_types',  # Type definitions
+    '_widgetmanager',  # Widget manager of the Menu
+    'baseimage',  # Provides basic image loading an manipulation with pygame
+    'controls',  # Default controls of menu object and key definition
+    'events',  # Menu events definition and locals
+    'font',  # Menu fonts
+    'locals',  # Local constants
+    'menu',  # Menu class
+    'renderer',  # Hardware accelerated Menu renderer
+    'scrollarea',  # Scrollarea class
+    'sound',  # Sound class
+    'themes',  # Menu themes
+    'tween',  # Widget animations
+    'utils',  # Utility functions
+    'widgets'  # Menu widgets
+)
+
+
+def __getattr__(name: str) -> _Any:
+    """
+    Import the module or the common class on first access.
+
+    :param name: Attribute name
+    :return: Module or class
+    """
+    if __pygame_version__ is not None:
+        if name in _LAZY_CLASSES:
+            value = getattr(_importlib.import_module(_LAZY_CLASSES[name]), name)
+            globals()[name] = value
+            return value
+        if name in _LAZY_MODULES:
+            return _importlib.import_module('pygame_menu.' + name)
+    raise AttributeError('module {0} has no attribute {1}'.format(__name__, name))
+
+
+def __dir__() -> _List[str]:
+    """
+    Return the module attributes, including the lazy ones.
+
+    :return: Attribute names
+    """
+    return sorted(set(globals()).union(_LAZY_CLASSES, _LAZY_MODULES))
+
+
+# Module __getattr__ is not supported by Python 3.6, then, import all
+if __pygame_version__ is not None and _sys.version_info < (3, 7):
+    for _name in (*_LAZY_MODULES, *_LAZY_CLASSES):
+        globals()[_name] = __getattr__(_name)
+    del _name
 
 """
 Version: Library version
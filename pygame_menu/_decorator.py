@@ -38,7 +38,6 @@ import warnings
 
 import pygame
 import pygame_menu
-import pygame_menu.menu
 import pygame.draw as pydraw
 import pygame.gfxdraw as gfxdraw
 
@@ -0,0 +1,159 @@
+"""
+pygame-menu
+https://github.com/ppizarror/pygame-menu
+
+TIMELINE
+Non-blocking animation time of the Menu.
+
+License:
+-------------------------------------------------------------------------------
+The MIT License (MIT)
+Copyright 2017-2021 Pablo Pizarro R. @ppizarror
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the Software
+is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+-------------------------------------------------------------------------------
+"""
+
+__all__ = ['Timeline']
+
+import heapq
+import itertools
+
+import pygame
+
+from pygame_menu.utils import is_callable
+
+from pygame_menu._types import Callable, Any, List, Optional, Tuple
+
+
+class Timeline(object):
+    """
+    Animation time of a Menu. Each Menu update advances the time by the milliseconds
+    elapsed since the previous update, and calls the timers that are due. Unlike
+    ``pygame.time.Clock.tick(framerate)``, the timeline never sleeps, thus, the
+    animations do not throttle the application loop.
+
+    The time only advances while the Menu is updated. The Menu pauses the
+    timeline once it is no longer the current one, and resumes it once it becomes
+    the current again, thus, the animations of a Menu do not advance while other
+    Menu is opened.
+    """
+    _counter: 'itertools.count'
+    _paused: bool
+    _ticks: Optional[int]
+    _time: int
+    _timers: List[Tuple[int, int, Callable[[], Any]]]  # due time, order, callback
+
+    def __init__(self) -> None:
+        self._counter = itertools.count()
+        self._paused = False
+        self._ticks = None
+        self._time = 0
+        self._timers = []
+
+    def get_time(self) -> int:
+        """
+        Return the time of the timeline.
+
+        :return: Time in ms
+        """
+        return self._time
+
+    def schedule(self, delay: int, callback: Callable[[], Any]) -> 'Timeline':
+        """
+        Call a function once, after the given time of the timeline has elapsed.
+
+        :param delay: Delay in ms
+        :param callback: Function with no arguments
+        :return: Self reference
+        """
+        assert isinstance(delay, int)
+        assert delay >= 0, 'delay cannot be negative'
+        assert is_callable(callback), 'callback must be callable (function-type)'
+        heapq.heappush(self._timers, (self._time + delay, next(self._counter), callback))
+        return self
+
+    def pause(self) -> 'Timeline':
+        """
+        Pause the timeline. The time does not advance on update until the timeline
+        is resumed.
+
+        :return: Self reference
+        """
+        self._paused = True
+        self._ticks = None
+        return self
+
+    def resume(self) -> 'Timeline':
+        """
+        Resume the timeline. The time elapsed while the timeline was paused is not
+        counted, as the next update starts measuring again.
+
+        :return: Self reference
+        """
+        self._paused = False
+        self._ticks = None
+        return self
+
+    def is_paused(self) -> bool:
+        """
+        Return ``True`` if the timeline is paused.
+
+        :return: Paused status
+        """
+        return self._paused
+
+    def get_timeout(self) -> Optional[int]:
+        """
+        Return the time until the next timer is due.
+
+        :return: Time in ms. ``None`` if there are no timers
+        """
+        if len(self._timers) == 0:
+            return None
+        return max(0, self._timers[0][0] - self._time)
+
+    def advance(self, ms: int) -> bool:
+        """
+        Advance the time, and call the timers that are due in order.
+
+        :param ms: Time in ms
+        :return: ``True`` if any timer has been called
+        """
+        assert ms >= 0, 'time cannot go backwards'
+        self._time += ms
+        called = False
+        while len(self._timers) > 0 and self._timers[0][0] <= self._time:
+            heapq.heappop(self._timers)[2]()
+            called = True
+        return called
+
+    def update(self) -> bool:
+        """
+        Advance the time by the milliseconds elapsed since the last update. The
+        elapsed time is measured with ``pygame.time.get_ticks``, the same counter
+        used by ``pygame.time.Clock``.
+
+        :return: ``True`` if any timer has been called
+        """
+        if self._paused:
+            return False
+        ticks = pygame.time.get_ticks()
+        elapsed = 0 if self._ticks is None else max(0, ticks - self._ticks)
+        self._ticks = ticks
+        return self.advance(elapsed)
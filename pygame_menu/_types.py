@@ -35,7 +35,7 @@ from pygame.event import Event as EventType
 from typing import Union, List, Tuple, Any, Callable, Sequence, Mapping, Optional
 
 # noinspection PyUnresolvedReferences
-from typing import Dict, Type  # lgtm [py/unused-import]
+from typing import Dict, Type, FrozenSet  # lgtm [py/unused-import]
 
 # noinspection PyUnresolvedReferences
 from typing_extensions import Literal  # lgtm [py/unused-import]
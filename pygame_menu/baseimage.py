@@ -64,11 +64,12 @@ import pygame
 from pygame_menu._base import Base
 from pygame_menu.locals import POSITION_NORTHWEST, POSITION_NORTHEAST, POSITION_CENTER, POSITION_WEST, \
     POSITION_SOUTHWEST, POSITION_EAST, POSITION_SOUTHEAST, POSITION_SOUTH, POSITION_NORTH
-from pygame_menu.utils import assert_vector, assert_position, assert_color
+from pygame_menu.utils import assert_vector, assert_position, assert_color, convert_surface, \
+    get_display_format
 
 from pygame_menu._types import Tuple2IntType, Union, Vector2NumberType, Callable, Tuple, List, \
     NumberType, Optional, Dict, Tuple4IntType, Literal, Tuple2NumberType, ColorInputType, Tuple3IntType, \
-    NumberInstance
+    NumberInstance, Any
 
 # Example image paths
 __images_path__ = path.join(path.dirname(path.abspath(__file__)), 'resources', 'images', '{0}')
@@ -112,6 +113,7 @@ class BaseImage(Base):
     :param image_id: str
     """
     _angle: NumberType
+    _display_surface: Tuple[Optional['pygame.Surface'], Any, Optional['pygame.Surface']]
     _drawing_mode: int
     _drawing_offset: Tuple2IntType
     _drawing_position: str
@@ -192,6 +194,7 @@ class BaseImage(Base):
 
         # Other internals
         self._angle = 0
+        self._display_surface = (None, None, None)  # Surface, display format, converted surface
         self._last_transform = (0, 0, None)  # Improves drawing
         self._rotated = False
         self.smooth_scaling = True  # Uses smooth scaling by default in draw() method
@@ -244,6 +247,7 @@ class BaseImage(Base):
         :param flags: Optional flags
         :return: Self reference
         """
+        self._display_surface = (None, None, None)
         if value is None:
             self._surface.set_alpha(None)
             return self
@@ -320,8 +324,9 @@ class BaseImage(Base):
         image._surface = self._surface.copy()
         image._original_surface = self._surface.copy()
         image.smooth_scaling = self.smooth_scaling
-        for k in self._attributes.keys():
-            image.set_attribute(k, self._attributes[k])
+        if self._attributes is not None:
+            for k in self._attributes.keys():
+                image.set_attribute(k, self._attributes[k])
         return image
 
     def get_path(self) -> Union[str, 'BytesIO']:
@@ -448,6 +453,7 @@ class BaseImage(Base):
         """
         assert_vector(pos, 2)
         self._surface.set_at(pos, assert_color(color))
+        self._display_surface = (None, None, None)
         return self
 
     def get_bitsize(self) -> int:
@@ -462,11 +468,12 @@ class BaseImage(Base):
         """
         Return the surface object of the image.
 
-        :param new: Return a new surface, if ``False`` return the same object
+        :param new: Return a new surface, if ``False`` return the same object. As the object may be modified, the surface converted to the display format is created again on the next draw
         :return: Image surface
         """
         if new:
             return self.get_crop_rect(self.get_rect())
+        self._display_surface = (None, None, None)
         return self._surface
 
     def get_filename(self) -> str:
@@ -592,6 +599,7 @@ class BaseImage(Base):
                     b = 0
                 # noinspection PyArgumentList
                 self._surface.set_at((x, y), pygame.Color(r, g, b, a))
+        self._display_surface = (None, None, None)
         return self
 
     def flip(self, x: bool, y: bool) -> 'BaseImage':
@@ -750,6 +758,21 @@ class BaseImage(Base):
         else:
             raise ValueError('unknown drawing position')
 
+    def _get_display_surface(self) -> 'pygame.Surface':
+        """
+        Return the image surface converted to the display format. The conversion
+        is cached, and it is redone if the image or the display format changes.
+
+        :return: Converted surface
+        """
+        display_format = get_display_format()
+        surface, surface_format, converted = self._display_surface
+        if surface is not self._surface or surface_format != display_format or converted is None:
+            converted = convert_surface(self._surface)
+            self._display_surface = (self._surface, display_format, converted)
+            self._last_transform = (0, 0, None)
+        return converted
+
     def draw(self, surface: 'pygame.Surface', area: Optional['pygame.Rect'] = None,
              position: Tuple2IntType = (0, 0)) -> 'BaseImage':
         """
@@ -776,6 +799,9 @@ class BaseImage(Base):
         offx = self._drawing_offset[0] - px
         offy = self._drawing_offset[1] - py
 
+        # Blit the surface converted to the display format
+        image = self._get_display_surface()
+
         if self._drawing_mode == IMAGE_MODE_FILL:
 
             # Check if exists the transformed surface
@@ -783,10 +809,10 @@ class BaseImage(Base):
                     self._last_transform[2] is not None:
                 surf = self._last_transform[2]
             else:  # Transform scale
-                if self.smooth_scaling and self._surface.get_bitsize() > 8:
-                    surf = pygame.transform.smoothscale(self._surface, (area.width, area.height))
+                if self.smooth_scaling and image.get_bitsize() >= 24:
+                    surf = pygame.transform.smoothscale(image, (area.width, area.height))
                 else:
-                    surf = pygame.transform.scale(self._surface, (area.width, area.height))
+                    surf = pygame.transform.scale(image, (area.width, area.height))
                 self._last_transform = (area.width, area.height, surf)
 
             surface.blit(
@@ -798,13 +824,13 @@ class BaseImage(Base):
 
         elif self._drawing_mode == IMAGE_MODE_REPEAT_X:
 
-            w = self._surface.get_width()
+            w = image.get_width()
             times = int(math.ceil(float(area.width) / w))
             assert times > 0, \
                 'invalid size, width must be greater than zero'
             for x in range(times):
                 surface.blit(
-                    self._surface,
+                    image,
                     (
                         x * w + offx + position[0],
                         offy + position[1]
@@ -814,13 +840,13 @@ class BaseImage(Base):
 
         elif self._drawing_mode == IMAGE_MODE_REPEAT_Y:
 
-            h = self._surface.get_height()
+            h = image.get_height()
             times = int(math.ceil(float(area.height) / h))
             assert times > 0, \
                 'invalid size, height must be greater than zero'
             for y in range(times):
                 surface.blit(
-                    self._surface,
+                    image,
                     (
                         0 + offx + position[0],
                         y * h + offy + position[1]
@@ -830,7 +856,7 @@ class BaseImage(Base):
 
         elif self._drawing_mode == IMAGE_MODE_REPEAT_XY:
 
-            w, h = self._surface.get_size()
+            w, h = image.get_size()
             timesx = int(math.ceil(float(area.width) / w))
             timesy = int(math.ceil(float(area.height) / h))
             assert timesx > 0 and timesy > 0, \
@@ -838,7 +864,7 @@ class BaseImage(Base):
             for x in range(timesx):
                 for y in range(timesy):
                     surface.blit(
-                        self._surface,
+                        image,
                         (
                             x * w + offx + position[0],
                             y * h + offy + position[1]
@@ -849,9 +875,9 @@ class BaseImage(Base):
         elif self._drawing_mode == IMAGE_MODE_CENTER:
 
             sw, hw = area.width, area.height  # Window
-            w, h = self._surface.get_size()  # Image
+            w, h = image.get_size()  # Image
             surface.blit(
-                self._surface,
+                image,
                 (
                     float(sw - w) / 2 + offx + position[0],
                     float(hw - h) / 2 + offy + position[1]
@@ -862,7 +888,7 @@ class BaseImage(Base):
         elif self._drawing_mode == IMAGE_MODE_SIMPLE:
 
             surface.blit(
-                self._surface,
+                image,
                 (
                     offx + position[0],
                     offy + position[1]
@@ -31,6 +31,18 @@ CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 
 __all__ = [
 
+    # Actions
+    'ACTION_APPLY',
+    'ACTION_BACK',
+    'ACTION_CLOSE_MENU',
+    'ACTION_LEFT',
+    'ACTION_MOVE_DOWN',
+    'ACTION_MOVE_UP',
+    'ACTION_RIGHT',
+
+    # Controller
+    'Controller',
+
     # Joy pad
     'JOY_AXIS_X',
     'JOY_AXIS_Y',
@@ -56,8 +68,20 @@ __all__ = [
 
 ]
 
+import pygame
 import pygame.locals as __locals
 
+from pygame_menu._types import Any, Dict, Tuple, Optional, List, EventType, FrozenSet
+
+# Actions
+ACTION_APPLY = 'apply'
+ACTION_BACK = 'back'
+ACTION_CLOSE_MENU = 'close-menu'
+ACTION_LEFT = 'left'
+ACTION_MOVE_DOWN = 'move-down'
+ACTION_MOVE_UP = 'move-up'
+ACTION_RIGHT = 'right'
+
 # Joy pad
 JOY_AXIS_X = 0
 JOY_AXIS_Y = 1
@@ -80,3 +104,161 @@ KEY_LEFT = __locals.K_LEFT
 KEY_MOVE_DOWN = __locals.K_UP
 KEY_MOVE_UP = __locals.K_DOWN  # Consider keys are "inverted"
 KEY_RIGHT = __locals.K_RIGHT
+
+# Event attribute used as the key of the input
+_EVENT_KEY_ATTR = {
+    pygame.JOYBUTTONDOWN: 'button',
+    pygame.JOYBUTTONUP: 'button',
+    pygame.JOYHATMOTION: 'value',
+    pygame.KEYDOWN: 'key',
+    pygame.KEYUP: 'key',
+    pygame.MOUSEBUTTONDOWN: 'button',
+    pygame.MOUSEBUTTONUP: 'button'
+}
+
+
+class Controller(object):
+    """
+    Maps the physical inputs to the Menu actions, for example, the keyboard key
+    ``KEY_APPLY`` or the joy button ``JOY_BUTTON_SELECT`` to ``ACTION_APPLY``.
+    Each input is defined by the event type and the event key; that is, the
+    ``event.key`` of keyboard events, the ``event.button`` of button events, the
+    ``event.value`` of joy hat events, or the ``(axis, direction)`` of joy axis
+    events, where the direction is ``-1`` or ``1`` if the axis value is outside
+    the deadzone.
+
+    Each Menu has its own controller, which is shared by all its widgets. The
+    default bindings are the control constants of this module at the moment the
+    controller is created.
+
+    .. code-block:: python
+
+        controller = menu.get_controller()
+        controller.bind(pygame_menu.controls.ACTION_APPLY, pygame.KEYDOWN, pygame.K_SPACE)
+        controller.unbind(pygame.KEYDOWN, pygame_menu.controls.KEY_APPLY)
+
+    :param joy_deadzone: Joy axis deadzone
+    """
+    _bindings: Dict[Tuple[int, Any], str]
+    _event_types: Optional[FrozenSet[int]]
+    _joy_deadzone: float
+
+    def __init__(self, joy_deadzone: float = JOY_DEADZONE) -> None:
+        assert isinstance(joy_deadzone, (int, float))
+        assert 0 <= joy_deadzone < 1, 'joy deadzone must be between 0 and 1'
+        self._bindings = {}
+        self._event_types = None
+        self._joy_deadzone = joy_deadzone
+        self.reset()
+
+    def reset(self) -> 'Controller':
+        """
+        Restore the default bindings.
+
+        :return: Self reference
+        """
+        self._bindings.clear()
+        for event_type, key, action in (
+                (pygame.KEYDOWN, KEY_APPLY, ACTION_APPLY),
+                (pygame.KEYDOWN, KEY_BACK, ACTION_BACK),
+                (pygame.KEYDOWN, KEY_CLOSE_MENU, ACTION_CLOSE_MENU),
+                (pygame.KEYDOWN, KEY_LEFT, ACTION_LEFT),
+                (pygame.KEYDOWN, KEY_MOVE_DOWN, ACTION_MOVE_DOWN),
+                (pygame.KEYDOWN, KEY_MOVE_UP, ACTION_MOVE_UP),
+                (pygame.KEYDOWN, KEY_RIGHT, ACTION_RIGHT),
+                (pygame.JOYBUTTONDOWN, JOY_BUTTON_BACK, ACTION_BACK),
+                (pygame.JOYBUTTONDOWN, JOY_BUTTON_SELECT, ACTION_APPLY),
+                (pygame.JOYHATMOTION, JOY_DOWN, ACTION_MOVE_UP),  # Consider the hat is "inverted"
+                (pygame.JOYHATMOTION, JOY_LEFT, ACTION_LEFT),
+                (pygame.JOYHATMOTION, JOY_RIGHT, ACTION_RIGHT),
+                (pygame.JOYHATMOTION, JOY_UP, ACTION_MOVE_DOWN),
+                (pygame.JOYAXISMOTION, (JOY_AXIS_X, -1), ACTION_LEFT),
+                (pygame.JOYAXISMOTION, (JOY_AXIS_X, 1), ACTION_RIGHT),
+                (pygame.JOYAXISMOTION, (JOY_AXIS_Y, -1), ACTION_MOVE_DOWN),
+                (pygame.JOYAXISMOTION, (JOY_AXIS_Y, 1), ACTION_MOVE_UP)
+        ):
+            self._bindings[event_type, key] = action
+        self._event_types = None
+        return self
+
+    def bind(self, action: str, event_type: int, key: Any) -> 'Controller':
+        """
+        Bind an input to an action. If the input was already bound, the previous
+        action is replaced.
+
+        :param action: Action, for example ``ACTION_APPLY``
+        :param event_type: Event type, for example ``pygame.KEYDOWN``
+        :param key: Event key, for example ``pygame.K_SPACE``
+        :return: Self reference
+        """
+        assert isinstance(action, str)
+        assert isinstance(event_type, int)
+        assert key is not None, 'key cannot be None'
+        self._bindings[event_type, key] = action
+        self._event_types = None
+        return self
+
+    def unbind(self, event_type: int, key: Any) -> 'Controller':
+        """
+        Remove the binding of an input.
+
+        :param event_type: Event type
+        :param key: Event key
+        :return: Self reference
+        """
+        self._bindings.pop((event_type, key), None)
+        self._event_types = None
+        return self
+
+    def get_bindings(self, action: str) -> List[Tuple[int, Any]]:
+        """
+        Return the inputs bound to an action.
+
+        :param action: Action
+        :return: List of inputs ``(event type, key)``
+        """
+        return [k for k in self._bindings.keys() if self._bindings[k] == action]
+
+    def get_event_types(self) -> FrozenSet[int]:
+        """
+        Return the event types of the bound inputs.
+
+        :return: Event types
+        """
+        if self._event_types is None:
+            self._event_types = frozenset(k[0] for k in self._bindings.keys())
+        return self._event_types
+
+    def get_key(self, event: EventType) -> Any:
+        """
+        Return the key of the event input.
+
+        :param event: Event
+        :return: Event key, ``None`` if the event does not have a key, or if the joy axis value is within the deadzone
+        """
+        if event.type == pygame.JOYAXISMOTION:
+            if event.value < -self._joy_deadzone:
+                return event.axis, -1
+            if event.value > self._joy_deadzone:
+                return event.axis, 1
+            return None
+        key_attr = _EVENT_KEY_ATTR.get(event.type)
+        if key_attr is None:
+            return None
+        return getattr(event, key_attr, None)
+
+    def get_action(self, event: EventType) -> Optional[str]:
+        """
+        Return the action bound to the event input.
+
+        :param event: Event
+        :return: Action, ``None`` if the input is not bound
+        """
+        key = self.get_key(event)
+        if key is None:
+            return None
+        return self._bindings.get((event.type, key))
+
+
+# Controller of the widgets which have not been added to a Menu
+_DEFAULT_CONTROLLER = Controller()
@@ -43,17 +43,21 @@ import pygame.gfxdraw as gfxdraw
 import pygame_menu.events as _events
 
 from pygame_menu._base import Base
+from pygame_menu.baseimage import BaseImage
 from pygame_menu._decorator import Decorator
 from pygame_menu._widgetmanager import WidgetManager
-from pygame_menu.controls import KEY_LEFT, KEY_RIGHT, KEY_MOVE_UP, KEY_MOVE_DOWN, KEY_BACK, KEY_CLOSE_MENU, \
-    JOY_LEFT, JOY_RIGHT, JOY_DEADZONE, JOY_UP, JOY_DOWN, JOY_AXIS_X, JOY_DELAY, JOY_AXIS_Y, JOY_REPEAT
+from pygame_menu.controls import Controller, ACTION_BACK, ACTION_CLOSE_MENU, ACTION_LEFT, ACTION_MOVE_DOWN, \
+    ACTION_MOVE_UP, ACTION_RIGHT, JOY_DELAY, JOY_REPEAT
 from pygame_menu.locals import ALIGN_CENTER, ALIGN_LEFT, ALIGN_RIGHT, ORIENTATION_HORIZONTAL, \
     ORIENTATION_VERTICAL, FINGERDOWN, FINGERUP, FINGERMOTION
 from pygame_menu.scrollarea import ScrollArea, get_scrollbars_from_position
 from pygame_menu.sound import Sound
 from pygame_menu.themes import Theme, THEME_DEFAULT
+from pygame_menu._timeline import Timeline
+from pygame_menu.tween import TweenScheduler
 from pygame_menu.utils import widget_terminal_title, TerminalColors, is_callable, assert_vector, make_surface, \
-    check_key_pressed_valid, mouse_motion_current_mouse_position, get_finger_pos
+    check_key_pressed_valid, mouse_motion_current_mouse_position, get_finger_pos, get_surface_pool, \
+    convert_surface, get_display_format, wait_events
 from pygame_menu.widgets import Frame, Widget, MenuBar
 from pygame_menu.widgets.core.widget import check_widget_mouseleave, WIDGET_MOUSEOVER
 
@@ -61,7 +65,11 @@ from pygame_menu.widgets.core.widget import check_widget_mouseleave, WIDGET_MOUS
 from pygame_menu._types import Callable, Any, Dict, NumberType, VectorType, Vector2NumberType, \
     Union, Tuple, List, Vector2IntType, Vector2BoolType, Tuple4Tuple2IntType, Tuple2IntType, \
     MenuColumnMaxWidthType, MenuColumnMinWidthType, MenuRowsType, Optional, Tuple2BoolType, \
-    NumberInstance, VectorInstance, EventType, EventVectorType, EventListType
+    NumberInstance, VectorInstance, EventType, EventVectorType, EventListType, ColorType, FrozenSet
+
+# Event handler of the dispatch table, it receives the event and the selected widget,
+# and returns True if the Menu has been updated
+EventHandlerType = Callable[[EventType, Optional[Widget]], bool]
 
 # Joy events
 JOY_EVENT_LEFT = 1
@@ -122,6 +130,7 @@ class Menu(Base):
     :param touchscreen: Enable/disable touch action inside the Menu. Only available on pygame 2
     :param touchscreen_motion_selection: Select widgets using touchscreen motion. If ``True`` menu draws a ``focus`` on the selected widget
     """
+    _action_handlers: Dict[str, EventHandlerType]
     _auto_centering: bool
     _background_function: Tuple[bool, Optional[Union[Callable[['Menu'], Any], Callable[[], Any]]]]
     _clock: 'pygame.time.Clock'
@@ -130,11 +139,14 @@ class Menu(Base):
     _column_pos_x: List[NumberType]
     _column_widths: List[NumberType]
     _columns: int
+    _controller: 'Controller'
     _current: 'Menu'
     _decorator: 'Decorator'
     _disable_draw: bool
     _disable_update: bool
+    _drawing_widgets_surface: bool
     _enabled: bool
+    _event_handlers: Dict[Tuple[int, Any], EventHandlerType]
     _height: int
     _index: int
     _joy_event: int
@@ -146,6 +158,7 @@ class Menu(Base):
     _max_row_column_elements: int
     _menubar: 'MenuBar'
     _mouse: bool
+    _mouse_motion_event: Optional[EventType]
     _mouse_motion_selection: bool
     _mouse_visible: bool
     _mouse_visible_default: bool
@@ -168,7 +181,9 @@ class Menu(Base):
     _stats: '_MenuStats'
     _submenus: List['Menu']
     _theme: 'Theme'
+    _timeline: 'Timeline'
     _top: 'Menu'
+    _tweens: 'TweenScheduler'
     _touchscreen: bool
     _touchscreen_motion_selection: bool
     _translate: Tuple2IntType
@@ -183,7 +198,8 @@ class Menu(Base):
     _widget_surface_cache_need_update: bool
     _widgets: List['Widget']
     _widgets_surface: Optional['pygame.Surface']
-    _widgets_surface_last: Tuple[int, int, Optional['pygame.Surface']]
+    _widgets_surface_color: ColorType
+    _widgets_surface_last: Tuple[int, int, Optional['pygame.Surface'], Any]
     _widgets_surface_need_update: bool
     _width: int
     _window_size: Tuple2IntType
@@ -394,6 +410,8 @@ class Menu(Base):
         self._stats = _MenuStats()
         self._submenus = []
         self._theme = theme
+        self._timeline = Timeline()  # Animation time, advanced on each update
+        self._tweens = TweenScheduler(self)
         self._width = int(width)
 
         # Set callbacks
@@ -442,9 +460,21 @@ class Menu(Base):
         self._widget_offset[1] = int(self._widget_offset[1])
 
         # Widget surface
+        self._drawing_widgets_surface = False  # True while the widgets are drawn within the widgets surface
         self._widgets_surface = None
         self._widgets_surface_need_update = False
-        self._widgets_surface_last = (0, 0, None)
+        self._widgets_surface_last = (0, 0, None, None)
+
+        # If the background is opaque the widgets surface is filled with the
+        # background color, thus, it is drawn without alpha blending
+        self._widgets_surface_color = (255, 255, 255, 0)
+        background_opaque = self._theme.background_opaque
+        if isinstance(self._theme.background_color, BaseImage):
+            background_opaque = False
+        elif background_opaque is None:
+            background_opaque = self._theme.background_color[3] == 255
+        if background_opaque:
+            self._widgets_surface_color = (*self._theme.background_color[0:3], 255)
 
         # Precache widgets surface draw
         self._widget_surface_cache_enabled = True
@@ -532,6 +562,19 @@ class Menu(Base):
         self._touchscreen = touchscreen
         self._touchscreen_motion_selection = touchscreen_motion_selection
 
+        # Init the event dispatch table
+        self._action_handlers = {
+            ACTION_BACK: self._event_back,
+            ACTION_CLOSE_MENU: self._event_close,
+            ACTION_LEFT: self._event_action_handler(self._left),
+            ACTION_MOVE_DOWN: self._event_action_handler(self._down),
+            ACTION_MOVE_UP: self._event_action_handler(self._up),
+            ACTION_RIGHT: self._event_action_handler(self._right)
+        }
+        self._controller = Controller()
+        self._event_handlers = self._get_default_event_handlers()
+        self._mouse_motion_event = None
+
         # Create menubar (title)
         self._menubar = MenuBar(
             back_box=theme.title_close_button,
@@ -582,6 +625,7 @@ class Menu(Base):
             area_height=self._height - menubar_height,
             area_width=self._width,
             extend_y=menubar_height,
+            kinetic=self._theme.scrollarea_kinetic,
             menubar=self._menubar,
             scrollbar_color=self._theme.scrollbar_color,
             scrollbar_cursor=self._theme.scrollbar_cursor,
@@ -1150,8 +1194,10 @@ class Menu(Base):
         for i in range(self._columns):
             self._widget_columns[i] = []
 
-        # Set the column widths (minimum values)
-        self._column_widths = [self._column_min_width[i] for i in range(self._columns)]
+        # Set the column widths (minimum values). The widths are stored after checking
+        # all widgets, thus, widgets that require the column width (like textinput) get
+        # the same value during the update, and do not render again on each update
+        column_widths = [self._column_min_width[i] for i in range(self._columns)]
 
         # Set column/row of each widget and compute maximum width of each column if None
         self._used_columns = 0
@@ -1230,10 +1276,11 @@ class Menu(Base):
             else:
                 continue
 
-            self._column_widths[col] = max(
-                self._column_widths[col],
+            column_widths[col] = max(
+                column_widths[col],
                 widget.get_width(apply_selection=True)
             )
+        self._column_widths = column_widths
 
         if len(invalid_selection_widgets) > 0:
             self._index = -1
@@ -1518,12 +1565,21 @@ class Menu(Base):
         width = int(width)
         height = int(height)
 
-        # Get the previous surface if the width/height is the same
-        if width == self._widgets_surface_last[0] and height == self._widgets_surface_last[1]:
+        # Get the previous surface if the width/height and the display format are the same
+        display_format = get_display_format()
+        if width == self._widgets_surface_last[0] and height == self._widgets_surface_last[1] and \
+                display_format == self._widgets_surface_last[3]:
             self._widgets_surface = self._widgets_surface_last[2]
         else:
-            self._widgets_surface = make_surface(width, height)
-            self._widgets_surface_last = (width, height, self._widgets_surface)
+            display = pygame.display.get_surface()
+            if display is not None and self._widgets_surface_color[3] == 255:
+                # Create the opaque surface within the display format, avoiding the conversion
+                self._widgets_surface = pygame.Surface((width, height), 0, display)
+                self._widgets_surface.fill(self._widgets_surface_color)
+            else:
+                self._widgets_surface = convert_surface(
+                    make_surface(width, height, fill_color=self._widgets_surface_color), rle=False)
+            self._widgets_surface_last = (width, height, self._widgets_surface, display_format)
 
         # Set position
         self._scrollarea.set_world(self._widgets_surface)
@@ -1797,6 +1853,10 @@ class Menu(Base):
         t0 = time.time()
         changed = False
 
+        # If the display format changed the widgets surface must be converted again
+        if self._widgets_surface is not None and self._widgets_surface_last[3] != get_display_format():
+            self._widgets_surface_need_update = True
+
         if self._widgets_surface_need_update:
             self._widgets_surface = None
 
@@ -1833,6 +1893,10 @@ class Menu(Base):
         if self._current._disable_draw:
             return self._current
 
+        # Store the surface pool counters, the difference is added to the stats
+        pool = get_surface_pool()
+        pool_counters = pool.allocated, pool.borrowed, pool.reused
+
         # Render menu
         render = self._current._render()  # If True, the surface widget has changed, thus cache should change if enabled
 
@@ -1856,50 +1920,93 @@ class Menu(Base):
         self._current._decorator.draw_prev(surface)
 
         # Draw widgets, update cache if enabled
-        if not self._current._widget_surface_cache_enabled or \
-                (render or self._current._widget_surface_cache_need_update):
+        self._current._draw_widgets_surface(render)
+        self._current._scrollarea.draw(surface)
+        self._current._draw_overlays(surface)
+        self._current._stats.draw += 1
+
+        # Update the surface allocation stats
+        self._current._stats.surface_allocated += pool.allocated - pool_counters[0]
+        self._current._stats.surface_borrowed += pool.borrowed - pool_counters[1]
+        self._current._stats.surface_reused += pool.reused - pool_counters[2]
+
+        # Update cursor if not mainloop
+        if self._current._mainloop:
+            check_widget_mouseleave()
+
+        return self._current
+
+    def _draw_widgets_surface(self, render: bool) -> bool:
+        """
+        Draw the widgets within the widgets surface if the cache is disabled or
+        the cache needs an update.
+
+        :param render: If ``True`` the Menu has been rendered
+        :return: ``True`` if the widgets surface has been drawn
+        """
+        if self._widget_surface_cache_enabled and not (render or self._widget_surface_cache_need_update):
+            return False
 
-            # This should be update before drawing widgets. As widget
-            # draw may trigger surface cache updating. Don't move this
-            # line or unexpected errors may occur
-            self._current._widget_surface_cache_need_update = False
+        # This should be update before drawing widgets. As widget
+        # draw may trigger surface cache updating. Don't move this
+        # line or unexpected errors may occur
+        self._widget_surface_cache_need_update = False
 
-            # Fill the scrolling surface (clear previous state)
-            self._current._widgets_surface.fill((255, 255, 255, 0))
+        # Fill the scrolling surface (clear previous state)
+        self._widgets_surface.fill(self._widgets_surface_color)
 
-            # Call scrollarea draw decorator. This must be done before filling the
-            # surface. ScrollArea post decorator is drawn on _scroll.draw(surface) call
-            scrollarea_decorator = self._current._scrollarea.get_decorator()
+        # Call scrollarea draw decorator. This must be done before filling the
+        # surface. ScrollArea post decorator is drawn on _scroll.draw(surface) call
+        scrollarea_decorator = self._scrollarea._decorator
+        if scrollarea_decorator is not None:
             scrollarea_decorator.force_cache_update()
-            scrollarea_decorator.draw_prev(self._current._widgets_surface)
+            scrollarea_decorator.draw_prev(self._widgets_surface)
 
-            # Iterate through widgets and draw them
-            selected_widget = None
-            for widget in self._current._widgets:
-                # Widgets within frames are not drawn as it's frame draw these widgets
-                if widget.get_frame() is not None:
-                    continue
-                if widget.is_selected():
-                    selected_widget = widget
-                widget.draw(self._current._widgets_surface)
-            if selected_widget is not None:
-                selected_widget.draw_after_if_selected(self._current._widgets_surface)
+        # Iterate through widgets and draw them. The overlays are drawn after the
+        # widgets surface, see _draw_overlays
+        self._drawing_widgets_surface = True
+        selected_widget = None
+        for widget in self._widgets:
+            # Widgets within frames are not drawn as it's frame draw these widgets
+            if widget.get_frame() is not None:
+                continue
+            if widget.is_selected():
+                selected_widget = widget
+            widget.draw(self._widgets_surface)
+        if selected_widget is not None:
+            selected_widget.draw_after_if_selected(self._widgets_surface)
+        self._drawing_widgets_surface = False
 
-            self._current._stats.draw_update_cached += 1
+        self._stats.draw_update_cached += 1
+        return True
 
-        self._current._scrollarea.draw(surface)
-        self._current._menubar.draw(surface)
+    def _draw_overlays(self, surface: 'pygame.Surface') -> None:
+        """
+        Draw the elements over the scrollarea: the overlay of the selected widget,
+        the menubar, the focus and the post decorator.
 
-        # Draw focus on selected if the widget is active
-        self._current._draw_focus_widget(surface, self._current.get_selected_widget())
-        self._current._decorator.draw_post(surface)
-        self._current._stats.draw += 1
+        :param surface: Pygame surface to draw the elements
+        :return: None
+        """
+        # Draw the overlay of the selected widget, it is not stored within the cache
+        selected_widget = self.get_selected_widget()
+        if selected_widget is not None:
+            selected_widget.draw_overlay(surface)
+        self._draw_front(surface, selected_widget)
 
-        # Update cursor if not mainloop
-        if self._current._mainloop:
-            check_widget_mouseleave()
+    def _draw_front(self, surface: 'pygame.Surface', selected_widget: Optional['Widget']) -> None:
+        """
+        Draw the menubar, the focus and the post decorator.
 
-        return self._current
+        :param surface: Pygame surface to draw the elements
+        :param selected_widget: Selected widget
+        :return: None
+        """
+        self._menubar.draw(surface)
+
+        # Draw focus on selected if the widget is active
+        self._draw_focus_widget(surface, selected_widget)
+        self._decorator.draw_post(surface)
 
     def _draw_focus_widget(
             self,
@@ -2168,6 +2275,503 @@ class Menu(Base):
             return self._current._move_selected_left_right(1)
         return False
 
+    @staticmethod
+    def _filter_events(
+            events: EventVectorType,
+            event_types: FrozenSet[int],
+            consumer_event_types: Optional[FrozenSet[int]]
+    ) -> EventVectorType:
+        """
+        Return the events of the types consumed by an object, in the same order.
+
+        :param events: Events
+        :param event_types: Types of the events
+        :param consumer_event_types: Event types consumed by the object. If ``None`` the object consumes all events
+        :return: Filtered events
+        """
+        if consumer_event_types is None or event_types <= consumer_event_types:
+            return events
+        if event_types.isdisjoint(consumer_event_types):
+            return []
+        return [event for event in events if event.type in consumer_event_types]
+
+    def _get_event_types(self) -> Optional[FrozenSet[int]]:
+        """
+        Return the event types consumed by the Menu within
+        :py:meth:`pygame_menu.menu.Menu.update`, that is, the types of the event
+        table, the controller, and the objects updated by the Menu.
+
+        :return: Event types. If ``None`` the Menu consumes all the events
+        """
+        event_types = {event_type for event_type, _ in self._event_handlers}
+        event_types.update(self._controller.get_event_types())
+        event_types.update((_events.PYGAME_QUIT, _events.PYGAME_WINDOWCLOSE))
+        scrollarea_event_types = self._scrollarea.get_event_types()
+        if scrollarea_event_types is None:
+            return None
+        event_types.update(scrollarea_event_types)
+        consumers = [self._menubar, self.get_selected_widget()]
+        consumers.extend(self._update_frames)
+        for consumer in consumers:
+            if consumer is None:
+                continue
+            consumer_event_types = consumer._get_update_event_types()
+            if consumer_event_types is None:
+                return None
+            event_types.update(consumer_event_types)
+        return frozenset(event_types)
+
+    def _get_idle_timeout(self) -> Optional[int]:
+        """
+        Return the time (ms) until the Menu must be updated and drawn again even if
+        it does not receive any event. Used by the mainloop in ``idle`` mode.
+
+        :return: Timeout (ms). If ``None`` the Menu only changes if it receives events
+        """
+        if self._scrollarea.is_kinetic_scrolling() or self._tweens.is_active():
+            return 0
+        for scrollable_frame in self._update_frames:
+            frame_scrollarea = scrollable_frame.get_scrollarea(inner=True)
+            if frame_scrollarea is not None and frame_scrollarea.is_kinetic_scrolling():
+                return 0
+        timeouts = [self._timeline.get_timeout()]
+        selected_widget = self.get_selected_widget()
+        if selected_widget is not None:
+            timeouts.append(selected_widget._get_idle_timeout())
+        timeouts = [timeout for timeout in timeouts if timeout is not None]
+        return min(timeouts) if len(timeouts) > 0 else None
+
+    def _need_draw(self, events: EventVectorType) -> bool:
+        """
+        Return ``True`` if the Menu surface is outdated, or if any of the events can
+        change the Menu. Used by the mainloop in ``idle`` mode.
+
+        :param events: Events of the last update
+        :return: ``True`` if the Menu must be drawn
+        """
+        if self._widgets_surface is None or self._widgets_surface_need_update or \
+                self._widget_surface_cache_need_update:
+            return True
+        if len(events) == 0:
+            return False
+        event_types = self._get_event_types()
+        return event_types is None or any(event.type in event_types for event in events)
+
+    def _get_default_event_handlers(self) -> Dict[Tuple[int, Any], EventHandlerType]:
+        """
+        Return the default event dispatch table of the Menu. Each entry is keyed by
+        the event type and the event key (see :py:meth:`pygame_menu.controls.Controller.get_key`),
+        or ``None`` if the handler receives all the events of such type. The inputs
+        bound to an action by the controller are dispatched to the action handlers.
+
+        :return: Event dispatch table
+        """
+        handlers: Dict[Tuple[int, Any], EventHandlerType] = {
+            (pygame.JOYAXISMOTION, None): self._event_joy_axis,
+            (self._joy_event_repeat, None): self._event_joy_repeat,
+            (pygame.ACTIVEEVENT, None): self._event_window_mouse,
+            (pygame.MOUSEMOTION, None): self._event_mouse_motion,
+            (FINGERDOWN, None): self._event_finger_down,
+            (FINGERMOTION, None): self._event_finger_motion,
+            (FINGERUP, None): self._event_finger_up
+        }
+        for button in (1, 2, 3):  # Don't consider the mouse wheel (button 4 & 5)
+            handlers[pygame.MOUSEBUTTONDOWN, button] = self._event_mouse_button_down
+            handlers[pygame.MOUSEBUTTONUP, button] = self._event_mouse_button_up
+        return handlers
+
+    def _event_action_handler(self, action: Callable[[bool], bool]) -> EventHandlerType:
+        """
+        Return an event handler which executes the given movement action.
+
+        :param action: Menu action, for example ``Menu._down``
+        :return: Event handler
+        """
+
+        def handler(event: EventType, selected_widget: Optional['Widget']) -> bool:
+            """
+            Action event handler.
+            """
+            if event.type == pygame.JOYAXISMOTION:  # The joy axis repeats the action
+                return self._event_joy_axis(event, selected_widget)
+            apply_sound = event.type not in (pygame.KEYDOWN, pygame.KEYUP)
+            return self._check_action_input(event) and bool(action(apply_sound))
+
+        return handler
+
+    def _check_action_input(self, event: EventType) -> bool:
+        """
+        Check the input device of the action event is enabled.
+
+        :param event: Action event
+        :return: ``True`` if the input is enabled
+        """
+        if event.type == pygame.KEYDOWN:
+            return self._keyboard and check_key_pressed_valid(event)
+        elif event.type == pygame.KEYUP:
+            return self._keyboard
+        elif event.type in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
+            return self._mouse
+        return self._joystick
+
+    def _event_back(self, event: EventType, _: Optional['Widget']) -> bool:
+        """
+        Go back to the previous Menu.
+
+        :param event: Action event
+        :return: ``True`` if the Menu has been updated
+        """
+        if self._check_action_input(event) and self._top._prev is not None:
+            self._sound.play_close_menu()
+            self._top.reset(1)
+        return False
+
+    def _event_close(self, event: EventType, _: Optional['Widget']) -> bool:
+        """
+        Close the Menu.
+
+        :param event: Action event
+        :return: ``True`` if the Menu has been updated
+        """
+        if not self._check_action_input(event):
+            return False
+        self._sound.play_close_menu()
+        return self._close()
+
+    def _event_joy_axis(self, event: EventType, _: Optional['Widget']) -> bool:
+        """
+        User moves the joy axis.
+
+        :param event: Joy axis event
+        :return: ``True`` if the Menu has been updated
+        """
+        if not self._joystick:
+            return False
+        prev = self._joy_event
+        self._joy_event = 0
+        action = self._controller.get_action(event)
+
+        if action == ACTION_MOVE_DOWN:  # Selects the previous widget, as Menu._down
+            self._joy_event |= JOY_EVENT_UP
+
+        elif action == ACTION_MOVE_UP:
+            self._joy_event |= JOY_EVENT_DOWN
+
+        elif action == ACTION_LEFT and self._used_columns > 1:
+            self._joy_event |= JOY_EVENT_LEFT
+
+        elif action == ACTION_RIGHT and self._used_columns > 1:
+            self._joy_event |= JOY_EVENT_RIGHT
+
+        if self._joy_event:
+            sel = self._handle_joy_event(True)
+            if self._joy_event == prev:
+                pygame.time.set_timer(self._joy_event_repeat, JOY_REPEAT)
+            else:
+                pygame.time.set_timer(self._joy_event_repeat, JOY_DELAY)
+            return bool(sel)
+        pygame.time.set_timer(self._joy_event_repeat, 0)
+        return False
+
+    def _event_joy_repeat(self, _: EventType, __: Optional['Widget']) -> bool:
+        """
+        User repeats the previous joy event input.
+
+        :return: ``True`` if the Menu has been updated
+        """
+        if self._joy_event:
+            sel = self._handle_joy_event(True)
+            pygame.time.set_timer(self._joy_event_repeat, JOY_REPEAT)
+            return bool(sel)
+        pygame.time.set_timer(self._joy_event_repeat, 0)
+        return False
+
+    def _event_mouse_button_down(self, event: EventType, selected_widget: Optional['Widget']) -> bool:
+        """
+        Select a widget by clicking.
+
+        :param event: Mouse button event
+        :param selected_widget: Selected widget
+        :return: ``True`` if the Menu has been updated
+        """
+        if not self._mouse:
+            return False
+
+        # If the mouse motion selection is disabled then select a widget by clicking
+        if not self._mouse_motion_selection:
+            sel = False
+            for index in range(len(self._widgets)):
+                widget = self._widgets[index]
+                if isinstance(widget, Frame):  # Frame does not accept click
+                    continue
+                if widget.is_selectable and widget.is_visible() and \
+                        widget.get_scrollarea().collide(widget, event):
+                    sel = self._select(index, 1, SELECT_MOUSE, True)
+            return sel
+
+        # If mouse motion selection, clicking will disable the active state
+        # only if the user clicked outside the widget
+        if selected_widget is not None and \
+                not selected_widget.get_scrollarea().collide(selected_widget.get_focus_rect(), event):
+            selected_widget.active = False
+            selected_widget.render()  # Some widgets need to be rendered
+            return True
+        return False
+
+    def _event_mouse_button_up(self, event: EventType, selected_widget: Optional['Widget']) -> bool:
+        """
+        Mouse events in selected widget.
+
+        :param event: Mouse button event
+        :param selected_widget: Selected widget
+        :return: ``True`` if the Menu has been updated
+        """
+        if not self._mouse or selected_widget is None:
+            return False
+        self._sound.play_click_mouse()
+        if selected_widget.get_scrollarea().collide(selected_widget, event):
+            return selected_widget.update([event])
+        return False
+
+    def _event_window_mouse(self, event: EventType, _: Optional['Widget']) -> bool:
+        """
+        Mouse enters or leaves the window.
+
+        :param event: Active event
+        :return: ``True`` if the Menu has been updated
+        """
+        if event.gain == 1:  # Enter
+            if self._onwindowmouseover is not None:
+                self._onwindowmouseover(self)
+                check_widget_mouseleave()
+        else:  # Leave
+            if self._onwindowmouseleave is not None:
+                self._onwindowmouseleave(self)
+            if self._mouseover:
+                self._mouseover = False
+                if self._onmouseleave is not None:
+                    self._onmouseleave(self, event)
+                check_widget_mouseleave(force=True)
+        return False
+
+    def _event_mouse_motion(self, event: EventType, selected_widget: Optional['Widget']) -> bool:
+        """
+        Mouse motion. It changes the cursor of the mouse if enabled.
+
+        :param event: Mouse motion event
+        :param selected_widget: Selected widget
+        :return: ``True`` if the Menu has been updated
+        """
+        if not self._mouse:
+            return False
+        self._top._mouse_motion_event = event
+
+        # Check if mouse over menu
+        if not self._mouseover:
+            if self.collide(event):
+                self._mouseover = True
+                if self._onmouseover is not None:
+                    self._onmouseover(self, event)
+        else:
+            if not self.collide(event):
+                self._mouseover = False
+                if self._onmouseleave is not None:
+                    self._onmouseleave(self, event)
+                self._top._mouse_motion_event = None
+                check_widget_mouseleave(force=True)
+
+        # If selected widget is active then motion should not select or change mouseover
+        # widget
+        if self._mouse_motion_selection and selected_widget is not None and selected_widget.active:
+            return False
+
+        # Check if "rel" exists within the event
+        if not hasattr(event, 'rel'):
+            return False
+
+        sel = False  # Widget has been selected
+        for index in range(len(self._widgets)):
+            widget = self._widgets[index]
+            if widget.is_visible() and widget.get_scrollarea().collide(widget, event):
+                if self._mouse_motion_selection and widget.is_selectable and \
+                        not isinstance(widget, Frame):
+                    sel = self._select(index, 1, SELECT_MOUSE, True)
+            # noinspection PyProtectedMember
+            widget._check_mouseover(event)
+        return sel
+
+    def _event_finger_down(self, event: EventType, selected_widget: Optional['Widget']) -> bool:
+        """
+        Touchscreen event.
+
+        :param event: Finger event
+        :param selected_widget: Selected widget
+        :return: ``True`` if the Menu has been updated
+        """
+        if not self._touchscreen:
+            return False
+
+        # If the touchscreen motion selection is disabled then select a widget by clicking
+        if not self._touchscreen_motion_selection:
+            sel = False
+            for index in range(len(self._widgets)):
+                widget = self._widgets[index]
+                if isinstance(widget, Frame):  # Frame does not accept touch
+                    continue
+                if widget.is_selectable and widget.is_visible() and \
+                        widget.get_scrollarea().collide(widget, event):
+                    sel = self._select(index, 1, SELECT_TOUCH, True)
+                    break
+            return sel
+
+        # If touchscreen motion selection, clicking will disable the active state
+        # only if the user clicked outside the widget
+        if selected_widget is not None and not selected_widget.get_scrollarea().collide(selected_widget, event):
+            selected_widget.active = False
+            selected_widget.render()  # Some widgets need to be rendered
+            return True
+        return False
+
+    def _event_finger_motion(self, event: EventType, selected_widget: Optional['Widget']) -> bool:
+        """
+        Select widgets by touchscreen motion, this is valid only if the current
+        selected widget is not active and the pointed widget is selectable.
+
+        :param event: Finger event
+        :param selected_widget: Selected widget
+        :return: ``True`` if the Menu has been updated
+        """
+        if not self._touchscreen_motion_selection:
+            return False
+
+        # If selected widget is active then motion should not select any widget
+        if selected_widget is not None and selected_widget.active:
+            return False
+
+        sel = False
+        for index in range(len(self._widgets)):
+            widget = self._widgets[index]
+            if isinstance(widget, Frame):  # Frame does not accept touch
+                continue
+            if widget.is_selectable and widget.is_visible() and \
+                    widget.get_scrollarea().collide(widget, event):
+                sel = self._select(index, 1, SELECT_TOUCH, True)
+                break
+        return sel
+
+    def _event_finger_up(self, event: EventType, selected_widget: Optional['Widget']) -> bool:
+        """
+        Touchscreen events in selected widget.
+
+        :param event: Finger event
+        :param selected_widget: Selected widget
+        :return: ``True`` if the Menu has been updated
+        """
+        if not self._touchscreen or selected_widget is None:
+            return False
+        self._sound.play_click_mouse()
+        if selected_widget.get_scrollarea().collide(selected_widget, event):
+            return selected_widget.update([event])
+        return False
+
+    def add_event_binding(
+            self,
+            event_type: int,
+            callback: Callable[[EventType, 'Menu'], Any],
+            key: Any = None
+    ) -> 'Menu':
+        """
+        Bind a callback to an event type. If ``key`` is provided, the callback only
+        receives the events with such key; that is, the ``event.key`` of keyboard
+        events, the ``event.button`` of mouse and joy button events, the ``event.value``
+        of joy hat events, or the ``(axis, direction)`` of joy axis events. The binding
+        replaces the default handler of the Menu, and the action bound to the key
+        by the Menu controller, if any. The callback receives the event and the Menu
+        reference:
+
+        .. code-block:: python
+
+            callback(event, Menu) -> bool
+
+        If the callback returns ``True`` the Menu is updated, and the remaining events
+        of the update call are not processed.
+
+        .. note::
+
+            Events are dispatched after the scrollable frames, the scrollarea, the
+            menubar and the selected widget have processed them.
+
+        .. note::
+
+            This is applied only to the base Menu (not the currently displayed,
+            stored in ``_current`` pointer); for such behaviour apply
+            to :py:meth:`pygame_menu.menu.Menu.get_current` object.
+
+        :param event_type: Event type, for example ``pygame.KEYDOWN``
+        :param callback: Callback
+        :param key: Event key. If ``None`` the callback receives all events of such type which are not bound to a key
+        :return: Self reference
+        """
+        assert isinstance(event_type, int)
+        assert is_callable(callback), 'callback must be callable (function-type)'
+
+        def handler(event: EventType, _: Optional['Widget']) -> bool:
+            """
+            Custom event handler.
+            """
+            return bool(callback(event, self))
+
+        self._event_handlers[event_type, key] = handler
+        return self
+
+    def remove_event_binding(self, event_type: int, key: Any = None) -> 'Menu':
+        """
+        Remove a callback bound to an event type, restoring the default handler of
+        the Menu, if any.
+
+        .. note::
+
+            This is applied only to the base Menu (not the currently displayed,
+            stored in ``_current`` pointer); for such behaviour apply
+            to :py:meth:`pygame_menu.menu.Menu.get_current` object.
+
+        :param event_type: Event type
+        :param key: Event key
+        :return: Self reference
+        """
+        default = self._get_default_event_handlers().get((event_type, key))
+        if default is not None:
+            self._event_handlers[event_type, key] = default
+        else:
+            self._event_handlers.pop((event_type, key), None)
+        return self
+
+    def get_controller(self) -> 'Controller':
+        """
+        Return the Menu controller, which maps the inputs to the Menu actions. The
+        controller is shared by all the widgets of the Menu.
+
+        :return: Controller
+        """
+        return self._controller
+
+    def set_controller(self, controller: 'Controller') -> 'Menu':
+        """
+        Set the Menu controller. The controller can be shared by several menus.
+
+        .. note::
+
+            This is applied only to the base Menu (not the currently displayed,
+            stored in ``_current`` pointer); for such behaviour apply
+            to :py:meth:`pygame_menu.menu.Menu.get_current` object.
+
+        :param controller: Controller
+        :return: Self reference
+        """
+        assert isinstance(controller, Controller)
+        self._controller = controller
+        return self
+
     def update(self, events: EventVectorType) -> bool:
         """
         Update the status of the Menu using external events.
@@ -2190,6 +2794,10 @@ class Menu(Base):
             return False
         self._current._stats.update += 1
 
+        # Advance the animation time, call the timers that are due, and apply the tweens
+        self._current._timeline.update()
+        self._current._tweens.update()
+
         # Call onupdate callback
         if self._current._onupdate is not None:
             self._current._onupdate(events, self._current)
@@ -2208,6 +2816,16 @@ class Menu(Base):
         # If any widget status changes, set the status as True
         updated = False
 
+        # Advance the kinetic scrolling. Scrolling does not change the widgets, thus,
+        # the surface cache is not updated. Frames are drawn within the widgets surface,
+        # then, scrolling a frame updates the cache
+        scrolled = self._current._scrollarea.update_kinetic()
+        for scrollable_frame in self._current._update_frames:
+            frame_scrollarea = scrollable_frame.get_scrollarea(inner=True)
+            if frame_scrollarea is not None and frame_scrollarea.update_kinetic():
+                self._current._widget_surface_cache_need_update = True
+                scrolled = True
+
         # Update mouse
         pygame.mouse.set_visible(self._current._mouse_visible)
         mouse_motion_event = None
@@ -2217,29 +2835,36 @@ class Menu(Base):
                                                 self._current._mouse_motion_selection or \
                                                 selected_widget is not None and selected_widget.active and \
                                                 selected_widget.force_menu_draw_focus
-        selected_widget_scrollarea = None if selected_widget is None else selected_widget.get_scrollarea()
+
+        # Event types within the frame, each object only receives the events of the
+        # types it consumes
+        event_types = frozenset(event.type for event in events)
 
         # First, check scrollable widgets (if any)
         scrollable_frames_update = False
         if not selected_widget_active_disable_scroll:
             for scrollable_frame in self._current._update_frames:
-                scrollable_frames_update = scrollable_frames_update or scrollable_frame.update(events)
+                scrollable_frames_update = scrollable_frames_update or scrollable_frame.update(
+                    self._filter_events(events, event_types, scrollable_frame._get_update_event_types()))
 
         # Scrollable frames have changed
         if scrollable_frames_update:
             updated = True
 
         # Update scroll bars
-        elif not selected_widget_active_disable_scroll and self._current._scrollarea.update(events):
+        elif not selected_widget_active_disable_scroll and self._current._scrollarea.update(
+                self._filter_events(events, event_types, self._current._scrollarea.get_event_types())):
             updated = True
 
         # Update the menubar, it may change the status of the widget because
         # of the button back/close
-        elif self._current._menubar.update(events):
+        elif self._current._menubar.update(
+                self._filter_events(events, event_types, self._current._menubar._get_update_event_types())):
             updated = True
 
         # Check selected widget
-        elif selected_widget is not None and selected_widget.update(events):
+        elif selected_widget is not None and selected_widget.update(
+                self._filter_events(events, event_types, selected_widget._get_update_event_types())):
             updated = True
 
         # Check others
@@ -2249,259 +2874,26 @@ class Menu(Base):
             if self._current._mouse and self._current._mouse_motion_selection:
                 events.append(mouse_motion_current_mouse_position())
 
+            # Dispatch the events through the event table of the current Menu. The
+            # current Menu is requested on each event, as a handler may change it
+            self._mouse_motion_event = None
             for event in events:
-
-                # User press key
-                if event.type == pygame.KEYDOWN and self._current._keyboard:
-
-                    # Check key event is valid
-                    if not check_key_pressed_valid(event):
-                        continue
-
-                    if event.key == KEY_MOVE_DOWN:
-                        if self._current._down():
-                            updated = True
-                            break
-
-                    elif event.key == KEY_MOVE_UP:
-                        if self._current._up():
-                            updated = True
-                            break
-
-                    elif event.key == KEY_LEFT:
-                        if self._current._left():
-                            updated = True
-                            break
-
-                    elif event.key == KEY_RIGHT:
-                        if self._current._right():
-                            updated = True
-                            break
-
-                    elif event.key == KEY_BACK and self._top._prev is not None:
-                        self._current._sound.play_close_menu()
-                        self.reset(1)  # public, do not use _current
-
-                    elif event.key == KEY_CLOSE_MENU:
-                        self._current._sound.play_close_menu()
-                        if self._current._close():
-                            updated = True
-
-                # User moves hat joystick
-                elif event.type == pygame.JOYHATMOTION and self._current._joystick:
-                    if event.value == JOY_UP:
-                        if self._current._down(apply_sound=True):
-                            updated = True
-                            break
-
-                    elif event.value == JOY_DOWN:
-                        if self._current._up(apply_sound=True):
-                            updated = True
-                            break
-
-                    elif event.value == JOY_LEFT:
-                        if self._current._left(apply_sound=True):
-                            updated = True
-                            break
-
-                    elif event.value == JOY_RIGHT:
-                        if self._current._right(apply_sound=True):
-                            updated = True
-                            break
-
-                # User moves joy axis motion
-                elif event.type == pygame.JOYAXISMOTION and self._current._joystick:
-                    prev = self._current._joy_event
-                    self._current._joy_event = 0
-
-                    if event.axis == JOY_AXIS_Y and event.value < -JOY_DEADZONE:
-                        self._current._joy_event |= JOY_EVENT_UP
-
-                    elif event.axis == JOY_AXIS_Y and event.value > JOY_DEADZONE:
-                        self._current._joy_event |= JOY_EVENT_DOWN
-
-                    elif event.axis == JOY_AXIS_X and event.value < -JOY_DEADZONE and \
-                            self._current._used_columns > 1:
-                        self._current._joy_event |= JOY_EVENT_LEFT
-
-                    elif event.axis == JOY_AXIS_X and event.value > JOY_DEADZONE and \
-                            self._current._used_columns > 1:
-                        self._current._joy_event |= JOY_EVENT_RIGHT
-
-                    if self._current._joy_event:
-                        sel = self._current._handle_joy_event(True)
-                        if self._current._joy_event == prev:
-                            pygame.time.set_timer(self._current._joy_event_repeat, JOY_REPEAT)
-                        else:
-                            pygame.time.set_timer(self._current._joy_event_repeat, JOY_DELAY)
-                        if sel:
-                            updated = True
-                            break
-                    else:
-                        pygame.time.set_timer(self._current._joy_event_repeat, 0)
-
-                # User repeats previous joy event input
-                elif event.type == self._current._joy_event_repeat:
-                    if self._current._joy_event:
-                        sel = self._current._handle_joy_event(True)
-                        pygame.time.set_timer(self._current._joy_event_repeat, JOY_REPEAT)
-                        if sel:
-                            updated = True
-                            break
-                    else:
-                        pygame.time.set_timer(self._current._joy_event_repeat, 0)
-
-                # Select widget by clicking
-                elif event.type == pygame.MOUSEBUTTONDOWN and self._current._mouse and \
-                        event.button in (1, 2, 3):  # Don't consider the mouse wheel (button 4 & 5)
-
-                    # If the mouse motion selection is disabled then select a widget by clicking
-                    if not self._current._mouse_motion_selection:
-                        sel = False
-                        for index in range(len(self._current._widgets)):
-                            widget = self._current._widgets[index]
-                            if isinstance(widget, Frame):  # Frame does not accept click
-                                continue
-                            if widget.is_selectable and widget.is_visible() and \
-                                    widget.get_scrollarea().collide(widget, event):
-                                sel = self._current._select(index, 1, SELECT_MOUSE, True)
-
-                        if sel:
-                            updated = True
-                            break
-
-                    # If mouse motion selection, clicking will disable the active state
-                    # only if the user clicked outside the widget
-                    else:
-                        if selected_widget is not None:
-                            if not selected_widget_scrollarea.collide(selected_widget.get_focus_rect(), event):
-                                selected_widget.active = False
-                                selected_widget.render()  # Some widgets need to be rendered
-                                updated = True
-                                break
-
-                # Mouse enters or leaves the window
-                elif event.type == pygame.ACTIVEEVENT:
-                    if event.gain == 1:  # Enter
-                        if self._current._onwindowmouseover is not None:
-                            self._current._onwindowmouseover(self._current)
-                            check_widget_mouseleave()
-                    else:  # Leave
-                        if self._current._onwindowmouseleave is not None:
-                            self._current._onwindowmouseleave(self._current)
-                        if self._current._mouseover:
-                            self._current._mouseover = False
-                            if self._current._onmouseleave is not None:
-                                self._current._onmouseleave(self._current, event)
-                            check_widget_mouseleave(force=True)
-
-                # Mouse motion. It changes the cursor of the mouse if enabled
-                elif event.type == pygame.MOUSEMOTION and self._current._mouse:
-                    mouse_motion_event = event
-
-                    # Check if mouse over menu
-                    if not self._current._mouseover:
-                        if self._current.collide(event):
-                            self._current._mouseover = True
-                            if self._current._onmouseover is not None:
-                                self._current._onmouseover(self._current, event)
-                    else:
-                        if not self._current.collide(event):
-                            self._current._mouseover = False
-                            if self._current._onmouseleave is not None:
-                                self._current._onmouseleave(self._current, event)
-                            mouse_motion_event = None
-                            check_widget_mouseleave(force=True)
-
-                    # If selected widget is active then motion should not select or change mouseover
-                    # widget
-                    if self._current._mouse_motion_selection and selected_widget is not None and selected_widget.active:
-                        continue
-
-                    # Check if "rel" exists within the event
-                    if not hasattr(event, 'rel'):
-                        continue
-
-                    sel = False  # Widget has been selected
-                    for index in range(len(self._current._widgets)):
-                        widget = self._current._widgets[index]
-                        if widget.is_visible() and widget.get_scrollarea().collide(widget, event):
-                            if self._current._mouse_motion_selection and widget.is_selectable and \
-                                    not isinstance(widget, Frame):
-                                sel = self._current._select(index, 1, SELECT_MOUSE, True)
-                        # noinspection PyProtectedMember
-                        widget._check_mouseover(event)
-                    if sel:
-                        updated = True
-                        break
-
-                # Mouse events in selected widget
-                elif event.type == pygame.MOUSEBUTTONUP and self._current._mouse and selected_widget is not None and \
-                        event.button in (1, 2, 3):  # Don't consider the mouse wheel (button 4 & 5)
-                    self._current._sound.play_click_mouse()
-                    if selected_widget_scrollarea.collide(selected_widget, event):
-                        updated = selected_widget.update([event])
-                        if updated:
-                            break
-
-                # Touchscreen event:
-                elif event.type == FINGERDOWN and self._current._touchscreen:
-
-                    # If the touchscreen motion selection is disabled then select a widget by clicking
-                    if not self._current._touchscreen_motion_selection:
-                        sel = False
-                        for index in range(len(self._current._widgets)):
-                            widget = self._current._widgets[index]
-                            if isinstance(widget, Frame):  # Frame does not accept touch
-                                continue
-                            if widget.is_selectable and widget.is_visible() and \
-                                    widget.get_scrollarea().collide(widget, event):
-                                sel = self._current._select(index, 1, SELECT_TOUCH, True)
-                                if not isinstance(widget, Frame):
-                                    break
-                        if sel:
-                            updated = True
-                            break
-
-                    # If touchscreen motion selection, clicking will disable the active state
-                    # only if the user clicked outside the widget
-                    else:
-                        if selected_widget is not None:
-                            if not selected_widget_scrollarea.collide(selected_widget, event):
-                                selected_widget.active = False
-                                selected_widget.render()  # Some widgets need to be rendered
-                                updated = True
-                                break
-
-                # Select widgets by touchscreen motion, this is valid only if the current selected widget
-                # is not active and the pointed widget is selectable
-                elif event.type == FINGERMOTION and self._current._touchscreen_motion_selection:
-
-                    # If selected widget is active then motion should not select any widget
-                    if selected_widget is not None and selected_widget.active:
-                        continue
-
-                    sel = False
-                    for index in range(len(self._current._widgets)):
-                        widget = self._current._widgets[index]
-                        if isinstance(widget, Frame):  # Frame does not accept touch
-                            continue
-                        if widget.is_selectable and widget.is_visible() and \
-                                widget.get_scrollarea().collide(widget, event):
-                            sel = self._current._select(index, 1, SELECT_TOUCH, True)
-                            if not isinstance(widget, Frame):
-                                break
-                    if sel:
-                        updated = True
-                        break
-
-                # Touchscreen events in selected widget
-                elif event.type == FINGERUP and self._current._touchscreen and selected_widget is not None:
-                    self._current._sound.play_click_mouse()
-                    if selected_widget_scrollarea.collide(selected_widget, event):
-                        updated = selected_widget.update([event])
-                        if updated:
-                            break
+                current = self._current
+                key = current._controller.get_key(event)
+                handler = None
+                if key is not None:
+                    handler = current._event_handlers.get((event.type, key))
+                    if handler is None:
+                        action = current._controller.get_action(event)
+                        if action is not None:
+                            handler = current._action_handlers.get(action)
+                if handler is None:
+                    handler = current._event_handlers.get((event.type, None))
+                if handler is not None and handler(event, selected_widget):
+                    updated = True
+                    break
+            mouse_motion_event = self._mouse_motion_event
+            self._mouse_motion_event = None
 
         if mouse_motion_event is not None:
             check_widget_mouseleave(event=mouse_motion_event)
@@ -2514,7 +2906,7 @@ class Menu(Base):
         if not self.is_enabled():
             updated = True
 
-        return updated
+        return updated or scrolled
 
     def collide(self, event: EventType) -> bool:
         """
@@ -2561,6 +2953,15 @@ class Menu(Base):
             - ``clear_surface``     *(bool)* - If ``True`` surface is cleared using ``theme.surface_clear_color``
             - ``disable_loop``      *(bool)* - If ``True`` the mainloop only runs once. Use for running draw and update in a single call
             - ``fps_limit``         *(int)* - Maximum FPS of the loop. Default equals to ``theme.fps``. If ``0`` there's no limit
+            - ``idle``              *(bool)* - If ``True`` the loop sleeps until an event arrives or a widget must be animated (for example, the cursor of a TextInput), and the Menu is drawn and flipped only if it may have changed. Default ``False``
+
+        .. note::
+
+            In ``idle`` mode the ``bgfun`` is only called when the Menu is drawn, thus,
+            background animations do not run while the Menu is idle. If the Menu or
+            its widgets are modified outside the Menu events (for example, within a
+            timer), call :py:meth:`pygame_menu.menu.Menu.force_surface_update` to draw
+            the changes.
 
         .. warning::
 
@@ -2576,10 +2977,12 @@ class Menu(Base):
         clear_surface = kwargs.get('clear_surface', True)
         disable_loop = kwargs.get('disable_loop', False)
         fps_limit = kwargs.get('fps_limit', self._theme.fps)
+        idle = kwargs.get('idle', False)
 
         assert isinstance(clear_surface, bool)
         assert isinstance(disable_loop, bool)
         assert isinstance(fps_limit, NumberInstance)
+        assert isinstance(idle, bool)
         assert isinstance(surface, pygame.Surface)
 
         assert fps_limit >= 0, 'fps limit cannot be negative'
@@ -2608,18 +3011,33 @@ class Menu(Base):
         self._current._widgets_surface = None
 
         # Start loop
+        first_frame = True
         while True:
             self._current._stats.loop += 1
             self._current._clock.tick(fps_limit)
 
-            # Draw the menu
-            self.draw(surface=surface, clear_surface=clear_surface)
+            if idle:
+                # Sleep until an event arrives, or the Menu has to be animated
+                timeout = 0 if first_frame else self._current._get_idle_timeout()
+                events = wait_events(timeout)
+                timed_out = timeout is not None and len(events) == 0
 
-            # Gather events by Menu
-            self.update(pygame.event.get())
+                # Update the Menu, then, draw only if anything may have changed
+                updated = self.update(events)
+                if self.is_enabled() and (first_frame or updated or timed_out or self._current._need_draw(events)):
+                    self.draw(surface=surface, clear_surface=clear_surface)
+                    pygame.display.flip()
+                first_frame = False
+
+            else:
+                # Draw the menu
+                self.draw(surface=surface, clear_surface=clear_surface)
 
-            # Flip contents to screen
-            pygame.display.flip()
+                # Gather events by Menu
+                self.update(pygame.event.get())
+
+                # Flip contents to screen
+                pygame.display.flip()
 
             # Menu closed or disabled
             if not self.is_enabled() or disable_loop:
@@ -2809,10 +3227,12 @@ class Menu(Base):
         """
         current = self
 
-        # Update pointers
+        # Update pointers, the animations of the previous Menu are paused
         menu._top = self._top
+        self._top._current._timeline.pause()
         self._top._current = menu._current
         self._top._prev = [self._top._prev, current]
+        self._top._current._timeline.resume()
 
         # Call event
         if menu._onbeforeopen is not None:
@@ -2842,6 +3262,7 @@ class Menu(Base):
         assert total > 0, 'total must be greater than zero'
 
         i = 0
+        self._top._current._timeline.pause()
         if self._top._prev is not None:
             while True:
                 if self._top._prev is not None:
@@ -2853,6 +3274,7 @@ class Menu(Base):
                         break
                 else:
                     break
+        self._top._current._timeline.resume()
 
         # Execute onreset callback
         if self._current._onreset is not None:
@@ -3190,6 +3612,27 @@ class Menu(Base):
         """
         return self._theme
 
+    def get_tweens(self) -> 'TweenScheduler':
+        """
+        Return the tween scheduler of the Menu, which animates the widget properties.
+        The tweens advance each time the Menu is updated, see :py:class:`pygame_menu.tween.TweenScheduler`.
+
+        .. code-block:: python
+
+            from pygame_menu.tween import TWEEN_ALPHA
+
+            menu.get_tweens().add(button, TWEEN_ALPHA, 0, 500)
+
+        .. note::
+
+            This is applied only to the base Menu (not the currently displayed,
+            stored in ``_current`` pointer); for such behaviour apply
+            to :py:meth:`pygame_menu.menu.Menu.get_current` object.
+
+        :return: Tween scheduler
+        """
+        return self._tweens
+
     def get_clock(self) -> 'pygame.time.Clock':
         """
         Return the pygame Menu timer.
@@ -3621,6 +4064,11 @@ class _MenuStats(object):
         self.total_building_time = 0
         self.total_rendering_time = 0
 
+        # Surface pool, counted while drawing
+        self.surface_allocated = 0
+        self.surface_borrowed = 0
+        self.surface_reused = 0
+
         # Other
         self.clear = 0
         self.draw = 0
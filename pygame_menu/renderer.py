@@ -0,0 +1,418 @@
+"""
+pygame-menu
+https://github.com/ppizarror/pygame-menu
+
+RENDERER
+Draws the Menu using the hardware accelerated SDL2 renderer.
+
+License:
+-------------------------------------------------------------------------------
+The MIT License (MIT)
+Copyright 2017-2021 Pablo Pizarro R. @ppizarror
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the Software
+is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+-------------------------------------------------------------------------------
+"""
+
+__all__ = [
+
+    # Main class
+    'MenuRenderer',
+
+    # Constants
+    'SDL2_AVAILABLE'
+
+]
+
+import pygame
+import pygame_menu
+
+from pygame_menu._decorator import Decorator, DECOR_TYPE_PREV, DECOR_TYPE_POST, DECORATION_CALLABLE, \
+    DECORATION_CALLABLE_NO_ARGS
+from pygame_menu.locals import ORIENTATION_HORIZONTAL
+from pygame_menu.utils import make_surface
+from pygame_menu.widgets.core.widget import Widget
+
+from pygame_menu._types import Optional, Tuple, Any, List, Dict
+
+try:
+    # noinspection PyProtectedMember
+    from pygame._sdl2.video import Renderer, Texture
+    SDL2_AVAILABLE = True
+except (ModuleNotFoundError, ImportError):
+    Renderer, Texture = None, None
+    SDL2_AVAILABLE = False
+
+BLENDMODE_BLEND = getattr(pygame, 'BLENDMODE_BLEND', 1)
+
+# Larger surfaces are split into tiles, as the renderers limit the texture size
+# (for example, to 8192 or 16384 px)
+TEXTURE_TILE_SIZE = 4096
+
+
+class MenuRenderer(object):
+    """
+    Draws the Menu using a ``pygame._sdl2.video.Renderer``. The Menu is composed
+    from the following textures:
+
+    1. Back: Menu ``prev`` decorator and the ScrollArea background
+    2. World: The widgets surface, updated only if the widgets are drawn again. The surface is split into tiles of ``TEXTURE_TILE_SIZE`` px
+    3. Overlay: The overlay of the selected widget (for example, the text input cursor)
+    4. Scrollbars: Each scrollbar has its own texture, with the size of the scrollbar
+    5. Front: ScrollArea ``post`` decorator, menubar, focus and Menu ``post`` decorator
+
+    Scrolling the Menu only changes the source rect of the world textures, thus,
+    scrolling only uploads the scrollbars. The back texture is updated only if
+    the background changes, or if the Menu has ``prev`` decorations. The front
+    texture is updated only if the menubar, the focus or the ``post`` decorators
+    change, or on each frame if the ``post`` decorators have callable decorations.
+    The overlay texture has the size of the visible rect of the selected widget,
+    and it is drawn and uploaded only if the overlay status of the widget changes.
+
+    .. code-block:: python
+
+        window = pygame._sdl2.video.Window('Menu', size=(600, 400))
+        renderer = pygame_menu.renderer.MenuRenderer(pygame._sdl2.video.Renderer(window))
+        ...
+        while True:
+            menu.update(pygame.event.get())
+            renderer.get_renderer().clear()
+            renderer.draw(menu)
+            renderer.get_renderer().present()
+
+    .. note::
+
+        The background function of the Menu mainloop is not called by the renderer.
+
+    :param renderer: SDL2 renderer
+    """
+    _back: Optional['Texture']
+    _back_key: Optional[Tuple[Any, ...]]
+    _back_surface: Optional['pygame.Surface']
+    _front: Optional['Texture']
+    _front_key: Optional[Tuple[Any, ...]]
+    _front_surface: Optional['pygame.Surface']
+    _overlay: Optional['Texture']
+    _overlay_key: Optional[Tuple[Any, ...]]
+    _overlay_surface: Optional['pygame.Surface']
+    _renderer: 'Renderer'
+    _scrollbar_surface: Optional['pygame.Surface']
+    _scrollbars: Dict['pygame_menu.widgets.ScrollBar', Tuple['Texture', Optional[Tuple[Any, ...]]]]
+    _world: List[Tuple['Texture', 'pygame.Rect']]
+    _world_key: Optional[Tuple[Any, ...]]
+    back_updates: int
+    front_updates: int
+    overlay_updates: int
+    scrollbar_updates: int
+    world_updates: int
+
+    def __init__(self, renderer: 'Renderer') -> None:
+        assert SDL2_AVAILABLE, 'pygame._sdl2 is not available, pygame 2 is required'
+        assert isinstance(renderer, Renderer)
+        self._back = None
+        self._back_key = None
+        self._back_surface = None
+        self._front = None
+        self._front_key = None
+        self._front_surface = None
+        self._overlay = None
+        self._overlay_key = None
+        self._overlay_surface = None
+        self._renderer = renderer
+        self._scrollbar_surface = None
+        self._scrollbars = {}
+        self._world = []
+        self._world_key = None
+
+        # Texture upload counters
+        self.back_updates = 0
+        self.front_updates = 0
+        self.overlay_updates = 0
+        self.scrollbar_updates = 0
+        self.world_updates = 0
+
+    def get_renderer(self) -> 'Renderer':
+        """
+        Return the SDL2 renderer.
+
+        :return: Renderer
+        """
+        return self._renderer
+
+    def _layer(self, texture: Optional['Texture'], surface: Optional['pygame.Surface'],
+               size: Tuple[int, int]) -> Tuple['Texture', 'pygame.Surface']:
+        """
+        Return the texture and the surface of a layer with the given size. The
+        layer is created again only if the size changes.
+
+        :param texture: Layer texture
+        :param surface: Layer surface
+        :param size: Layer size
+        :return: Texture and surface
+        """
+        if surface is None or surface.get_size() != size:
+            surface = make_surface(size[0], size[1], alpha=True)
+            texture = Texture(self._renderer, size, streaming=True)
+            texture.blend_mode = BLENDMODE_BLEND
+        return texture, surface
+
+    @staticmethod
+    def _decorator_key(decorator: Optional['Decorator'], prev: bool) -> Optional[Tuple[Any, ...]]:
+        """
+        Return the key of the decorations drawn by a decorator.
+
+        :param decorator: Decorator
+        :param prev: If ``True`` the key also considers the ``prev`` decorations
+        :return: Key of the decorations, ``None`` if the decorator has callable decorations, which may change on each frame
+        """
+        if decorator is None:
+            return ()
+        decor = decorator._decor[DECOR_TYPE_POST]
+        if prev:
+            decor = decorator._decor[DECOR_TYPE_PREV] + decor
+        if len(decor) == 0:
+            return ()
+        key = [tuple(decorator._obj.get_rect())]
+        for dtype, decoid, _ in decor:
+            enabled = decorator._decor_enabled[decoid]
+            if enabled and dtype in (DECORATION_CALLABLE, DECORATION_CALLABLE_NO_ARGS):
+                return None
+            key.append((decoid, enabled))
+        return tuple(key)
+
+    def _widget_key(self, widget: 'Widget') -> Optional[Tuple[Any, ...]]:
+        """
+        Return the key of the widget status drawn within the front layer. The
+        widget is rendered before, as the render updates its hash.
+
+        :param widget: Widget
+        :return: Widget key, ``None`` if the widget may change on each frame
+        """
+        widget._render()
+        decorator_key = self._decorator_key(widget._decorator, True)
+        if decorator_key is None:
+            return None
+        return (widget, widget._last_render_hash, tuple(widget._rect), widget._visible, widget._selected,
+                widget._alpha, decorator_key)
+
+    def _get_front_key(self, menu: 'pygame_menu.Menu', size: Tuple[int, int],
+                       selected_widget: Optional['Widget']) -> Optional[Tuple[Any, ...]]:
+        """
+        Return the key of the front layer, that is, the menubar, the focus and
+        the ``post`` decorators.
+
+        :param menu: Menu
+        :param size: Layer size
+        :param selected_widget: Selected widget
+        :return: Front key, ``None`` if the front layer may change on each frame
+        """
+        scrollarea = menu._scrollarea
+        menubar = menu._menubar
+        keys = [self._widget_key(menubar), self._decorator_key(scrollarea._decorator, False),
+                self._decorator_key(menu._decorator, False)]
+        if any(k is None for k in keys):
+            return None
+        keys += [(menu, size), menubar._backbox_visible(), menubar._background_color]
+        if selected_widget is not None and selected_widget.active:
+            keys.append((selected_widget, tuple(selected_widget.get_focus_rect()), menu._window_size))
+        return tuple(keys)
+
+    def _update_overlay(self, widget: Optional['Widget']) -> Optional['pygame.Rect']:
+        """
+        Draw the overlay of the selected widget within the overlay layer, which
+        has the size of the visible rect of the widget. The overlay is drawn and
+        uploaded only if the overlay key of the widget changes.
+
+        :param widget: Selected widget
+        :return: Rect of the overlay within the renderer, ``None`` if the widget does not have an overlay
+        """
+        if widget is None or widget._scrollarea is None or not widget.is_visible() or \
+                type(widget)._draw_overlay is Widget._draw_overlay:
+            return None
+        rect = widget.get_rect(to_real_position=True).clip(widget._scrollarea.get_absolute_view_rect())
+        if rect.width == 0 or rect.height == 0:
+            return None
+        offset = widget._scrollarea.to_real_position((0, 0))
+        widget_key = widget._get_overlay_key()
+        overlay_key = (widget, tuple(rect), offset, widget_key)
+        if widget_key is None or overlay_key != self._overlay_key:
+            self._overlay, self._overlay_surface = self._layer(self._overlay, self._overlay_surface, rect.size)
+            self._overlay_surface.fill((0, 0, 0, 0))
+            widget._draw_overlay(self._overlay_surface, (offset[0] - rect.x, offset[1] - rect.y))
+            self._overlay.update(self._overlay_surface)
+            self._overlay_key = overlay_key
+            self.overlay_updates += 1
+        return rect
+
+    def _update_scrollbars(self, scrollarea: 'pygame_menu.scrollarea.ScrollArea',
+                           size: Tuple[int, int]) -> List[Tuple['Texture', 'pygame.Rect']]:
+        """
+        Draw each visible scrollbar within its own texture, which is uploaded only
+        if the scrollbar changes (for example, if the slider moves).
+
+        :param scrollarea: ScrollArea
+        :param size: Renderer size
+        :return: List of the scrollbar textures and their rect within the renderer
+        """
+        scrollbars = {}
+        draw = []
+        for sbar in scrollarea._scrollbars:
+            if not sbar.is_visible():
+                continue
+            if sbar.get_orientation() == ORIENTATION_HORIZONTAL:
+                if not scrollarea.get_hidden_width():
+                    continue
+            elif not scrollarea.get_hidden_height():
+                continue
+            rect = sbar.get_rect().clip(pygame.Rect((0, 0), size))
+            if rect.width == 0 or rect.height == 0:
+                continue
+            texture, last_key = self._scrollbars.get(sbar, (None, None))
+            key = self._widget_key(sbar)
+            if key is not None:
+                key = (key, tuple(rect), tuple(sbar._slider_rect))
+            if key is None or key != last_key:
+                # Scrollbars are drawn at their position, thus, the rect of the
+                # scrollbar is copied from a surface with the size of the renderer
+                if self._scrollbar_surface is None or self._scrollbar_surface.get_size() != size:
+                    self._scrollbar_surface = make_surface(size[0], size[1], alpha=True)
+                self._scrollbar_surface.fill((0, 0, 0, 0), rect)
+                sbar.draw(self._scrollbar_surface)
+                if texture is None or (texture.width, texture.height) != rect.size:
+                    texture = Texture(self._renderer, rect.size, streaming=True)
+                    texture.blend_mode = BLENDMODE_BLEND
+                texture.update(self._scrollbar_surface.subsurface(rect))
+                self.scrollbar_updates += 1
+            scrollbars[sbar] = (texture, key)
+            draw.append((texture, rect))
+        self._scrollbars = scrollbars
+        return draw
+
+    def _update_world(self, menu: 'pygame_menu.Menu') -> None:
+        """
+        Upload the widgets surface to the world textures if the widgets have been
+        drawn since the last upload. The surface is split into tiles, as it can
+        exceed the maximum texture size of the renderer.
+
+        :param menu: Menu
+        :return: None
+        """
+        surface = menu._widgets_surface
+        world_key = (menu, surface, menu._stats.draw_update_cached)
+        if world_key == self._world_key:
+            return
+        if self._world_key is None or surface is not self._world_key[1]:
+            self._world = []
+            width, height = surface.get_size()
+            for y in range(0, height, TEXTURE_TILE_SIZE):
+                for x in range(0, width, TEXTURE_TILE_SIZE):
+                    rect = pygame.Rect(x, y, min(TEXTURE_TILE_SIZE, width - x), min(TEXTURE_TILE_SIZE, height - y))
+                    texture = Texture.from_surface(self._renderer, surface.subsurface(rect))
+                    if surface.get_flags() & pygame.SRCALPHA:
+                        texture.blend_mode = BLENDMODE_BLEND
+                    self._world.append((texture, rect))
+        else:
+            for texture, rect in self._world:
+                texture.update(surface.subsurface(rect))
+        self._world_key = world_key
+        self.world_updates += 1
+
+    def _draw_world(self, scrollarea: 'pygame_menu.scrollarea.ScrollArea') -> None:
+        """
+        Draw the world tiles within the view rect of the scrollarea.
+
+        :param scrollarea: ScrollArea
+        :return: None
+        """
+        view_rect = scrollarea._view_rect
+        src = pygame.Rect(scrollarea._get_world_offsets(), view_rect.size)
+        for texture, rect in self._world:
+            clip = src.clip(rect)
+            if clip.width == 0 or clip.height == 0:
+                continue
+            texture.draw(srcrect=clip.move(-rect.x, -rect.y),
+                         dstrect=clip.move(view_rect.x - src.x, view_rect.y - src.y))
+
+    def draw(self, menu: 'pygame_menu.Menu') -> 'MenuRenderer':
+        """
+        Draw the **current** Menu into the renderer. The renderer is not cleared
+        or presented.
+
+        :param menu: Menu to draw
+        :return: Self reference
+        """
+        assert isinstance(menu, pygame_menu.Menu)
+        if not menu.is_enabled():
+            menu._current._runtime_errors.throw(menu._current._runtime_errors.draw, 'menu is not enabled')
+            return self
+        current = menu._current
+        if current._disable_draw:
+            return self
+        scrollarea = current._scrollarea
+        size = self._renderer.get_viewport().size
+
+        # Render the menu and draw the widgets surface if it has changed
+        current._draw_widgets_surface(current._render())
+        if not scrollarea._world:
+            return self
+
+        # Back layer, it only changes if the background has been created again
+        if scrollarea._area_color is not None:
+            scrollarea._make_background_surface()
+        back_key = (current, scrollarea._bg_surface, scrollarea._rect.topleft, size)
+        if back_key != self._back_key or len(current._decorator._decor[DECOR_TYPE_PREV]) > 0:
+            self._back, self._back_surface = self._layer(self._back, self._back_surface, size)
+            self._back_surface.fill((0, 0, 0, 0))
+            current._decorator.draw_prev(self._back_surface)
+            scrollarea._draw_background(self._back_surface)
+            self._back.update(self._back_surface)
+            self._back_key = back_key
+            self.back_updates += 1
+
+        # World, scrolling changes the source rect only
+        self._update_world(current)
+
+        # Scrollbars, scrolling only uploads these small textures
+        scrollbars = self._update_scrollbars(scrollarea, size)
+
+        # Overlay of the selected widget, it may change on each frame
+        selected_widget = current.get_selected_widget()
+        overlay_rect = self._update_overlay(selected_widget)
+
+        # Front layer
+        front_key = self._get_front_key(current, size, selected_widget)
+        if front_key is None or front_key != self._front_key:
+            self._front, self._front_surface = self._layer(self._front, self._front_surface, size)
+            self._front_surface.fill((0, 0, 0, 0))
+            if scrollarea._decorator is not None:
+                scrollarea._decorator.draw_post(self._front_surface)
+            current._draw_front(self._front_surface, selected_widget)
+            self._front.update(self._front_surface)
+            self._front_key = front_key
+            self.front_updates += 1
+
+        # Compose
+        self._back.draw()
+        self._draw_world(scrollarea)
+        if overlay_rect is not None:
+            self._overlay.draw(dstrect=overlay_rect)
+        for texture, rect in scrollbars:
+            texture.draw(dstrect=rect)
+        self._front.draw()
+        current._stats.draw += 1
+        return self
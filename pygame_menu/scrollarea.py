@@ -49,11 +49,11 @@ from pygame_menu.locals import POSITION_SOUTHEAST, POSITION_SOUTHWEST, POSITION_
     ORIENTATION_VERTICAL, SCROLLAREA_POSITION_BOTH_HORIZONTAL, POSITION_SOUTH, SCROLLAREA_POSITION_FULL, \
     SCROLLAREA_POSITION_BOTH_VERTICAL
 from pygame_menu.utils import make_surface, assert_color, assert_position, assert_orientation, \
-    get_finger_pos
+    get_finger_pos, convert_surface, get_display_format, assert_vector
 from pygame_menu.widgets import ScrollBar, MenuBar
 
 from pygame_menu._types import Union, NumberType, Tuple, List, Dict, Tuple2NumberType, CursorInputType, \
-    Optional, Tuple2IntType, NumberInstance, ColorInputType, EventVectorType, EventType
+    Optional, Tuple2IntType, NumberInstance, ColorInputType, EventVectorType, EventType, Any, FrozenSet
 
 
 def get_scrollbars_from_position(position: str) -> Union[str, Tuple[str, str], Tuple[str, str, str, str]]:
@@ -97,6 +97,10 @@ class ScrollArea(Base):
     If the surface exceeds the size of the drawing surface, the view provide
     scroll bars so that the entire area of the child surface can be viewed.
 
+    The world surface can also be a window of a larger virtual world (see
+    :py:meth:`pygame_menu.scrollarea.ScrollArea.set_world_size`), thus, large
+    contents (for example, long lists) only draw the rows within the window.
+
     .. note::
 
         See :py:mod:`pygame_menu.locals` for valid ``scrollbars`` and
@@ -111,6 +115,7 @@ class ScrollArea(Base):
     :param area_color: Background color, it can be a color or an image
     :param extend_x: Px to extend the surface on x axis (px) from left. Recommended use only within Menus
     :param extend_y: Px to extend the surface on y axis (px) from top. Recommended use only within Menus
+    :param kinetic: Enable kinetic scrolling. The wheel, the page steps and :py:meth:`pygame_menu.scrollarea.ScrollArea.scroll_to_rect` scroll smoothly, and the scrollbars keep the inertia after dragging. It requires calling :py:meth:`pygame_menu.scrollarea.ScrollArea.update_kinetic` each frame
     :param menubar: Menubar for style compatibility. ``None`` if ScrollArea is not used within a Menu (for example, in Frames)
     :param parent_scrollarea: Parent ScrollArea if the new one is added within another area
     :param scrollarea_id: Scrollarea ID
@@ -128,7 +133,8 @@ class ScrollArea(Base):
     """
     _area_color: Optional[Union[ColorInputType, 'pygame_menu.BaseImage']]
     _bg_surface: Optional['pygame.Surface']
-    _decorator: 'Decorator'
+    _bg_surface_format: Any
+    _decorator: Optional['Decorator']  # Created on first get_decorator() call
     _extend_x: int
     _extend_y: int
     _menu: Optional['pygame_menu.Menu']
@@ -141,6 +147,8 @@ class ScrollArea(Base):
     _translate: Tuple2IntType
     _view_rect: 'pygame.Rect'
     _world: 'pygame.Surface'
+    _world_offset: Tuple2IntType
+    _world_size: Optional[Tuple2IntType]
 
     def __init__(
             self,
@@ -149,6 +157,7 @@ class ScrollArea(Base):
             area_color: Optional[Union[ColorInputType, 'pygame_menu.BaseImage']] = None,
             extend_x: int = 0,
             extend_y: int = 0,
+            kinetic: bool = False,
             menubar: Optional['MenuBar'] = None,
             parent_scrollarea: Optional['ScrollArea'] = None,
             scrollarea_id: str = '',
@@ -170,6 +179,7 @@ class ScrollArea(Base):
         assert isinstance(area_width, int)
         assert isinstance(extend_x, int)
         assert isinstance(extend_y, int)
+        assert isinstance(kinetic, bool)
         assert isinstance(scrollbar_slider_pad, NumberInstance)
         assert isinstance(scrollbar_thick, int)
         assert isinstance(shadow, bool)
@@ -199,14 +209,16 @@ class ScrollArea(Base):
 
         self._area_color = area_color
         self._bg_surface = None
-        self._bg_surface = None
-        self._decorator = Decorator(self)
+        self._bg_surface_format = None
+        self._decorator = None
         self._rect = pygame.Rect(0, 0, int(area_width), int(area_height))
         self._scrollbar_positions = tuple(unique_scrolls)  # Ensure unique
         self._scrollbar_thick = scrollbar_thick
         self._scrollbars = []
         self._translate = (0, 0)
         self._world = world
+        self._world_offset = (0, 0)  # Position of the world surface within the virtual world
+        self._world_size = None  # Size of the virtual world, if None, the world surface size is used
 
         self._extend_x = extend_x
         self._extend_y = extend_y
@@ -247,6 +259,7 @@ class ScrollArea(Base):
             )
             sbar.set_controls(joystick=False)
             sbar.set_cursor(cursor=scrollbar_cursor)
+            sbar.set_kinetic(kinetic)
             sbar.set_scrollarea(self)
             sbar.configured = True
 
@@ -263,10 +276,12 @@ class ScrollArea(Base):
 
         :return: None
         """
-        # If bg surface is created and it's the same size
+        # If bg surface is created and it's the same size and display format
+        display_format = get_display_format()
         if self._bg_surface is not None and \
-                self._bg_surface.get_width() == self._rect.width and \
-                self._bg_surface.get_height() == self._rect.height:
+                self._bg_surface.get_width() == self._rect.width + self._extend_x and \
+                self._bg_surface.get_height() == self._rect.height + self._extend_y and \
+                self._bg_surface_format == display_format:
             return
 
         # Make surface
@@ -277,6 +292,8 @@ class ScrollArea(Base):
                 self._area_color.draw(surface=self._bg_surface, area=self._bg_surface.get_rect())
             else:
                 self._bg_surface.fill(assert_color(self._area_color))
+        self._bg_surface = convert_surface(self._bg_surface)
+        self._bg_surface_format = display_format
 
     def set_parent_scrollarea(self, parent: Optional['ScrollArea']) -> None:
         """
@@ -360,7 +377,8 @@ class ScrollArea(Base):
         """
         if self._menu is not None:
             self._menu._widget_surface_cache_need_update = True
-            self._decorator.force_cache_update()
+            if self._decorator is not None:
+                self._decorator.force_cache_update()
         return self
 
     def _apply_size_changes(self) -> None:
@@ -415,12 +433,34 @@ class ScrollArea(Base):
         """
         if not self._world:
             return self
+        self._draw_background(surface)
+        self._draw_scrollbars(surface)
+
+        # noinspection PyTypeChecker
+        surface.blit(self._world, self._view_rect.topleft, (self._get_world_offsets(), self._view_rect.size))
+        if self._decorator is not None:
+            self._decorator.draw_post(surface)
+        return self
 
+    def _draw_background(self, surface: 'pygame.Surface') -> None:
+        """
+        Draw the background of the ScrollArea.
+
+        :param surface: Surface to render the background
+        :return: None
+        """
         # Background surface already has previous decorators
         if self._area_color is not None:
             self._make_background_surface()
             surface.blit(self._bg_surface, (self._rect.x - self._extend_x, self._rect.y - self._extend_y))
 
+    def _draw_scrollbars(self, surface: 'pygame.Surface') -> None:
+        """
+        Draw the visible scrollbars.
+
+        :param surface: Surface to render the scrollbars
+        :return: None
+        """
         for sbar in self._scrollbars:
             if not sbar.is_visible():
                 continue
@@ -431,11 +471,6 @@ class ScrollArea(Base):
                 if self.get_hidden_height():
                     sbar.draw(surface)
 
-        # noinspection PyTypeChecker
-        surface.blit(self._world, self._view_rect.topleft, (self.get_offsets(), self._view_rect.size))
-        self._decorator.draw_post(surface)
-        return self
-
     def get_hidden_width(self) -> int:
         """
         Return the total width out of the bounds of the viewable area.
@@ -445,7 +480,7 @@ class ScrollArea(Base):
         """
         if not self._world:
             return 0
-        return int(max(0, self._world.get_width() - self._view_rect.width))
+        return int(max(0, self.get_world_size()[0] - self._view_rect.width))
 
     def get_hidden_height(self) -> int:
         """
@@ -456,7 +491,7 @@ class ScrollArea(Base):
         """
         if not self._world:
             return 0
-        return int(max(0, self._world.get_height() - self._view_rect.height))
+        return int(max(0, self.get_world_size()[1] - self._view_rect.height))
 
     def get_offsets(self) -> Tuple2IntType:
         """
@@ -476,6 +511,16 @@ class ScrollArea(Base):
                     offsets[1] = sbar.get_value()
         return offsets[0], offsets[1]
 
+    def _get_world_offsets(self) -> Tuple2IntType:
+        """
+        Return the offset introduced by the scrollbars within the world surface,
+        that is, considering the position of the surface within the virtual world.
+
+        :return: Offset on x-axis and y-axis
+        """
+        offsets = self.get_offsets()
+        return offsets[0] - self._world_offset[0], offsets[1] - self._world_offset[1]
+
     def get_rect(self, to_real_position: bool = False) -> 'pygame.Rect':
         """
         Return the :py:class:`pygame.Rect` object of the ScrollArea.
@@ -517,7 +562,7 @@ class ScrollArea(Base):
         :param absolute: To absolute position
         :return: World rect object
         """
-        rect = self._world.get_rect()
+        rect = pygame.Rect((-self._world_offset[0], -self._world_offset[1]), self.get_world_size())
         if absolute:
             rect = self.to_absolute_position(rect)
         return rect
@@ -533,15 +578,16 @@ class ScrollArea(Base):
         :return: View rect object
         """
         rect = pygame.Rect(self._rect)
+        world_width, world_height = self.get_world_size()
 
         # No scrollbar: area is large enough to display world
-        if not self._world or (self._world.get_width() <= self._rect.width
-                               and self._world.get_height() <= self._rect.height):
+        if not self._world or (world_width <= self._rect.width
+                               and world_height <= self._rect.height):
             return rect
 
         # All scrollbars: the world is too large
-        if self._world.get_height() > self._rect.height \
-                and self._world.get_width() > self._rect.width:
+        if world_height > self._rect.height \
+                and world_width > self._rect.width:
             if POSITION_WEST in self._scrollbar_positions:
                 rect.left += self._scrollbar_thick
                 rect.width -= self._scrollbar_thick
@@ -566,26 +612,26 @@ class ScrollArea(Base):
         if POSITION_EAST in self._scrollbar_positions:
             bars_total_width += self._scrollbar_thick
 
-        if self._world.get_height() > self._rect.height:
+        if world_height > self._rect.height:
             if POSITION_WEST in self._scrollbar_positions:
                 rect.left += self._scrollbar_thick
                 rect.width -= self._scrollbar_thick
             if POSITION_EAST in self._scrollbar_positions:
                 rect.width -= self._scrollbar_thick
-            if self._world.get_width() > self._rect.width - bars_total_width:
+            if world_width > self._rect.width - bars_total_width:
                 if POSITION_NORTH in self._scrollbar_positions:
                     rect.top += self._scrollbar_thick
                     rect.height -= self._scrollbar_thick
                 if POSITION_SOUTH in self._scrollbar_positions:
                     rect.height -= self._scrollbar_thick
 
-        if self._world.get_width() > self._rect.width:
+        if world_width > self._rect.width:
             if POSITION_NORTH in self._scrollbar_positions:
                 rect.top += self._scrollbar_thick
                 rect.height -= self._scrollbar_thick
             if POSITION_SOUTH in self._scrollbar_positions:
                 rect.height -= self._scrollbar_thick
-            if self._world.get_height() > self._rect.height - bars_total_height:
+            if world_height > self._rect.height - bars_total_height:
                 if POSITION_WEST in self._scrollbar_positions:
                     rect.left += self._scrollbar_thick
                     rect.width -= self._scrollbar_thick
@@ -622,14 +668,57 @@ class ScrollArea(Base):
 
     def get_world_size(self) -> Tuple2IntType:
         """
-        Return the world size.
+        Return the world size. If the world is virtual, return the size of the
+        virtual world instead of the world surface size.
 
         :return: Width, height in pixels
         """
         if self._world is None:
             return 0, 0
+        if self._world_size is not None:
+            return self._world_size
         return self._world.get_width(), self._world.get_height()
 
+    def set_world_size(self, size: Optional[Tuple2IntType]) -> 'ScrollArea':
+        """
+        Set the size of the virtual world. The world surface is a window of the
+        virtual world placed at :py:meth:`pygame_menu.scrollarea.ScrollArea.get_world_offset`,
+        which must contain the view rect; positions within the world surface
+        reference are relative to the window.
+
+        :param size: Width, height of the virtual world in pixels. If ``None`` the world is the world surface
+        :return: Self reference
+        """
+        if size is not None:
+            assert_vector(size, 2, int)
+            size = (size[0], size[1])
+        else:
+            self._world_offset = (0, 0)
+        self._world_size = size
+        self._apply_size_changes()
+        return self
+
+    def get_world_offset(self) -> Tuple2IntType:
+        """
+        Return the position of the world surface within the virtual world.
+
+        :return: Position on x-axis and y-axis (px)
+        """
+        return self._world_offset
+
+    def set_world_offset(self, x: int, y: int) -> 'ScrollArea':
+        """
+        Set the position of the world surface within the virtual world.
+
+        :param x: X position (px)
+        :param y: Y position (px)
+        :return: Self reference
+        """
+        assert self._world_size is not None, 'world size must be set before the world offset'
+        assert isinstance(x, int) and isinstance(y, int)
+        self._world_offset = (x, y)
+        return self
+
     def get_size(self, inner: bool = False) -> Tuple2IntType:
         """
         Return the area size.
@@ -781,13 +870,13 @@ class ScrollArea(Base):
                                     real_rect.right + margin - view_rect.right, key=abs)
                 value = min(sbar.get_maximum(), sbar.get_value() + shortest_move)
                 value = max(sbar.get_minimum(), value)
-                sbar.set_value(value)
+                sbar.scroll_to_value(value)
             if sbar.get_orientation() == ORIENTATION_VERTICAL and self.get_hidden_height():
                 shortest_move = min(real_rect.bottom + margin - view_rect.bottom,
                                     real_rect.top - margin - view_rect.top, key=abs)
                 value = min(sbar.get_maximum(), sbar.get_value() + shortest_move)
                 value = max(sbar.get_minimum(), value)
-                sbar.set_value(value)
+                sbar.scroll_to_value(value)
 
         if self._parent_scrollarea is not None and scroll_parent:
             self._parent_scrollarea.scroll_to_rect(rect, margin, scroll_parent)
@@ -860,7 +949,7 @@ class ScrollArea(Base):
         """
         if self._parent_scrollarea is not None:
             px, py = self._parent_scrollarea.get_position()
-            ox, oy = self._parent_scrollarea.get_offsets()
+            ox, oy = self._parent_scrollarea._get_world_offsets()
             par_x, par_y = 0, 0
             if self._parent_scrollarea.get_parent() is not None:
                 par_x, par_y = self._parent_scrollarea.get_parent_position()
@@ -937,7 +1026,7 @@ class ScrollArea(Base):
         :return: Real rect or real position
         """
         assert isinstance(virtual, (pygame.Rect, tuple, list))
-        offsets = self.get_offsets()
+        offsets = self._get_world_offsets()
         parent_position = self.get_parent_position()
 
         if isinstance(virtual, pygame.Rect):
@@ -969,7 +1058,7 @@ class ScrollArea(Base):
         :return: Rect in world or position in world
         """
         assert isinstance(real, (pygame.Rect, tuple, list))
-        offsets = self.get_offsets()
+        offsets = self._get_world_offsets()
         parent_position = self.get_parent_position()
 
         if isinstance(real, pygame.Rect):
@@ -1010,6 +1099,55 @@ class ScrollArea(Base):
                 updated[1] = sbar.update(events)
         return updated[0] or updated[1]
 
+    def get_event_types(self) -> Optional[FrozenSet[int]]:
+        """
+        Return the event types consumed by the scrollbars.
+
+        :return: Event types. If ``None`` the scrollarea receives all the events
+        """
+        event_types = frozenset()
+        for sbar in self._scrollbars:
+            sbar_event_types = sbar._get_update_event_types()
+            if sbar_event_types is None:
+                return None
+            event_types |= sbar_event_types
+        return event_types
+
+    def update_kinetic(self) -> bool:
+        """
+        Advance the kinetic scrolling of the scrollbars. This method does nothing if
+        the kinetic scrolling is disabled, or if the scrollbars are not moving.
+
+        :return: ``True`` if the offsets have changed
+        """
+        updated = False
+        for sbar in self._scrollbars:
+            if sbar.update_kinetic():
+                updated = True
+        return updated
+
+    def is_kinetic_scrolling(self) -> bool:
+        """
+        Return ``True`` if any scrollbar is moving because of the kinetic scrolling.
+
+        :return: ``True`` if moving
+        """
+        for sbar in self._scrollbars:
+            if sbar.is_kinetic_scrolling():
+                return True
+        return False
+
+    def set_kinetic(self, kinetic: bool) -> 'ScrollArea':
+        """
+        Enable or disable the kinetic scrolling.
+
+        :param kinetic: Kinetic scrolling status
+        :return: Self reference
+        """
+        for sbar in self._scrollbars:
+            sbar.set_kinetic(kinetic)
+        return self
+
     def set_menu(self, menu: 'pygame_menu.Menu') -> 'ScrollArea':
         """
         Set the Menu reference.
@@ -1062,8 +1200,14 @@ class ScrollArea(Base):
             6. Menu title
             7. Menu ``post`` decorator
 
+        .. note::
+
+            The decorator is created on the first call.
+
         :return: Decorator API
         """
+        if self._decorator is None:
+            self._decorator = Decorator(self)
         return self._decorator
 
 
@@ -45,6 +45,7 @@ __all__ = [
 ]
 
 import copy
+import sys
 import warnings
 
 from pygame_menu.baseimage import BaseImage
@@ -95,8 +96,16 @@ class Theme(object):
         like rows/columns, enabling or disabling overflow, position, or Menu
         width/height see Menu parameters.
 
+    .. note::
+
+        A frozen theme (see :py:meth:`pygame_menu.themes.Theme.freeze`) cannot be
+        modified, thus, it can be shared by several Menus without copying it. Use
+        :py:meth:`pygame_menu.themes.Theme.override` to create a new theme with changes.
+
     :param background_color: Menu background color
     :type background_color: tuple, list, :py:class:`pygame_menu.baseimage.BaseImage`
+    :param background_opaque: If ``True`` the Menu widgets surface is opaque and filled with the background color, thus, it is drawn without alpha blending. If ``None`` it is enabled if the background color has no transparency. Not available if the background is an image
+    :type background_opaque: bool, None
     :param cursor_color: Cursor color (used in some text-gathering widgets like ``TextInput``)
     :type cursor_color: tuple, list, str, int, :py:class:`pygame.Color`
     :param cursor_selection_color: Color of the text selection if the cursor is enabled on certain widgets
@@ -111,6 +120,8 @@ class Theme(object):
     :type readonly_color: tuple, list, str, int, :py:class:`pygame.Color`
     :param readonly_selected_color: Color of the selected widget in readonly mode
     :type readonly_selected_color: tuple, list, str, int, :py:class:`pygame.Color`
+    :param scrollarea_kinetic: Enable the kinetic scrolling of the Menu ScrollArea. The wheel, the page steps and the widget selection scroll smoothly, and the scrollbars keep the inertia after dragging
+    :type scrollarea_kinetic: bool
     :param scrollarea_outer_margin: Outer ScrollArea margin (px); the tuple is added to computed ScrollArea width/height, it can add an margin to bottom/right scrolls after widgets. If value less than ``1`` use percentage of width/height. It cannot be a negative value
     :type scrollarea_outer_margin: tuple, list
     :param scrollarea_position: Position of ScrollArea scrollbars. See :py:mod:`pygame_menu.locals`
@@ -233,7 +244,10 @@ class Theme(object):
     :type widget_url_color: tuple, list, str, int, :py:class:`pygame.Color`
     """
     _disable_validation: bool
+    _frozen: bool
+    _validated: bool
     background_color: Union[ColorType, 'BaseImage']
+    background_opaque: Optional[bool]
     cursor_color: ColorType
     cursor_selection_color: ColorType
     cursor_switch_ms: NumberType
@@ -241,6 +255,7 @@ class Theme(object):
     fps: NumberType
     readonly_color: ColorType
     readonly_selected_color: ColorType
+    scrollarea_kinetic: bool
     scrollarea_outer_margin: Tuple2NumberType
     scrollarea_position: str
     scrollbar_color: ColorType
@@ -306,6 +321,7 @@ class Theme(object):
 
         # Menu general
         self.background_color = self._get(kwargs, 'background_color', 'color_image', (220, 220, 220))
+        self.background_opaque = self._get(kwargs, 'background_opaque', (bool, type(None)), None)
         self.focus_background_color = self._get(kwargs, 'focus_background_color', 'color', (0, 0, 0, 180))
         self.fps = self._get(kwargs, 'fps', NumberInstance, 30)
         self.readonly_color = self._get(kwargs, 'readonly_color', 'color', (120, 120, 120))
@@ -338,6 +354,7 @@ class Theme(object):
         self.title_updates_pygame_display = self._get(kwargs, 'title_updates_pygame_display', bool, False)
 
         # ScrollArea
+        self.scrollarea_kinetic = self._get(kwargs, 'scrollarea_kinetic', bool, False)
         self.scrollarea_outer_margin = self._get(kwargs, 'scrollarea_outer_margin', 'tuple2', (0, 0))
         self.scrollarea_position = self._get(kwargs, 'scrollarea_position', str, POSITION_SOUTHEAST)
 
@@ -405,21 +422,31 @@ class Theme(object):
 
         # Test purpose only, if True disables any validation
         self._disable_validation = False
+        self._frozen = False
+
+    def __setattr__(self, key: str, value: Any) -> None:
+        if self.__dict__.get('_frozen', False):
+            raise AttributeError('theme is frozen, use override() to create a new theme with changes')
+        if key[0] != '_':  # Modified themes must be validated again
+            self.__dict__['_validated'] = False
+        super(Theme, self).__setattr__(key, value)
 
     def validate(self) -> 'Theme':
         """
         Validate the values of the theme. If there's a invalid parameter throws an
-        ``AssertionError``.
+        ``AssertionError``. The validation runs again only if the theme has been
+        modified.
 
         This function also converts all lists to tuples. This is done because lists
         are mutable.
 
         :return: Self reference
         """
-        if self._disable_validation:
+        if self._disable_validation or self._validated:
             return self
 
         # Boolean asserts
+        assert isinstance(self.scrollarea_kinetic, bool)
         assert isinstance(self.scrollbar_shadow, bool)
         assert isinstance(self.title_bar_modify_scrollarea, bool)
         assert isinstance(self.title_close_button, bool)
@@ -447,6 +474,7 @@ class Theme(object):
         if self.widget_selection_effect is None:
             self.widget_selection_effect = NoneSelection()
 
+        assert isinstance(self.background_opaque, (bool, type(None)))
         assert isinstance(self.cursor_switch_ms, NumberInstance)
         assert isinstance(self.fps, NumberInstance)
         assert isinstance(self.scrollbar_shadow_offset, int)
@@ -510,6 +538,11 @@ class Theme(object):
             assert self.widget_padding >= 0, 'padding cannot be a negative number'
         self.widget_offset = self._vec_to_tuple(self.widget_offset, 2, NumberInstance)
 
+        # Opaque background needs a color
+        if self.background_opaque:
+            assert not isinstance(self.background_color, BaseImage), \
+                'background cannot be opaque if it is an image'
+
         # Check sizes
         assert self.scrollarea_outer_margin[0] >= 0 and self.scrollarea_outer_margin[1] >= 0, \
             'scroll area outer margin must be equal or greater than zero on both axis'
@@ -538,8 +571,58 @@ class Theme(object):
         assert self.focus_background_color[3] != 0, \
             'focus background color cannot be fully transparent, suggested opacity between 1 and 255'
 
+        self._validated = True
         return self
 
+    def freeze(self) -> 'Theme':
+        """
+        Create a frozen copy of the theme. A frozen theme cannot be modified, thus,
+        it can be shared by many Menus, and it is validated only once. The values
+        (fonts, images, selection effects, etc.) are shared with this theme instead
+        of copied. If the theme is already frozen, the same object is returned.
+
+        .. code-block:: python
+
+            theme = pygame_menu.themes.THEME_DARK.freeze()
+
+        :return: Frozen theme
+        """
+        if self._frozen:
+            return self
+        return self.override()
+
+    def is_frozen(self) -> bool:
+        """
+        Return ``True`` if the theme is frozen.
+
+        :return: Frozen status
+        """
+        return self._frozen
+
+    def override(self, **kwargs) -> 'Theme':
+        """
+        Create a new frozen theme with the given attributes changed. The values
+        that are not changed (fonts, images, selection effects, etc.) are shared
+        with this theme instead of copied.
+
+        .. code-block:: python
+
+            theme = pygame_menu.themes.THEME_DARK.override(title_font_size=30, widget_font_size=20)
+
+        :param kwargs: Theme attributes to change
+        :return: New theme
+        """
+        theme = Theme.__new__(Theme)
+        theme.__dict__.update(self.__dict__)
+        theme.__dict__['_frozen'] = False
+        for key, value in kwargs.items():
+            if key[0] == '_' or key not in self.__dict__:
+                raise ValueError('parameter Theme.{} does not exist'.format(key))
+            setattr(theme, key, value)
+        theme.validate()
+        theme._frozen = True
+        return theme
+
     def set_background_color_opacity(self, opacity: float) -> 'Theme':
         """
         Modify the Menu background color with given opacity.
@@ -582,11 +665,13 @@ class Theme(object):
 
     def copy(self) -> 'Theme':
         """
-        Creates a deep copy of the object.
+        Creates a deep copy of the object. The copy is not frozen.
 
         :return: Copied theme
         """
-        return copy.deepcopy(self)
+        theme = copy.deepcopy(self)
+        theme.__dict__['_frozen'] = False
+        return theme
 
     def __copy__(self) -> 'Theme':
         """
@@ -739,63 +824,80 @@ class Theme(object):
         return value
 
 
-THEME_DEFAULT = Theme()
-
-THEME_DARK = Theme(
-    background_color=(40, 41, 35),
-    cursor_color=(255, 255, 255),
-    cursor_selection_color=(80, 80, 80, 120),
-    scrollbar_color=(39, 41, 42),
-    scrollbar_slider_color=(65, 66, 67),
-    selection_color=(255, 255, 255),
-    title_background_color=(47, 48, 51),
-    title_font_color=(215, 215, 215),
-    widget_font_color=(200, 200, 200)
-)
-
-THEME_BLUE = Theme(
-    background_color=(228, 230, 246),
-    scrollbar_shadow=True,
-    scrollbar_slider_color=(150, 200, 230),
-    scrollbar_slider_pad=2,
-    selection_color=(100, 62, 132),
-    title_background_color=(62, 149, 195),
-    title_font_color=(228, 230, 246),
-    title_font_shadow=True,
-    widget_font_color=(61, 170, 220)
-)
-
-THEME_GREEN = Theme(
-    background_color=(186, 214, 177),
-    scrollbar_slider_color=(125, 121, 114),
-    scrollbar_slider_pad=2,
-    selection_color=(125, 121, 114),
-    title_background_color=(125, 121, 114),
-    title_font_color=(228, 230, 246),
-    widget_font_color=(255, 255, 255)
-)
-
-THEME_ORANGE = Theme(
-    background_color=(228, 100, 36),
-    selection_color=(255, 255, 255),
-    title_background_color=(170, 65, 50),
-    widget_font_color=(0, 0, 0),
-    widget_font_size=30
-)
-
-THEME_SOLARIZED = Theme(
-    background_color=(239, 231, 211),
-    cursor_color=(0, 0, 0),
-    cursor_selection_color=(146, 160, 160, 120),
-    selection_color=(207, 62, 132),
-    title_background_color=(4, 47, 58),
-    title_font_color=(38, 158, 151),
-    widget_font_color=(102, 122, 130)
-)
-
-THEME_WINDOWS = Theme(
-    background_color=(240, 240, 240),
-    widget_background_color=(240, 240, 240),
-    widget_border_color=(168, 168, 168),
-    widget_border_width=0
-)
+# Predefined themes, these are created on first access (PEP 562)
+_THEMES = {
+    'THEME_DEFAULT': {},
+    'THEME_DARK': {
+        'background_color': (40, 41, 35),
+        'cursor_color': (255, 255, 255),
+        'cursor_selection_color': (80, 80, 80, 120),
+        'scrollbar_color': (39, 41, 42),
+        'scrollbar_slider_color': (65, 66, 67),
+        'selection_color': (255, 255, 255),
+        'title_background_color': (47, 48, 51),
+        'title_font_color': (215, 215, 215),
+        'widget_font_color': (200, 200, 200)
+    },
+    'THEME_BLUE': {
+        'background_color': (228, 230, 246),
+        'scrollbar_shadow': True,
+        'scrollbar_slider_color': (150, 200, 230),
+        'scrollbar_slider_pad': 2,
+        'selection_color': (100, 62, 132),
+        'title_background_color': (62, 149, 195),
+        'title_font_color': (228, 230, 246),
+        'title_font_shadow': True,
+        'widget_font_color': (61, 170, 220)
+    },
+    'THEME_GREEN': {
+        'background_color': (186, 214, 177),
+        'scrollbar_slider_color': (125, 121, 114),
+        'scrollbar_slider_pad': 2,
+        'selection_color': (125, 121, 114),
+        'title_background_color': (125, 121, 114),
+        'title_font_color': (228, 230, 246),
+        'widget_font_color': (255, 255, 255)
+    },
+    'THEME_ORANGE': {
+        'background_color': (228, 100, 36),
+        'selection_color': (255, 255, 255),
+        'title_background_color': (170, 65, 50),
+        'widget_font_color': (0, 0, 0),
+        'widget_font_size': 30
+    },
+    'THEME_SOLARIZED': {
+        'background_color': (239, 231, 211),
+        'cursor_color': (0, 0, 0),
+        'cursor_selection_color': (146, 160, 160, 120),
+        'selection_color': (207, 62, 132),
+        'title_background_color': (4, 47, 58),
+        'title_font_color': (38, 158, 151),
+        'widget_font_color': (102, 122, 130)
+    },
+    'THEME_WINDOWS': {
+        'background_color': (240, 240, 240),
+        'widget_background_color': (240, 240, 240),
+        'widget_border_color': (168, 168, 168),
+        'widget_border_width': 0
+    }
+}
+
+
+def __getattr__(name: str) -> 'Theme':
+    """
+    Create the predefined theme on first access.
+
+    :param name: Theme name
+    :return: Theme
+    """
+    if name in _THEMES:
+        theme = Theme(**_THEMES[name])
+        globals()[name] = theme
+        return theme
+    raise AttributeError('module {0} has no attribute {1}'.format(__name__, name))
+
+
+# Module __getattr__ is not supported by Python 3.6, then, create all
+if sys.version_info < (3, 7):
+    for _name in _THEMES.keys():
+        globals()[_name] = __getattr__(_name)
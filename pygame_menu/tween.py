@@ -0,0 +1,454 @@
+"""
+pygame-menu
+https://github.com/ppizarror/pygame-menu
+
+TWEEN
+Animates the widget properties within the Menu.
+
+License:
+-------------------------------------------------------------------------------
+The MIT License (MIT)
+Copyright 2017-2021 Pablo Pizarro R. @ppizarror
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the Software
+is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+-------------------------------------------------------------------------------
+"""
+
+__all__ = [
+
+    # Classes
+    'Tween',
+    'TweenScheduler',
+
+    # Easing functions
+    'ease_in_cubic',
+    'ease_in_out_cubic',
+    'ease_in_out_quad',
+    'ease_in_out_sine',
+    'ease_in_quad',
+    'ease_linear',
+    'ease_out_cubic',
+    'ease_out_quad',
+
+    # Properties
+    'TWEEN_ALPHA',
+    'TWEEN_COLOR',
+    'TWEEN_SCALE',
+    'TWEEN_TRANSLATE'
+
+]
+
+import math
+
+import pygame_menu
+
+from pygame_menu.utils import assert_color, assert_vector, is_callable
+from pygame_menu.widgets import Frame, Widget
+
+from pygame_menu._types import Callable, Any, Dict, List, Optional, Tuple, NumberType
+
+# Animated properties
+TWEEN_ALPHA = 'alpha'  # Widget surface transparency, 0-255
+TWEEN_COLOR = 'color'  # Widget font color
+TWEEN_SCALE = 'scale'  # Widget scale factor (x, y)
+TWEEN_TRANSLATE = 'translate'  # Widget translation (x, y) in px
+
+EasingType = Callable[[float], float]
+
+
+def ease_linear(t: float) -> float:
+    """
+    Linear easing.
+
+    :param t: Progress, from ``0`` to ``1``
+    :return: Eased progress
+    """
+    return t
+
+
+def ease_in_quad(t: float) -> float:
+    """
+    Quadratic easing, accelerating from zero velocity.
+
+    :param t: Progress, from ``0`` to ``1``
+    :return: Eased progress
+    """
+    return t * t
+
+
+def ease_out_quad(t: float) -> float:
+    """
+    Quadratic easing, decelerating to zero velocity.
+
+    :param t: Progress, from ``0`` to ``1``
+    :return: Eased progress
+    """
+    return t * (2 - t)
+
+
+def ease_in_out_quad(t: float) -> float:
+    """
+    Quadratic easing, accelerating until halfway, then decelerating.
+
+    :param t: Progress, from ``0`` to ``1``
+    :return: Eased progress
+    """
+    return 2 * t * t if t < 0.5 else 1 - 2 * (1 - t) * (1 - t)
+
+
+def ease_in_cubic(t: float) -> float:
+    """
+    Cubic easing, accelerating from zero velocity.
+
+    :param t: Progress, from ``0`` to ``1``
+    :return: Eased progress
+    """
+    return t * t * t
+
+
+def ease_out_cubic(t: float) -> float:
+    """
+    Cubic easing, decelerating to zero velocity.
+
+    :param t: Progress, from ``0`` to ``1``
+    :return: Eased progress
+    """
+    return 1 - (1 - t) ** 3
+
+
+def ease_in_out_cubic(t: float) -> float:
+    """
+    Cubic easing, accelerating until halfway, then decelerating.
+
+    :param t: Progress, from ``0`` to ``1``
+    :return: Eased progress
+    """
+    return 4 * t * t * t if t < 0.5 else 1 - 4 * (1 - t) ** 3
+
+
+def ease_in_out_sine(t: float) -> float:
+    """
+    Sinusoidal easing, accelerating until halfway, then decelerating.
+
+    :param t: Progress, from ``0`` to ``1``
+    :return: Eased progress
+    """
+    return (1 - math.cos(math.pi * t)) / 2
+
+
+class Tween(object):
+    """
+    Animates a Widget property from its value at the start of the tween to the
+    given value. Tweens are created by :py:meth:`pygame_menu.tween.TweenScheduler.add`.
+
+    :param widget: Widget to animate
+    :param prop: Animated property, ``TWEEN_ALPHA``, ``TWEEN_COLOR``, ``TWEEN_SCALE`` or ``TWEEN_TRANSLATE``
+    :param value: Final value of the property
+    :param start: Start time of the tween within the Menu timeline (ms)
+    :param duration: Duration (ms)
+    :param easing: Easing function, receives the progress from ``0`` to ``1`` and returns the eased progress
+    :param onfinish: Function called when the tween finishes, receives the widget and the Menu
+    """
+    _duration: int
+    _easing: EasingType
+    _end: Tuple[NumberType, ...]
+    _onfinish: Optional[Callable[['Widget', 'pygame_menu.Menu'], Any]]
+    _prop: str
+    _start: Optional[Tuple[NumberType, ...]]
+    _start_time: int
+    _widget: 'Widget'
+
+    def __init__(
+            self,
+            widget: 'Widget',
+            prop: str,
+            value: Tuple[NumberType, ...],
+            start: int,
+            duration: int,
+            easing: EasingType,
+            onfinish: Optional[Callable[['Widget', 'pygame_menu.Menu'], Any]]
+    ) -> None:
+        self._duration = duration
+        self._easing = easing
+        self._end = value
+        self._onfinish = onfinish
+        self._prop = prop
+        self._start = None  # Read from the widget when the tween starts
+        self._start_time = start
+        self._widget = widget
+
+    def get_property(self) -> str:
+        """
+        Return the animated property.
+
+        :return: Property
+        """
+        return self._prop
+
+    def get_widget(self) -> 'Widget':
+        """
+        Return the animated widget.
+
+        :return: Widget
+        """
+        return self._widget
+
+    def get_value(self, time: int) -> Tuple[NumberType, ...]:
+        """
+        Return the value of the property at the given time.
+
+        :param time: Time within the Menu timeline (ms)
+        :return: Property value
+        """
+        assert self._start is not None, 'tween has not started'
+        if self._duration == 0:
+            return self._end
+        t = self._easing(min(1, max(0, (time - self._start_time) / self._duration)))
+        return tuple(a + (b - a) * t for a, b in zip(self._start, self._end))
+
+    def is_finished(self, time: int) -> bool:
+        """
+        Return ``True`` if the tween has finished at the given time.
+
+        :param time: Time within the Menu timeline (ms)
+        :return: ``True`` if finished
+        """
+        return time >= self._start_time + self._duration
+
+
+class TweenScheduler(object):
+    """
+    Animates the widget properties of a Menu. The tweens advance on each
+    :py:meth:`pygame_menu.menu.Menu.update` using the time of the Menu, and all
+    the property writes of the frame are applied together. If the animated
+    widgets keep their size, only the Menu surface cache is updated (the widgets
+    are drawn again without computing the Menu layout); if not, the Menu layout
+    is updated once per frame. If there are no tweens the scheduler does nothing.
+
+    .. code-block:: python
+
+        from pygame_menu.tween import TWEEN_TRANSLATE, ease_out_cubic
+
+        button = menu.add.button('Play')
+        menu.get_tweens().add(button, TWEEN_TRANSLATE, (100, 0), 300, easing=ease_out_cubic)
+
+    .. note::
+
+        The translation is not considered by the Menu layout while the tween is
+        running, thus, the widget is clipped by the Menu widgets surface if it
+        moves outside of it. Frames are translated using the Menu layout.
+
+    :param menu: Menu
+    """
+    _menu: 'pygame_menu.Menu'
+    _tweens: Dict[Tuple['Widget', str], 'Tween']
+
+    def __init__(self, menu: 'pygame_menu.Menu') -> None:
+        self._menu = menu
+        self._tweens = {}
+
+    def add(
+            self,
+            widget: 'Widget',
+            prop: str,
+            value: Any,
+            duration: int,
+            easing: EasingType = ease_linear,
+            delay: int = 0,
+            onfinish: Optional[Callable[['Widget', 'pygame_menu.Menu'], Any]] = None
+    ) -> 'Tween':
+        """
+        Animate a widget property. The tween starts from the value of the property
+        once the delay has elapsed. A new tween of the same widget and property
+        replaces the previous one.
+
+        Property values:
+
+        - ``TWEEN_ALPHA``       *(int)* - Transparency of the widget surface, from ``0`` to ``255``
+        - ``TWEEN_COLOR``       *(tuple, list, str, int,* :py:class:`pygame.Color` *)* - Font color of the widget status, for example, the selected color if the widget is selected (see :py:meth:`pygame_menu.widgets.core.widget.Widget.get_font_color_status`)
+        - ``TWEEN_SCALE``       *(tuple, list)* - Scale factor (x, y)
+        - ``TWEEN_TRANSLATE``   *(tuple, list)* - Translation (x, y) in px
+
+        :param widget: Widget to animate, it must be within the Menu
+        :param prop: Animated property
+        :param value: Final value of the property
+        :param duration: Duration (ms)
+        :param easing: Easing function, receives the progress from ``0`` to ``1`` and returns the eased progress
+        :param delay: Delay before starting the tween (ms)
+        :param onfinish: Function called when the tween finishes, receives the widget and the Menu
+        :return: Tween
+        """
+        assert isinstance(widget, Widget)
+        assert widget.get_menu() is self._menu, 'widget must be within the Menu of the tween scheduler'
+        assert isinstance(duration, int) and duration >= 0, 'duration must be a positive integer'
+        assert isinstance(delay, int) and delay >= 0, 'delay must be a positive integer'
+        assert is_callable(easing), 'easing must be callable (function-type)'
+        assert onfinish is None or is_callable(onfinish), 'onfinish must be callable (function-type) or None'
+        if prop == TWEEN_ALPHA:
+            assert isinstance(value, int) and 0 <= value <= 255, 'alpha must be an integer between 0 and 255'
+            value = (value,)
+        elif prop == TWEEN_COLOR:
+            value = assert_color(value)
+        elif prop == TWEEN_SCALE:
+            assert_vector(value, 2)
+            assert value[0] > 0 and value[1] > 0, 'scale must be greater than zero'
+        elif prop == TWEEN_TRANSLATE:
+            assert_vector(value, 2)
+        else:
+            raise ValueError('invalid tween property "{0}"'.format(prop))
+        # noinspection PyProtectedMember
+        start = self._menu._timeline.get_time() + delay
+        tween = Tween(widget, prop, tuple(value), start, duration, easing, onfinish)
+        self._tweens[(widget, prop)] = tween
+        return tween
+
+    def cancel(self, widget: 'Widget', prop: Optional[str] = None) -> 'TweenScheduler':
+        """
+        Stop the tweens of a widget. The properties keep their current value.
+
+        :param widget: Widget
+        :param prop: Property. If ``None`` all the tweens of the widget are stopped
+        :return: Self reference
+        """
+        for key in list(self._tweens.keys()):
+            if key[0] == widget and (prop is None or key[1] == prop):
+                del self._tweens[key]
+        return self
+
+    def clear(self) -> 'TweenScheduler':
+        """
+        Stop all the tweens.
+
+        :return: Self reference
+        """
+        self._tweens.clear()
+        return self
+
+    def get_tweens(self) -> List['Tween']:
+        """
+        Return the tweens that have not finished.
+
+        :return: Tween list
+        """
+        return list(self._tweens.values())
+
+    def is_active(self) -> bool:
+        """
+        Return ``True`` if there are tweens that have not finished.
+
+        :return: ``True`` if active
+        """
+        return len(self._tweens) > 0
+
+    @staticmethod
+    def _get_property(widget: 'Widget', prop: str) -> Tuple[NumberType, ...]:
+        """
+        Return the current value of a widget property.
+
+        :param widget: Widget
+        :param prop: Property
+        :return: Property value
+        """
+        if prop == TWEEN_ALPHA:
+            return widget.get_alpha(),
+        elif prop == TWEEN_COLOR:
+            return widget.get_font_color_status()
+        elif prop == TWEEN_SCALE:
+            # noinspection PyProtectedMember
+            scale = widget._scale
+            return (scale[1], scale[2]) if scale[0] else (1, 1)
+        return widget.get_translate()
+
+    @staticmethod
+    def _set_property(widget: 'Widget', prop: str, value: Tuple[NumberType, ...]) -> bool:
+        """
+        Write a widget property without updating the Menu.
+
+        :param widget: Widget
+        :param prop: Property
+        :param value: Property value
+        :return: ``True`` if the Menu layout must be updated
+        """
+        # noinspection PyProtectedMember
+        if prop == TWEEN_ALPHA:
+            widget._alpha = int(round(value[0]))
+        elif prop == TWEEN_COLOR:
+            # Write the color rendered by the widget status (selected, readonly)
+            setattr(widget, widget._get_font_color_status_name(), tuple(int(round(c)) for c in value))
+            widget._last_render_hash = 0  # Render again within the batch
+        elif prop == TWEEN_SCALE:
+            widget.scale(value[0], value[1])
+        elif type(widget).translate is not Widget.translate or isinstance(widget, Frame):
+            widget.translate(value[0], value[1])
+            return True
+        else:
+            # Move the widget rect, the layout of the Menu is not changed
+            widget._translate = (int(value[0]), int(value[1]))
+            widget.set_position(*widget._position)
+        return False
+
+    def update(self) -> bool:
+        """
+        Advance the tweens to the current time of the Menu timeline, and apply the
+        property writes.
+
+        :return: ``True`` if any property has been written
+        """
+        if len(self._tweens) == 0:
+            return False
+        menu = self._menu
+        # noinspection PyProtectedMember
+        time = menu._timeline.get_time()
+
+        # Write the properties
+        sizes: Dict['Widget', Tuple[int, int]] = {}
+        finished: List['Tween'] = []
+        # noinspection PyProtectedMember
+        need_update = menu._widgets_surface_need_update
+        layout = False
+        for tween in list(self._tweens.values()):
+            if time < tween._start_time:
+                continue
+            widget = tween._widget
+            if tween._start is None:
+                tween._start = self._get_property(widget, tween._prop)
+            if widget not in sizes:
+                # noinspection PyProtectedMember
+                sizes[widget] = widget._rect.size
+            if self._set_property(widget, tween._prop, tween.get_value(time)):
+                layout = True
+            if tween.is_finished(time):
+                del self._tweens[(widget, tween._prop)]
+                finished.append(tween)
+        if len(sizes) == 0:
+            return False
+
+        # Render the widgets once, and update the layout only if any size changed
+        for widget, size in sizes.items():
+            # noinspection PyProtectedMember
+            widget._render()
+            # noinspection PyProtectedMember
+            if widget._rect.size != size:
+                layout = True
+            widget.force_menu_surface_cache_update()
+        menu._widgets_surface_need_update = need_update or layout
+
+        for tween in finished:
+            if tween._onfinish is not None:
+                tween._onfinish(tween._widget, menu)
+        return True
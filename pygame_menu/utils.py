@@ -39,30 +39,41 @@ __all__ = [
     'assert_orientation',
     'assert_position',
     'assert_vector',
+    'borrow_surface',
     'check_key_pressed_valid',
+    'convert_surface',
+    'detach_surface',
     'fill_gradient',
     'format_color',
+    'get_display_format',
     'get_finger_pos',
+    'get_surface_pool',
     'is_callable',
     'make_surface',
     'mouse_motion_current_mouse_position',
     'parse_padding',
+    'release_surface',
     'set_pygame_cursor',
+    'set_random_uuid',
     'uuid4',
+    'wait_events',
     'widget_terminal_title',
 
     # Constants
     'PYGAME_V2',
 
     # Classes
+    'SurfacePool',
     'TerminalColors'
 
 ]
 
 import functools
+import itertools
 import types
 import uuid
 import warnings
+import weakref
 
 import pygame
 import pygame_menu
@@ -71,12 +82,21 @@ from pygame_menu.locals import ALIGN_CENTER, ALIGN_LEFT, ALIGN_RIGHT, POSITION_C
     POSITION_SOUTH, POSITION_SOUTHEAST, POSITION_NORTHWEST, POSITION_WEST, POSITION_EAST, POSITION_NORTHEAST, \
     POSITION_SOUTHWEST, ORIENTATION_HORIZONTAL, ORIENTATION_VERTICAL, FINGERDOWN, FINGERUP, FINGERMOTION
 
-from pygame_menu._types import ColorType, ColorInputType, Union, List, Vector2NumberType, NumberType, Any, \
+from pygame_menu._types import ColorType, ColorInputType, Union, List, Dict, Vector2NumberType, NumberType, Any, \
     Optional, Tuple, NumberInstance, VectorInstance, PaddingInstance, PaddingType, Tuple4IntType, \
-    ColorInputInstance, VectorType, EventType, CursorInputInstance, CursorInputType, Tuple2IntType
+    ColorInputInstance, VectorType, EventType, CursorInputInstance, CursorInputType, Tuple2IntType, Tuple3IntType, \
+    EventListType
 
 PYGAME_V2 = pygame.version.vernum[0] >= 2
 
+# Cached gradient surfaces, see fill_gradient
+_GRADIENT_CACHE: Dict[Tuple[Any, ...], 'pygame.Surface'] = {}
+
+# Sequential uuid, see uuid4
+_UUID_COUNTER = itertools.count(1)
+_UUID_PREFIX = uuid.uuid4().hex[:8]  # Distinguish the ids of each process
+_UUID_RANDOM = [False]
+
 
 def assert_alignment(align: str) -> None:
     """
@@ -196,6 +216,26 @@ def assert_vector(num_vector: VectorType, length: int, instance: type = NumberIn
             'item {0} of vector must be {1}, not type "{2}"'.format(num, instance, type(num))
 
 
+def borrow_surface(width: NumberType, height: NumberType,
+                   alpha: bool = False, fill_color: Optional[ColorInputType] = None) -> 'pygame.Surface':
+    """
+    Borrows a surface from the surface pool. The surface is cleared (transparent)
+    or filled with the given color. See :py:class:`pygame_menu.utils.SurfacePool`.
+
+    .. note::
+
+        The surface should be returned with :py:meth:`pygame_menu.utils.release_surface`
+        once it is no longer used. Non returned surfaces are garbage collected as usual.
+
+    :param width: Surface width
+    :param height: Surface height
+    :param alpha: Enable alpha channel on surface
+    :param fill_color: Fill surface with a certain color
+    :return: Pygame surface
+    """
+    return _SURFACE_POOL.borrow(width, height, alpha, fill_color)
+
+
 def check_key_pressed_valid(event: EventType) -> bool:
     """
     Checks if the pressed key is valid.
@@ -215,16 +255,73 @@ def check_key_pressed_valid(event: EventType) -> bool:
     return not bad_event
 
 
+def convert_surface(surface: 'pygame.Surface', rle: bool = True) -> 'pygame.Surface':
+    """
+    Converts a surface to the pixel format of the display, thus, the blits onto
+    the display do not require a format conversion. Opaque surfaces, or surfaces
+    with disabled alpha blending, are converted without the alpha channel. If the
+    display mode has not been set the same surface is returned.
+
+    .. note::
+
+        The conversion must be redone if the display format changes, see
+        :py:meth:`pygame_menu.utils.get_display_format`.
+
+    :param surface: Surface to convert
+    :param rle: Use RLE acceleration for the colorkey and the surface alpha. Disable it if the surface is modified often
+    :return: Converted surface
+    """
+    assert isinstance(surface, pygame.Surface)
+    assert isinstance(rle, bool)
+    if pygame.display.get_surface() is None:
+        return surface
+    alpha = surface.get_alpha()
+    colorkey = surface.get_colorkey()
+    flags = pygame.RLEACCEL if rle else 0
+
+    # Check if the surface uses the alpha channel
+    opaque = alpha is None or not surface.get_flags() & pygame.SRCALPHA
+    if not opaque:
+        w, h = surface.get_size()
+        opaque = pygame.mask.from_surface(surface, 254).count() == w * h
+
+    if opaque:
+        converted = surface.convert()
+    else:
+        converted = surface.convert_alpha()
+    if colorkey is not None:
+        converted.set_colorkey(colorkey, flags)
+    if alpha is not None and alpha < 255:
+        converted.set_alpha(alpha, flags)
+    return converted
+
+
+def detach_surface(surface: Optional['pygame.Surface']) -> None:
+    """
+    Detaches a surface borrowed by :py:meth:`pygame_menu.utils.borrow_surface`
+    from the pool, thus, the surface is not reused even if it is released. This
+    must be used if the surface is handed out, as the pool would overwrite it.
+
+    :param surface: Surface to detach
+    :return: None
+    """
+    _SURFACE_POOL.detach(surface)
+
+
 def fill_gradient(
         surface: 'pygame.Surface',
         color: ColorInputType,
         gradient: ColorInputType,
         rect: Optional['pygame.Rect'] = None,
         vertical: bool = True,
-        forward: bool = True
+        forward: bool = True,
+        stops: Optional[List[ColorInputType]] = None,
+        diagonal: bool = False
 ) -> None:
     """
-    Fill a surface with a gradient pattern.
+    Fill a surface with a gradient pattern. The gradient surface is cached by
+    its size, colors and direction, thus, filling again the same area only
+    requires a blit.
 
     :param surface: Surface to fill
     :param color: Starting color
@@ -232,44 +329,82 @@ def fill_gradient(
     :param rect: Area to fill; default is surface's rect
     :param vertical: True=vertical; False=horizontal
     :param forward: True=forward; False=reverse
+    :param stops: Intermediate colors between the starting and the final color, evenly spaced
+    :param diagonal: If ``True`` the gradient goes along the 45 degrees diagonal, from the top-left to the bottom-right corner; ``vertical`` is ignored
     :return: None
     """
+    assert isinstance(vertical, bool)
+    assert isinstance(forward, bool)
+    assert isinstance(diagonal, bool)
     if rect is None:
         rect = surface.get_rect()
-    x1, x2 = rect.left, rect.right
-    y1, y2 = rect.top, rect.bottom
-    color = assert_color(color)
-    gradient = assert_color(gradient)
-    if vertical:
-        h = y2 - y1
-    else:
-        h = x2 - x1
-    if forward:
-        a, b = color, gradient
+    if stops is None:
+        stops = []
+    assert isinstance(stops, VectorInstance), 'stops must be a list or tuple of colors'
+    colors = tuple(assert_color(c)[0:3] for c in (color, *stops, gradient))
+    if not forward:
+        colors = colors[::-1]
+    if rect.width <= 0 or rect.height <= 0:
+        return
+
+    key = (rect.width, rect.height, colors, vertical or diagonal, diagonal)
+    gradient_surface = _GRADIENT_CACHE.get(key)
+    if gradient_surface is None:
+        gradient_surface = _make_gradient(rect.width, rect.height, colors, vertical, diagonal)
+        if len(_GRADIENT_CACHE) >= 32:
+            _GRADIENT_CACHE.clear()
+        _GRADIENT_CACHE[key] = gradient_surface
+    surface.blit(gradient_surface, rect)
+
+
+def _make_gradient(
+        width: int,
+        height: int,
+        colors: Tuple[Tuple3IntType, ...],
+        vertical: bool,
+        diagonal: bool
+) -> 'pygame.Surface':
+    """
+    Create a gradient surface. The colors are computed for a single strip,
+    which is scaled to the surface size, or shifted on each row if diagonal.
+
+    :param width: Surface width
+    :param height: Surface height
+    :param colors: Gradient colors (r, g, b), evenly spaced
+    :param vertical: Vertical gradient
+    :param diagonal: Diagonal gradient
+    :return: Gradient surface
+    """
+    if diagonal:
+        n = width + height - 1
+    elif vertical:
+        n = height
     else:
-        b, a = color, gradient
-    rate = (
-        float(b[0] - a[0]) / h,
-        float(b[1] - a[1]) / h,
-        float(b[2] - a[2]) / h
-    )
-    fn_line = pygame.draw.line
-    if vertical:
-        for line in range(y1, y2):
-            color = (
-                min(max(a[0] + (rate[0] * (line - y1)), 0), 255),
-                min(max(a[1] + (rate[1] * (line - y1)), 0), 255),
-                min(max(a[2] + (rate[2] * (line - y1)), 0), 255)
-            )
-            fn_line(surface, color, (x1, line), (x2, line))
+        n = width
+
+    # Compute the strip colors
+    last = len(colors) - 1
+    strip = bytearray()
+    for i in range(n):
+        t = i * last / (n - 1) if n > 1 else 0
+        k = min(int(t), last - 1)
+        f = t - k
+        c0, c1 = colors[k], colors[k + 1]
+        strip.extend(int(round(c0[j] + (c1[j] - c0[j]) * f)) for j in range(3))
+    strip = bytes(strip)
+
+    if diagonal:
+        line = pygame.image.fromstring(strip, (n, 1), 'RGB')
+        gradient_surface = pygame.Surface((width, height))
+        for y in range(height):  # Each row is the strip shifted by one pixel
+            gradient_surface.blit(line, (0, y), (y, 0, width, 1))
+    elif vertical:
+        line = pygame.image.fromstring(strip, (1, n), 'RGB')
+        gradient_surface = pygame.transform.scale(line, (width, height))
     else:
-        for col in range(x1, x2):
-            color = (
-                min(max(a[0] + (rate[0] * (col - x1)), 0), 255),
-                min(max(a[1] + (rate[1] * (col - x1)), 0), 255),
-                min(max(a[2] + (rate[2] * (col - x1)), 0), 255)
-            )
-            fn_line(surface, color, (col, y1), (col, y2))
+        line = pygame.image.fromstring(strip, (n, 1), 'RGB')
+        gradient_surface = pygame.transform.scale(line, (width, height))
+    return convert_surface(gradient_surface)
 
 
 def format_color(
@@ -313,6 +448,19 @@ def format_color(
     return c.r, c.g, c.b, c.a
 
 
+def get_display_format() -> Optional[Tuple[int, Tuple4IntType]]:
+    """
+    Return the pixel format of the display surface, that is, the bitsize and the
+    color masks. It changes if the display mode is set with another format.
+
+    :return: Display format, ``None`` if the display mode has not been set
+    """
+    display = pygame.display.get_surface()
+    if display is None:
+        return None
+    return display.get_bitsize(), display.get_masks()
+
+
 def get_finger_pos(menu: 'pygame_menu.Menu', event: EventType) -> Tuple2IntType:
     """
     Return the position from finger (or mouse) event on x-axis and y-axis.
@@ -330,6 +478,15 @@ def get_finger_pos(menu: 'pygame_menu.Menu', event: EventType) -> Tuple2IntType:
     return event.pos
 
 
+def get_surface_pool() -> 'SurfacePool':
+    """
+    Return the surface pool used by the widgets.
+
+    :return: Surface pool
+    """
+    return _SURFACE_POOL
+
+
 def is_callable(func: Any) -> bool:
     """
     Return ``True`` if ``func`` is callable.
@@ -359,6 +516,7 @@ def make_surface(width: NumberType, height: NumberType,
     assert width >= 0 and height >= 0, \
         'surface width and height must be equal or greater than zero'
     surface = pygame.Surface((int(width), int(height)), pygame.SRCALPHA, 32)  # lgtm [py/call/wrong-arguments]
+    _SURFACE_POOL.allocated += 1
     if alpha:
         # noinspection PyArgumentList
         surface = pygame.Surface.convert_alpha(surface)
@@ -414,6 +572,17 @@ def parse_padding(padding: PaddingType) -> Tuple4IntType:
             return padding[0], padding[1], padding[2], padding[3]
 
 
+def release_surface(surface: Optional['pygame.Surface']) -> None:
+    """
+    Returns a surface borrowed by :py:meth:`pygame_menu.utils.borrow_surface`
+    to the pool. Surfaces that were not borrowed from the pool are ignored.
+
+    :param surface: Surface to release. The surface must not be used after this call
+    :return: None
+    """
+    _SURFACE_POOL.release(surface)
+
+
 def set_pygame_cursor(cursor: CursorInputType) -> None:
     """
     Set pygame cursor.
@@ -430,14 +599,56 @@ def set_pygame_cursor(cursor: CursorInputType) -> None:
         warnings.warn(msg)
 
 
+def set_random_uuid(random: bool) -> None:
+    """
+    Set the mode used by :py:meth:`pygame_menu.utils.uuid4`. By default the ids
+    are sequential, which are unique within the process and much faster to create.
+    If ``True``, the ids are created from random ``uuid.uuid4()`` values.
+
+    :param random: Use random uuid
+    :return: None
+    """
+    assert isinstance(random, bool)
+    _UUID_RANDOM[0] = random
+
+
 def uuid4(short: bool = False) -> str:
     """
-    Create custom version of uuid4.
+    Create custom version of uuid4. The ids are sequential within the process,
+    unless the random mode is set by :py:meth:`pygame_menu.utils.set_random_uuid`.
 
-    :param short: If ``True`` only returns the first 8 chars of the uuid, else, 18
+    :param short: If ``True`` only returns 8 chars, else, 18
     :return: UUID of 18 chars
     """
-    return str(uuid.uuid4())[:18 if not short else 8]
+    if _UUID_RANDOM[0]:
+        return str(uuid.uuid4())[:18 if not short else 8]
+    if short:
+        return '{0:08x}'.format(next(_UUID_COUNTER))
+    return '{0}-{1:09x}'.format(_UUID_PREFIX, next(_UUID_COUNTER))
+
+
+def wait_events(timeout: Optional[int] = None) -> EventListType:
+    """
+    Wait until an event arrives or the timeout elapses, and return all the
+    events in the queue. Unlike polling ``pygame.event.get()`` in a loop, the
+    process sleeps while waiting.
+
+    :param timeout: Maximum waiting time (ms). If ``None`` waits until an event arrives, if ``0`` it does not wait
+    :return: Event list, empty if the timeout elapsed without events
+    """
+    if timeout == 0:
+        return pygame.event.get()
+    if timeout is None:
+        events = [pygame.event.wait()]
+    elif PYGAME_V2:
+        assert timeout > 0, 'timeout cannot be negative'
+        events = [pygame.event.wait(int(timeout))]
+    else:
+        pygame.time.wait(int(timeout))
+        events = []
+    events = [e for e in events if e.type != pygame.NOEVENT]
+    events.extend(pygame.event.get())
+    return events
 
 
 def widget_terminal_title(
@@ -510,6 +721,139 @@ def widget_terminal_title(
     return w_title
 
 
+class SurfacePool(object):
+    """
+    Pool of surfaces. Widgets borrow a surface each time they are rendered
+    instead of allocating a new one; the pooled surfaces are grouped by size
+    bucket and flags, and the borrowed surface is a subsurface of the pooled
+    one with the requested size.
+
+    :param bucket: Size bucket (px). The pooled surface sizes are rounded up to a multiple of this value
+    :param max_free: Max number of free surfaces kept within each bucket
+    """
+    _bucket: int
+    _free: Dict[Tuple[int, int, bool], List['pygame.Surface']]
+    _max_free: int
+    _pooled: 'weakref.WeakKeyDictionary'
+    allocated: int
+    borrowed: int
+    detached: int
+    released: int
+    reused: int
+
+    def __init__(self, bucket: int = 32, max_free: int = 4) -> None:
+        assert isinstance(bucket, int) and bucket > 0, 'bucket must be an integer greater than zero'
+        assert isinstance(max_free, int) and max_free >= 0, 'max_free must be an integer equal or greater than zero'
+        self._bucket = bucket
+        self._free = {}
+        self._max_free = max_free
+        self._pooled = weakref.WeakKeyDictionary()  # Pooled surface => key
+
+        # Counters
+        self.allocated = 0  # Surfaces created by make_surface, including the pool misses
+        self.borrowed = 0
+        self.detached = 0
+        self.released = 0
+        self.reused = 0
+
+    def _get_key(self, width: int, height: int, alpha: bool) -> Tuple[int, int, bool]:
+        """
+        Return the pool key of the given surface size.
+
+        :param width: Surface width
+        :param height: Surface height
+        :param alpha: Alpha flag
+        :return: Key (bucket width, bucket height, alpha)
+        """
+        b = self._bucket
+        return -(-width // b) * b, -(-height // b) * b, alpha
+
+    def borrow(self, width: NumberType, height: NumberType,
+               alpha: bool = False, fill_color: Optional[ColorInputType] = None) -> 'pygame.Surface':
+        """
+        Borrow a surface.
+
+        :param width: Surface width
+        :param height: Surface height
+        :param alpha: Enable alpha channel on surface
+        :param fill_color: Fill surface with a certain color
+        :return: Pygame surface
+        """
+        assert isinstance(width, NumberInstance)
+        assert isinstance(height, NumberInstance)
+        assert isinstance(alpha, bool)
+        assert width >= 0 and height >= 0, \
+            'surface width and height must be equal or greater than zero'
+        width, height = int(width), int(height)
+        key = self._get_key(width, height, alpha)
+        free = self._free.get(key)
+        reused = bool(free)
+        if reused:
+            pooled = free.pop()
+            self.reused += 1
+        else:
+            pooled = make_surface(key[0], key[1], alpha=alpha)
+            self._pooled[pooled] = key
+        self.borrowed += 1
+        surface = pooled.subsurface((0, 0, width, height))
+        if fill_color is not None:
+            surface.fill(assert_color(fill_color))
+        elif reused:  # Reused surfaces must be cleared
+            surface.fill((0, 0, 0, 0))
+        return surface
+
+    def clear(self) -> None:
+        """
+        Remove all the free surfaces from the pool.
+
+        :return: None
+        """
+        self._free.clear()
+
+    def detach(self, surface: Optional['pygame.Surface']) -> None:
+        """
+        Detach a borrowed surface from the pool. The surface is no longer
+        returned to the pool by :py:meth:`pygame_menu.utils.SurfacePool.release`.
+
+        :param surface: Surface to detach
+        :return: None
+        """
+        if surface is None or surface.get_parent() is None:
+            return
+        if self._pooled.pop(surface.get_parent(), None) is not None:
+            self.detached += 1
+
+    def get_free(self) -> int:
+        """
+        Return the number of free surfaces within the pool.
+
+        :return: Number of free surfaces
+        """
+        return sum(len(free) for free in self._free.values())
+
+    def release(self, surface: Optional['pygame.Surface']) -> None:
+        """
+        Return a borrowed surface to the pool. Surfaces that were not borrowed
+        from the pool are ignored.
+
+        :param surface: Surface to release. The surface must not be used after this call
+        :return: None
+        """
+        if surface is None:
+            return
+        pooled = surface.get_parent()
+        if pooled is None:
+            return
+        key = self._pooled.get(pooled)
+        if key is None:
+            return
+        free = self._free.setdefault(key, [])
+        if len(free) >= self._max_free or any(f is pooled for f in free):
+            return
+        free.append(pooled)
+        self.released += 1
+
+
 class TerminalColors(object):
     """
     Terminal colors.
@@ -528,3 +872,6 @@ class TerminalColors(object):
     MAGENTA = '\u001b[35m'
     RED = '\u001b[31m'
     UNDERLINE = '\033[4m'
+
+
+_SURFACE_POOL = SurfacePool()
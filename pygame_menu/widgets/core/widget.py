@@ -51,17 +51,21 @@ import pygame_menu
 
 from pygame_menu._base import Base
 from pygame_menu._decorator import Decorator
+# noinspection PyProtectedMember
+from pygame_menu.controls import _DEFAULT_CONTROLLER
 from pygame_menu.font import FontType
 from pygame_menu.locals import POSITION_NORTHWEST, POSITION_SOUTHWEST, POSITION_WEST, POSITION_EAST, \
     POSITION_NORTHEAST, POSITION_CENTER, POSITION_NORTH, POSITION_SOUTH, POSITION_SOUTHEAST, ALIGN_CENTER
 from pygame_menu.sound import Sound
 from pygame_menu.utils import make_surface, assert_alignment, assert_color, assert_position, assert_vector, \
-    is_callable, parse_padding, uuid4, mouse_motion_current_mouse_position, PYGAME_V2, set_pygame_cursor
+    borrow_surface, detach_surface, is_callable, parse_padding, uuid4, mouse_motion_current_mouse_position, \
+    PYGAME_V2, set_pygame_cursor
 from pygame_menu.widgets.core.selection import Selection
 
 from pygame_menu._types import Optional, ColorType, Tuple2IntType, NumberType, PaddingType, Union, \
     List, Tuple, Any, CallbackType, Dict, Callable, Tuple4IntType, Tuple2BoolType, Tuple3IntType, \
-    NumberInstance, ColorInputType, EventType, EventVectorType, EventListType, CursorInputType, CursorType
+    NumberInstance, ColorInputType, EventType, EventVectorType, EventListType, CursorInputType, CursorType, \
+    FrozenSet
 
 # This list stores the current widget which requested the mouseover status, and the previous
 # widget list which requested the mouseover. Each time the widget changes the over status, if leaves
@@ -69,6 +73,9 @@ from pygame_menu._types import Optional, ColorType, Tuple2IntType, NumberType, P
 # [..., [widget, previous_cursor, [previous_widget, previous_cursor2, [....]
 WIDGET_MOUSEOVER: List[Any] = [None, []]
 
+# Joy events, these are controlled by the widget joystick status
+_JOY_EVENTS = (pygame.JOYAXISMOTION, pygame.JOYBUTTONDOWN, pygame.JOYBUTTONUP, pygame.JOYHATMOTION)
+
 # Stores the top cursor for validation
 WIDGET_TOP_CURSOR: List[Any] = [None]
 WIDGET_TOP_CURSOR_WARNING = False
@@ -199,6 +206,11 @@ class Widget(Base):
 
         Widget cannot be copied or deepcopied.
 
+    .. note::
+
+        Widgets use ``__slots__``, thus, new attributes cannot be added to the
+        objects. Use :py:meth:`pygame_menu._base.Base.set_attribute` to store custom data.
+
     :param title: Widget title
     :param widget_id: Widget identifier
     :param onchange: Callback when updating the status of the widget, executed in :py:meth:`pygame_menu.widgets.core.widget.Widget.change`
@@ -207,7 +219,22 @@ class Widget(Base):
     :param args: Optional arguments for callbacks
     :param kwargs: Optional keyword arguments
     """
+    __slots__ = ('_alignment', '_alpha', '_angle', '_args', '_background_color', '_background_inflate', '_background_surface',
+                 '_border_color', '_border_inflate', '_border_width', '_col_row_index', '_cursor', '_decorator',
+                 '_default_value', '_draw_callbacks', '_events', '_flip', '_floating', '_font', '_font_antialias',
+                 '_font_background_color', '_font_color', '_font_name', '_font_readonly_color',
+                 '_font_readonly_selected_color', '_font_selected_color', '_font_shadow', '_font_shadow_color',
+                 '_font_shadow_offset', '_font_shadow_position', '_font_shadow_tuple', '_font_size', '_frame',
+                 '_joystick_enabled', '_keyboard_enabled', '_kwargs', '_last_render_hash', '_margin', '_max_height',
+                 '_max_width', '_menu', '_mouse_enabled', '_mouseover', '_mouseover_called', '_mouseover_check_rect',
+                 '_onchange', '_onmouseleave', '_onmouseover', '_onreturn', '_onselect', '_padding',
+                 '_padding_transform', '_position', '_rect', '_rect_size_delta', '_scale', '_scrollarea', '_selected',
+                 '_selection_effect', '_selection_effect_draw_post', '_selection_time', '_sound', '_surface',
+                 '_tab_size', '_title', '_touchscreen_enabled', '_translate', '_translate_virtual', '_update_callbacks',
+                 '_visible', 'active', 'configured', 'force_menu_draw_focus', 'is_scrollable', 'is_selectable',
+                 'last_surface', 'lock_position', 'readonly', 'selection_expand_background')
     _alignment: str
+    _alpha: int
     _angle: NumberType
     _args: List[Any]
     _background_color: Optional[Union[ColorType, 'pygame_menu.BaseImage']]
@@ -218,9 +245,9 @@ class Widget(Base):
     _border_width: int
     _col_row_index: Tuple3IntType
     _cursor: CursorType
-    _decorator: 'Decorator'
+    _decorator: Optional['Decorator']  # Created on first get_decorator() call
     _default_value: Any
-    _draw_callbacks: Dict[str, Callable[['Widget', 'pygame_menu.Menu'], Any]]
+    _draw_callbacks: Optional[Dict[str, Callable[['Widget', 'pygame_menu.Menu'], Any]]]  # Created on first callback
     _events: EventListType
     _flip: Tuple2BoolType
     _floating: bool
@@ -240,6 +267,7 @@ class Widget(Base):
     _font_size: int
     _frame: Optional['pygame_menu.widgets.Frame']
     _joystick_enabled: bool
+    _keyboard_enabled: bool
     _kwargs: Dict[Any, Any]
     _last_render_hash: int
     _margin: Tuple2IntType
@@ -273,7 +301,7 @@ class Widget(Base):
     _touchscreen_enabled: bool
     _translate: Tuple2IntType  # Translation made by user
     _translate_virtual: Tuple2IntType  # Virtual translation applied by api
-    _update_callbacks: Dict[str, Callable[['Widget', 'pygame_menu.Menu'], Any]]
+    _update_callbacks: Optional[Dict[str, Callable[['Widget', 'pygame_menu.Menu'], Any]]]  # Created on first callback
     _visible: bool
     active: bool
     configured: bool
@@ -305,7 +333,7 @@ class Widget(Base):
         self._background_surface = None
         self._col_row_index = (-1, -1, -1)
         self._cursor = None
-        self._decorator = Decorator(self)
+        self._decorator = None
         self._default_value = _WidgetNoValue()
         self._events = []
         self._floating = False  # If True, the widget don't contribute width/height to the Menu widget positioning computation. Use .set_float() to modify this status
@@ -330,6 +358,7 @@ class Widget(Base):
         self._mouseover_check_rect = lambda: self.get_rect(to_real_position=True)
 
         # Widget transforms
+        self._alpha = 255  # Transparency of the widget surface
         self._angle = 0  # Rotation angle (degrees)
         self._flip = (False, False)  # x, y
         self._scale = [False, 1, 1, False]  # do_scale, x, y, smooth
@@ -346,8 +375,8 @@ class Widget(Base):
         self._rect_size_delta = (0, 0)  # Size added to rect width/height
 
         # Callbacks
-        self._draw_callbacks = {}
-        self._update_callbacks = {}
+        self._draw_callbacks = None
+        self._update_callbacks = None
 
         self.set_onchange(onchange)  # lgtm [py/init-calls-subclass]
         self.set_onmouseleave(onmouseleave)  # lgtm [py/init-calls-subclass]
@@ -783,7 +812,8 @@ class Widget(Base):
             # Menu _widget_surface_cache_need_update property is only accessed on
             # draw method. This does not set _menu._widgets_surface to None
             self._menu._widget_surface_cache_need_update = True
-            self._decorator.force_cache_update()
+            if self._decorator is not None:
+                self._decorator.force_cache_update()
         return self
 
     def render(self) -> Optional[bool]:
@@ -1106,6 +1136,7 @@ class Widget(Base):
             5. Widget selection effect (if post)
             6. Widget border
             7. ``post`` decorator
+            8. Widget overlay, if the Widget is not drawn within the Menu widgets surface
 
         :param surface: Surface to draw
         :return: Self reference
@@ -1124,14 +1155,23 @@ class Widget(Base):
             self._selection_effect.draw(surface, self)
 
         self._draw_background_color(surface)
-        self._decorator.draw_prev(surface)
-        self._draw(surface)
-        self._draw_border(surface)
-        self._decorator.draw_post(surface)
+        if self._decorator is None:
+            self._draw_alpha(surface)
+            self._draw_border(surface)
+        else:
+            self._decorator.draw_prev(surface)
+            self._draw_alpha(surface)
+            self._draw_border(surface)
+            self._decorator.draw_post(surface)
 
         if self.is_selected() and self._selection_effect_draw_post:
             self._selection_effect.draw(surface, self)
 
+        # The Menu draws the overlay after its widgets surface, as the overlay is not
+        # stored within the surface cache
+        if self._menu is None or not self._menu._drawing_widgets_surface:
+            self._draw_overlay(surface, (0, 0))
+
         # Apply callbacks
         self.apply_draw_callbacks()
 
@@ -1150,6 +1190,72 @@ class Widget(Base):
         """
         return self
 
+    def draw_overlay(self, surface: 'pygame.Surface') -> 'Widget':
+        """
+        Draw the Widget overlay on a given surface, for example, the blinking cursor
+        of a text input. The overlay is drawn by the Menu after its widgets surface,
+        thus, it is not stored within the Menu surface cache and can change on each
+        frame without forcing the cache to update. If the Widget is drawn outside
+        the Menu widgets surface, :py:meth:`pygame_menu.widgets.core.widget.Widget.draw`
+        also draws the overlay.
+
+        .. note::
+
+            The overlay is drawn at the real position of the Widget (the one considering the
+            scrolling offsets), and it is clipped by the visible area of its ScrollArea. If
+            the Widget does not have a ScrollArea, the overlay is drawn at the Widget position.
+
+        :param surface: Surface to draw
+        :return: Self reference
+        """
+        if not self.is_visible():
+            return self
+        if self._scrollarea is None:
+            self._draw_overlay(surface, (0, 0))
+            return self
+        clip = surface.get_clip()
+        surface.set_clip(self._scrollarea.get_absolute_view_rect().clip(clip))
+        self._draw_overlay(surface, self._scrollarea.to_real_position((0, 0)))
+        surface.set_clip(clip)
+        return self
+
+    def _draw_overlay(self, surface: 'pygame.Surface', offset: Tuple2IntType) -> None:
+        """
+        Draw the Widget overlay on a given surface. By default, Widgets do not have
+        an overlay.
+
+        :param surface: Surface to draw
+        :param offset: Offset (x, y) from the Widget position (world) to the real position within the surface
+        :return: None
+        """
+        pass
+
+    def _get_overlay_key(self) -> Optional[Tuple[Any, ...]]:
+        """
+        Return the key of the Widget overlay status, that is, the overlay drawn
+        by :py:meth:`pygame_menu.widgets.core.widget.Widget._draw_overlay` does not
+        change while the key remains the same.
+
+        :return: Overlay key, ``None`` if the overlay may change on each frame
+        """
+        return None
+
+    def _draw_alpha(self, surface: 'pygame.Surface') -> None:
+        """
+        Draw the Widget on a given surface, applying the transparency to the
+        Widget surface.
+
+        :param surface: Surface to draw
+        :return: None
+        """
+        if self._alpha == 255 or self._surface is None:
+            self._draw(surface)
+            return
+        alpha = self._surface.get_alpha()
+        self._surface.set_alpha(self._alpha)
+        self._draw(surface)
+        self._surface.set_alpha(alpha)
+
     def _draw(self, surface: 'pygame.Surface') -> None:
         """
         Draw the Widget on a given surface.
@@ -1437,8 +1543,8 @@ class Widget(Base):
         """
         text = self._font_render_string(string, color)
 
-        # Create surface
-        surface = make_surface(
+        # Borrow the surface from the pool, it is returned by the widget on the next render
+        surface = borrow_surface(
             width=text.get_width(),
             height=text.get_height(),
             alpha=True
@@ -1459,13 +1565,23 @@ class Widget(Base):
         :param check_selection: If ``True`` font is also checked if selected
         :return: Color by widget status
         """
+        return getattr(self, self._get_font_color_status_name(check_selection))
+
+    def _get_font_color_status_name(self, check_selection: bool = True) -> str:
+        """
+        Return the name of the attribute that stores the Widget font color based
+        on the widget status.
+
+        :param check_selection: If ``True`` font is also checked if selected
+        :return: Attribute name
+        """
         if self.readonly:
             if self._selected:
-                return self._font_readonly_selected_color
-            return self._font_readonly_color
+                return '_font_readonly_selected_color'
+            return '_font_readonly_color'
         if self._selected and check_selection:
-            return self._font_selected_color
-        return self._font_color
+            return '_font_selected_color'
+        return '_font_color'
 
     def set_font(
             self,
@@ -2031,6 +2147,33 @@ class Widget(Base):
             return self._translate_virtual
         return self._translate
 
+    def set_alpha(self, alpha: int) -> 'Widget':
+        """
+        Set the transparency of the Widget surface (the text or the image). The
+        background, border, decorations and selection effect are not affected.
+
+        .. note::
+
+            Unlike the transformations, the transparency does not render the Widget
+            again, thus, it is applied on the next Menu draw.
+
+        :param alpha: Transparency, from ``0`` (transparent) to ``255`` (opaque)
+        :return: Self reference
+        """
+        assert isinstance(alpha, int)
+        assert 0 <= alpha <= 255, 'alpha must be between 0 and 255'
+        self._alpha = alpha
+        self.force_menu_surface_cache_update()
+        return self
+
+    def get_alpha(self) -> int:
+        """
+        Return the transparency of the Widget surface.
+
+        :return: Transparency, from ``0`` (transparent) to ``255`` (opaque)
+        """
+        return self._alpha
+
     def rotate(self, angle: NumberType) -> 'Widget':
         """
         Transformation: Unfiltered counterclockwise rotation. The angle argument represents degrees
@@ -2160,8 +2303,14 @@ class Widget(Base):
 
             Use with caution.
 
+        .. note::
+
+            The returned surface is detached from the surface pool, thus, it
+            is not overwritten if the Widget is rendered again.
+
         :return: Widget surface object
         """
+        detach_surface(self._surface)
         return self._surface
 
     def get_width(self, apply_padding: bool = True, apply_selection: bool = False) -> int:
@@ -2266,6 +2415,74 @@ class Widget(Base):
         self._keyboard_enabled = keyboard
         return self
 
+    def _get_action(self, event: EventType) -> Optional[str]:
+        """
+        Return the action of the event input, for example ``ACTION_APPLY``, using
+        the controller of the Menu.
+
+        :param event: Event
+        :return: Action, ``None`` if the input is not bound, or if the input device is disabled
+        """
+        if event.type in (pygame.KEYDOWN, pygame.KEYUP):
+            if not self._keyboard_enabled:
+                return None
+        elif event.type in _JOY_EVENTS:
+            if not self._joystick_enabled:
+                return None
+        else:
+            return None
+        return self._get_controller().get_action(event)
+
+    def _get_controller(self) -> 'pygame_menu.controls.Controller':
+        """
+        Return the controller of the Menu, or the default controller if the widget
+        has not been added to a Menu.
+
+        :return: Controller
+        """
+        return _DEFAULT_CONTROLLER if self._menu is None else self._menu.get_controller()
+
+    def get_event_types(self) -> Optional[FrozenSet[int]]:
+        """
+        Return the event types consumed by :py:meth:`pygame_menu.widgets.core.widget.Widget.update`.
+        The Menu only provides the events of these types to the widget, thus, custom
+        widgets should override this method if they process a few event types only.
+
+        .. note::
+
+            The event types are used only if the class that defines ``update`` also
+            defines this method. Thus, a subclass that overrides ``update`` but
+            not this method receives all the events.
+
+        :return: Event types. If ``None`` the widget receives all the events
+        """
+        return None
+
+    def _get_update_event_types(self) -> Optional[FrozenSet[int]]:
+        """
+        Return the event types provided to :py:meth:`pygame_menu.widgets.core.widget.Widget.update`.
+        The types declared by :py:meth:`pygame_menu.widgets.core.widget.Widget.get_event_types`
+        are trusted only if the class that defines ``update`` also defines ``get_event_types``.
+
+        :return: Event types. If ``None`` the widget receives all the events
+        """
+        for cls in type(self).__mro__:
+            if 'update' in cls.__dict__:
+                if 'get_event_types' not in cls.__dict__:
+                    return None
+                break
+        return self.get_event_types()
+
+    def _get_idle_timeout(self) -> Optional[int]:
+        """
+        Return the time (ms) until the Widget must be updated and drawn again even
+        if it does not receive any event, for example, to blink a cursor. Used by
+        the Menu mainloop in ``idle`` mode.
+
+        :return: Timeout (ms). If ``None`` the Widget only changes if it receives events
+        """
+        return 0 if len(self._events) > 0 else None
+
     def set_value(self, value: Any) -> None:
         """
         Set the Widget value.
@@ -2364,6 +2581,8 @@ class Widget(Base):
         """
         assert is_callable(draw_callback), 'draw callback must be callable (function-type)'
         callback_id = uuid4()
+        if self._draw_callbacks is None:
+            self._draw_callbacks = {}
         self._draw_callbacks[callback_id] = draw_callback
         return callback_id
 
@@ -2375,7 +2594,7 @@ class Widget(Base):
         :return: Self reference
         """
         assert isinstance(callback_id, str)
-        if callback_id not in self._draw_callbacks.keys():
+        if self._draw_callbacks is None or callback_id not in self._draw_callbacks.keys():
             raise IndexError('callback ID "{0}" does not exist'.format(callback_id))
         del self._draw_callbacks[callback_id]
         return self
@@ -2386,7 +2605,7 @@ class Widget(Base):
 
         :return: Self reference
         """
-        if len(self._draw_callbacks) == 0:
+        if not self._draw_callbacks:
             return self
         for callback in self._draw_callbacks.values():
             callback(self, self._menu)
@@ -2412,6 +2631,8 @@ class Widget(Base):
         """
         assert is_callable(update_callback), 'update callback must be callable (function-type)'
         callback_id = uuid4()
+        if self._update_callbacks is None:
+            self._update_callbacks = {}
         self._update_callbacks[callback_id] = update_callback
         return callback_id
 
@@ -2423,7 +2644,7 @@ class Widget(Base):
         :return: Self reference
         """
         assert isinstance(callback_id, str)
-        if callback_id not in self._update_callbacks.keys():
+        if self._update_callbacks is None or callback_id not in self._update_callbacks.keys():
             raise IndexError('callback<"{0}"> does not exist'.format(callback_id))
         del self._update_callbacks[callback_id]
         return self
@@ -2434,7 +2655,7 @@ class Widget(Base):
 
         :return: Self reference
         """
-        if len(self._update_callbacks) == 0 or self.readonly:
+        if not self._update_callbacks or self.readonly:
             return self
         for callback in self._update_callbacks.values():
             callback(self, self._menu)
@@ -2585,10 +2806,12 @@ class Widget(Base):
 
     def get_decorator(self) -> 'Decorator':
         """
-        Return the Widget decorator API.
+        Return the Widget decorator API. The decorator is created on the first call.
 
         :return: Decorator API
         """
+        if self._decorator is None:
+            self._decorator = Decorator(self)
         return self._decorator
 
     def get_frame(self) -> Optional['pygame_menu.widgets.Frame']:
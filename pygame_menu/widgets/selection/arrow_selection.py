@@ -37,9 +37,7 @@ import pygame_menu
 from pygame_menu.utils import assert_vector
 from pygame_menu.widgets.core import Selection
 
-from pygame_menu._types import NumberType, Tuple2IntType, Optional, NumberInstance
-
-SELECTOR_CLOCK = pygame.time.Clock()
+from pygame_menu._types import NumberType, Tuple2IntType, NumberInstance
 
 
 class ArrowSelection(Selection):
@@ -53,14 +51,14 @@ class ArrowSelection(Selection):
     :param margin_bottom: Bottom margin
     :param arrow_size: Size of arrow on x-axis and y-axis (width, height)
     :param arrow_vertical_offset: Vertical offset of the arrow
-    :param blink_ms: Milliseconds between each blink, if ``0`` blinking is disabled
+    :param blink_ms: Milliseconds between each blink, if ``0`` blinking is disabled. The blinking is scheduled in the Menu timeline, thus, it advances only while the Menu is updated
     """
     _arrow_vertical_offset: int
     _arrow_size: Tuple2IntType
     _blink_ms: NumberType
-    _blink_time: NumberType
+    _blink_selection_time: NumberType
     _blink_status: bool
-    _last_widget: Optional['pygame_menu.widgets.Widget']
+    _blink_timer: int
 
     def __init__(self, margin_left: NumberType, margin_right: NumberType, margin_top: NumberType,
                  margin_bottom: NumberType, arrow_size: Tuple2IntType = (10, 15),
@@ -79,9 +77,9 @@ class ArrowSelection(Selection):
         self._arrow_vertical_offset = int(arrow_vertical_offset)
         self._arrow_size = (arrow_size[0], arrow_size[1])
         self._blink_ms = blink_ms
-        self._blink_time = 0
+        self._blink_selection_time = -1  # Selection time of the widget which blinks
         self._blink_status = True
-        self._last_widget = None
+        self._blink_timer = 0  # Scheduling a new timer invalidates the previous one
 
     # noinspection PyMissingOrEmptyDocstring
     def draw(self, surface: 'pygame.Surface', widget: 'pygame_menu.widgets.Widget') -> 'Selection':
@@ -99,15 +97,44 @@ class ArrowSelection(Selection):
         :param c: Arrow coord C
         :return: None
         """
-        SELECTOR_CLOCK.tick(60)  # As blink is in ms
-        self._blink_time += SELECTOR_CLOCK.get_time()
-
-        # Switch the blinking if the time exceeded or the widget has changed
-        if self._blink_ms != 0 and (self._blink_time > self._blink_ms or self._last_widget != widget):
-            self._blink_status = not self._blink_status or self._last_widget != widget
-            self._blink_time = 0
-            self._last_widget = widget
-
-        # Draw the arrow only if blinking is enabled
+        # Restart the blinking if the widget has been selected since the last draw
+        # noinspection PyProtectedMember
+        if self._blink_ms != 0 and widget._selection_time != self._blink_selection_time:
+            menu = widget.get_menu()
+            if menu is not None:
+                self._blink_selection_time = widget._selection_time
+                self._blink_status = True
+                self._blink_timer += 1
+                self._schedule_blink(menu, widget, self._blink_timer)
+
+        # Draw the arrow only if visible
         if self._blink_status:
             pygame.draw.polygon(surface, self.color, [a, b, c])
+
+    def _schedule_blink(self, menu: 'pygame_menu.Menu', widget: 'pygame_menu.widgets.Widget', timer: int) -> None:
+        """
+        Schedule the next blink within the Menu timeline.
+
+        :param menu: Menu of the widget
+        :param widget: Widget object
+        :param timer: Blink timer
+        :return: None
+        """
+        # noinspection PyProtectedMember
+        menu._timeline.schedule(self._blink_ms, lambda: self._blink(menu, widget, timer))
+
+    def _blink(self, menu: 'pygame_menu.Menu', widget: 'pygame_menu.widgets.Widget', timer: int) -> None:
+        """
+        Toggle the arrow visibility, and request the widget repaint. The blinking
+        stops if the widget is not selected anymore, or if it has been restarted.
+
+        :param menu: Menu of the widget
+        :param widget: Widget object
+        :param timer: Blink timer
+        :return: None
+        """
+        if timer != self._blink_timer or not widget.is_selected() or widget.get_menu() is not menu:
+            return
+        self._blink_status = not self._blink_status
+        widget.force_menu_surface_cache_update()
+        self._schedule_blink(menu, widget, timer)
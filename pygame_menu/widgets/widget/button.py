@@ -34,13 +34,13 @@ __all__ = ['Button']
 import pygame
 import pygame_menu
 
-from pygame_menu.controls import KEY_APPLY, JOY_BUTTON_SELECT
+from pygame_menu.controls import ACTION_APPLY
 from pygame_menu.locals import FINGERUP
-from pygame_menu.utils import is_callable, assert_color
+from pygame_menu.utils import is_callable, assert_color, release_surface
 from pygame_menu.widgets.core import Widget
 
 from pygame_menu._types import Any, CallbackType, Callable, Union, List, Tuple, Optional, ColorType, \
-    ColorInputType, EventVectorType
+    ColorInputType, EventVectorType, FrozenSet
 
 
 # noinspection PyMissingOrEmptyDocstring
@@ -61,6 +61,7 @@ class Button(Widget):
     :param args: Optional arguments for callbacks
     :param kwargs: Optional keyword arguments
     """
+    __slots__ = ('_last_underline', 'to_menu')
     _last_underline: List[Union[str, Optional[Tuple[ColorType, int, int]]]]  # deco id, (color, offset, width)
     to_menu: bool
 
@@ -177,6 +178,7 @@ class Button(Widget):
             return True
 
         # Render surface
+        release_surface(self._surface)
         self._surface = self._render_string(self._title, self.get_font_color_status())
         self._apply_transforms()
         self._rect.width, self._rect.height = self._surface.get_size()
@@ -188,7 +190,7 @@ class Button(Widget):
             h = self._surface.get_height()
             color, offset, width = self._last_underline[1]
             if w > 0 and h > 0:
-                self._last_underline[0] = self._decorator.add_line(
+                self._last_underline[0] = self.get_decorator().add_line(
                     pos1=(-w / 2, h / 2 + offset),
                     pos2=(w / 2, h / 2 + offset),
                     color=color,
@@ -197,6 +199,10 @@ class Button(Widget):
 
         self.force_menu_surface_update()
 
+    def get_event_types(self) -> Optional[FrozenSet[int]]:
+        return frozenset((pygame.ACTIVEEVENT, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION, FINGERUP)) | \
+            self._get_controller().get_event_types()
+
     def update(self, events: EventVectorType) -> bool:
         if self.readonly or not self.is_visible():
             return False
@@ -209,9 +215,7 @@ class Button(Widget):
             self._check_mouseover(event, rect)
 
             # User applies with key
-            if event.type == pygame.KEYDOWN and self._keyboard_enabled and event.key == KEY_APPLY or \
-                    event.type == pygame.JOYBUTTONDOWN and self._joystick_enabled and \
-                    event.button == JOY_BUTTON_SELECT:
+            if self._get_action(event) == ACTION_APPLY:
                 if self.to_menu:
                     self._sound.play_open_menu()
                 else:
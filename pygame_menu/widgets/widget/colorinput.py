@@ -57,7 +57,7 @@ from pygame_menu.utils import check_key_pressed_valid, make_surface
 from pygame_menu.widgets.widget.textinput import TextInput
 
 from pygame_menu._types import Union, List, NumberType, Any, Optional, CallbackType, Literal, \
-    Tuple3IntType, NumberInstance, EventVectorType
+    Tuple3IntType, NumberInstance, EventVectorType, FrozenSet
 
 # Input modes
 COLORINPUT_TYPE_HEX = 'hex'
@@ -117,13 +117,17 @@ class ColorInput(TextInput):  # lgtm [py/missing-call-to-init]
     :param repeat_mouse_interval_ms: Interval between mouse events when held
     :param kwargs: Optional keyword arguments
     """
+    __slots__ = ('_auto_separator_pos', '_color_type', '_dynamic_width', '_hex_format', '_last_b', '_last_g', '_last_r',
+                 '_prev_margin', '_prev_width_factor', '_previsualization_surface', '_separator')
     _auto_separator_pos: List[int]
     _color_type: str
     _dynamic_width: bool
     _hex_format: str
+    _last_b: int
     _last_g: int
     _last_r: int
     _prev_margin: int
+    _prev_width_factor: NumberType
     _previsualization_surface: Optional['pygame.Surface']
     _separator: str
 
@@ -390,6 +394,9 @@ class ColorInput(TextInput):  # lgtm [py/missing-call-to-init]
         elif self._hex_format == COLORINPUT_HEX_FORMAT_UPPER:
             self._input_string = self._input_string.upper()
 
+    def get_event_types(self) -> Optional[FrozenSet[int]]:
+        return super(ColorInput, self).get_event_types()
+
     def update(self, events: EventVectorType) -> bool:
         if self.readonly or not self.is_visible():
             return False
@@ -37,20 +37,19 @@ import math
 import pygame
 import pygame_menu
 
-from pygame_menu.controls import KEY_APPLY, KEY_MOVE_DOWN, KEY_MOVE_UP, JOY_BUTTON_SELECT, JOY_LEFT, \
-    JOY_DEADZONE, JOY_RIGHT, JOY_AXIS_X
+from pygame_menu.controls import ACTION_APPLY, ACTION_LEFT, ACTION_MOVE_DOWN, ACTION_MOVE_UP, ACTION_RIGHT
 from pygame_menu.font import FontType, get_font, assert_font
-from pygame_menu.locals import ORIENTATION_VERTICAL, FINGERDOWN, FINGERUP
-from pygame_menu.utils import check_key_pressed_valid, assert_color, assert_vector, make_surface, \
-    parse_padding, get_finger_pos, uuid4, assert_cursor
+from pygame_menu.locals import ORIENTATION_HORIZONTAL, ORIENTATION_VERTICAL, FINGERDOWN, FINGERUP
+from pygame_menu.utils import check_key_pressed_valid, assert_color, assert_vector, \
+    parse_padding, get_finger_pos, uuid4, assert_cursor, borrow_surface, release_surface
 from pygame_menu.widgets.core import Widget
 from pygame_menu.widgets.widget.button import Button
 from pygame_menu.widgets.widget.frame import Frame
-from pygame_menu.widgets.widget.selector import check_selector_items
+from pygame_menu.widgets.widget.selector import check_selector_items, _SelectorItemsIndex
 
 from pygame_menu._types import Tuple, Union, List, Any, Optional, CallbackType, ColorType, Dict, \
     ColorInputType, Tuple2IntType, Tuple3IntType, PaddingType, PaddingInstance, Tuple4IntType, \
-    NumberType, EventVectorType, Tuple2NumberType, CursorInputType, CursorType
+    NumberType, EventVectorType, Tuple2NumberType, CursorInputType, CursorType, EventType, FrozenSet
 
 
 # noinspection PyMissingOrEmptyDocstring
@@ -112,15 +111,32 @@ class DropSelect(Widget):
     :param selection_option_selected_font_color: Selected option font color
     :param kwargs: Optional keyword arguments
     """
+    __slots__ = ('_close_on_apply', '_drop_frame', '_index', '_items', '_items_index', '_open_bottom', '_open_middle',
+                 '_opened', '_option_buttons', '_option_buttons_offset', '_option_buttons_row_height',
+                 '_option_buttons_width', '_option_font', '_option_max_width', '_placeholder',
+                 '_placeholder_add_to_selection_box',
+                 '_selection_box_arrow_color', '_selection_box_arrow_margin', '_selection_box_bgcolor',
+                 '_selection_box_border_color', '_selection_box_border_width', '_selection_box_height',
+                 '_selection_box_inflate', '_selection_box_margin', '_selection_box_text_margin',
+                 '_selection_box_width', '_selection_drop_kwargs', '_selection_infinite',
+                 '_selection_option_border_color', '_selection_option_border_width', '_selection_option_cursor',
+                 '_selection_option_font_style', '_selection_option_left_space',
+                 '_selection_option_left_space_height_factor', '_selection_option_left_space_margin',
+                 '_selection_option_padding', '_selection_option_selected_bgcolor', '_theme', '_title_size')
     _close_on_apply: bool
     _drop_frame: Optional['Frame']
     _index: int
     _items: Union[List[Tuple[Any, ...]], List[str]]
+    _items_index: '_SelectorItemsIndex'
     _open_bottom: bool
     _open_middle: bool
     _opened: bool
     _option_buttons: List['Button']
+    _option_buttons_offset: int
+    _option_buttons_row_height: int
+    _option_buttons_width: int
     _option_font: Optional['pygame.font.Font']
+    _option_max_width: int
     _placeholder: str
     _placeholder_add_to_selection_box: bool
     _selection_box_arrow_color: ColorType
@@ -133,6 +149,7 @@ class DropSelect(Widget):
     _selection_box_margin: Tuple2IntType
     _selection_box_text_margin: int
     _selection_box_width: int
+    _selection_drop_kwargs: Dict[str, Any]
     _selection_infinite: bool
     _selection_option_border_color: ColorType
     _selection_option_border_width: int
@@ -235,10 +252,17 @@ class DropSelect(Widget):
         self._drop_frame = None
         self._index = default
         self._items = items.copy()
+        self._items_index = _SelectorItemsIndex(self._items)
         self._open_bottom = True
         self._open_middle = open_middle
+        self._option_buttons = []
+        self._option_buttons_offset = 0
+        self._option_buttons_row_height = 0
+        self._option_buttons_width = 0
+        self._option_max_width = 0  # Width of the widest option row measured, rows are measured when bound
         self._placeholder = placeholder
         self._placeholder_add_to_selection_box = placeholder_add_to_selection_box
+        self._selection_drop_kwargs = {}
         self._selection_effect_draw_post = False
         self._theme = None
         self._title_size = (0, 0)
@@ -307,6 +331,7 @@ class DropSelect(Widget):
             self._selection_option_font_style['size'] = int(self._font_size)
         self._option_font = get_font(self._selection_option_font_style['name'],
                                      self._selection_option_font_style['size'])
+        self._option_max_width = 0
         if self._selection_box_width == 0:
             f = self._render_option_string(self._placeholder)
             h = self._render_string(self._title, self.get_font_color_status()).get_height()
@@ -344,76 +369,30 @@ class DropSelect(Widget):
                 raise RuntimeError('{0} theme must be defined')
         scrollbar_thickness = kwargs.get('scrollbar_thick', self._theme.scrollbar_thick)
 
-        # Create options buttons
-        total_height = 0
-        max_height = 0
-        frame_width = self._selection_box_width + self._selection_box_inflate[0]
-        self._option_buttons = []
+        self._selection_drop_kwargs = kwargs
 
-        # Add placeholder button
+        # Create the option buttons. Only the rows within the visible window are
+        # created, these are recycled (bound to other items) while scrolling
+        frame_width = self._selection_box_width + self._selection_box_inflate[0]
         if self._placeholder_add_to_selection_box:
-            self._items.insert(0, (self._placeholder, -1))
-
-        for opt_id in range(len(self._items)):
-            option = self._items[opt_id]
-            btn = Button(option[0],
-                         onreturn=self._click_option,
-                         index=opt_id - (1 if self._placeholder_add_to_selection_box else 0),
-                         button_id=self._id + '+option-' + uuid4(short=True))
-            btn.set_background_color(
-                color=self._selection_box_bgcolor
-            )
-            btn.set_border(
-                width=self._selection_option_border_width,
-                color=self._selection_option_border_color
-            )
-            btn.set_controls(
-                joystick=False,  # Only drop select controls the joystick behaviour
-                mouse=self._mouse_enabled,
-                touchscreen=self._touchscreen_enabled,
-                keyboard=False  # Only drop select controls the keyboard behaviour
-            )
-            btn.set_cursor(
-                cursor=self._selection_option_cursor
-            )
-            if self._placeholder_add_to_selection_box:
-                font_color = self._selection_option_font_style['color'] if opt_id != 0 else self._font_readonly_color
-            else:
-                font_color = self._selection_option_font_style['color']
-            btn.set_font(
-                antialias=self._font_antialias,
-                background_color=None,
-                color=font_color,
-                font=self._selection_option_font_style['name'],
-                font_size=self._selection_option_font_style['size'],
-                readonly_color=self._font_readonly_color,
-                readonly_selected_color=self._font_readonly_selected_color,
-                selected_color=self._font_selected_color
-            )
-            btn.set_padding(
-                padding=self._selection_option_padding
-            )
-            btn.add_self_to_kwargs('btn')
-            btn.set_tab_size(self._tab_size)
-            btn.configured = True
-            btn.set_menu(self._menu)
-            btn._update__repr___(self)
-
-            self._option_buttons.append(btn)
-
-            bh = btn.get_height() - self._selection_option_border_width
-            if self._selection_option_left_space and not (self._placeholder_add_to_selection_box and opt_id == 0):
-                prev_pad = btn._padding  # top, right, bottom, left
-                prev_pad_t: Tuple4IntType = btn._padding_transform
-                dh = int(btn.get_height(apply_padding=False) * self._selection_option_left_space_height_factor)
-                btn.set_attribute('left_space_height', dh)
-                m = self._selection_option_left_space_margin
-                btn._padding = prev_pad[0], prev_pad[1], prev_pad[2], prev_pad[3] + dh + m[0] + m[1]
-                btn._padding_transform = prev_pad_t[0], prev_pad_t[1], prev_pad_t[2], prev_pad_t[3] + dh + m[0] + m[1]
-
-            total_height += bh
-            if opt_id + 1 <= self._selection_box_height:
-                max_height += bh
+            placeholder_button = self._make_option_button(-1)
+        else:
+            placeholder_button = None
+        self._option_buttons = []
+        self._option_buttons_offset = 0
+        for opt_id in range(min(len(self._items), self._selection_box_height + 1)):
+            self._option_buttons.append(self._make_option_button(opt_id))
+
+        # All rows share the same height, thus, the size of the frame is computed
+        # without creating a button for each item. The world of the frame only
+        # contains the window of rows bound to the buttons
+        rows = self._get_option_rows()
+        if rows > 0:
+            row_button = placeholder_button if placeholder_button is not None else self._option_buttons[0]
+            self._option_buttons_row_height = row_button.get_height() - self._selection_option_border_width
+        total_height = rows * self._option_buttons_row_height
+        max_height = min(rows, self._selection_box_height) * self._option_buttons_row_height
+        window_height = self._get_option_window_rows() * self._option_buttons_row_height
 
         max_width = frame_width
         if total_height != max_height:
@@ -421,29 +400,35 @@ class DropSelect(Widget):
             frame_width -= scrollbar_thickness
             total_height -= self._selection_box_border_width
             max_height -= self._selection_box_border_width
+            window_height -= self._selection_box_border_width
         elif total_height > 0:
             total_height += self._selection_box_border_width
             max_height += self._selection_box_border_width
-        for btn in self._option_buttons:
-            max_width = max(max_width, btn.get_width() - self._selection_option_border_width)
+            window_height += self._selection_box_border_width
 
-        # Update options rect delta width
+        # The widest row is cached, and updated as the rows are bound
+        if placeholder_button is not None:
+            self._option_max_width = max(self._option_max_width,
+                                         placeholder_button.get_width() - self._selection_option_border_width)
         for btn in self._option_buttons:
-            btn._rect_size_delta = (max_width - btn.get_width(), 0)
+            self._option_max_width = max(self._option_max_width,
+                                         btn.get_width() - self._selection_option_border_width)
+        if rows > 0:
+            max_width = max(max_width, self._option_max_width)
+        self._option_buttons_width = max_width
 
-        # Pop placeholder
-        if self._placeholder_add_to_selection_box:
-            self._items.pop(0)
-            placeholder_button = self._option_buttons.pop(0)
-        else:
-            placeholder_button = None
+        # Update options rect delta width
+        if placeholder_button is not None:
+            placeholder_button._rect_size_delta = (max_width - placeholder_button.get_width(), 0)
+        for opt_id in range(len(self._option_buttons)):
+            self._bind_option_button(self._option_buttons[opt_id], opt_id)
 
         # Unpack previous frame (if exists)
         if self._drop_frame is not None:
             self._drop_frame.set_menu(None)
 
         # Create frame
-        self._drop_frame = Frame(max_width, max(total_height, 1), ORIENTATION_VERTICAL,
+        self._drop_frame = Frame(max_width, max(window_height, 1), ORIENTATION_VERTICAL,
                                  frame_id=self._id + '+frame-' + uuid4(short=True))
         self._drop_frame._accepts_title = False
         self._drop_frame.hide()
@@ -481,6 +466,11 @@ class DropSelect(Widget):
                 scrollbars=scrollbars
             )
 
+        # The scrollarea scrolls all the rows, while its world only contains the window
+        virtual = total_height != window_height
+        if virtual:
+            self._drop_frame.get_scrollarea(inner=True).set_world_size((max_width, total_height))
+
         self._drop_frame.set_menu(self._menu)
         self._drop_frame.set_scrollarea(self._scrollarea)
         if self._frame is not None:
@@ -501,6 +491,7 @@ class DropSelect(Widget):
         self._drop_frame.set_attribute('extra_margin',
                                        self._selection_box_border_width if total_height == max_height else 0)
         self._drop_frame.set_attribute('placeholder_button', placeholder_button)
+        self._drop_frame.set_attribute('virtual', virtual)
 
         # Pack options
         if self._placeholder_add_to_selection_box:
@@ -514,6 +505,236 @@ class DropSelect(Widget):
 
         return self
 
+    def _make_option_button(self, index: int) -> 'Button':
+        """
+        Create an option button.
+
+        :param index: Option index within list. If ``-1`` creates the placeholder button
+        :return: Option button
+        """
+        btn = Button(self._placeholder if index == -1 else self._items[index][0],
+                     onreturn=self._click_option,
+                     index=index,
+                     button_id=self._id + '+option-' + uuid4(short=True))
+        btn.set_background_color(
+            color=self._selection_box_bgcolor
+        )
+        btn.set_border(
+            width=self._selection_option_border_width,
+            color=self._selection_option_border_color
+        )
+        btn.set_controls(
+            joystick=False,  # Only drop select controls the joystick behaviour
+            mouse=self._mouse_enabled,
+            touchscreen=self._touchscreen_enabled,
+            keyboard=False  # Only drop select controls the keyboard behaviour
+        )
+        btn.set_cursor(
+            cursor=self._selection_option_cursor
+        )
+        btn.set_font(
+            antialias=self._font_antialias,
+            background_color=None,
+            color=self._font_readonly_color if index == -1 else self._selection_option_font_style['color'],
+            font=self._selection_option_font_style['name'],
+            font_size=self._selection_option_font_style['size'],
+            readonly_color=self._font_readonly_color,
+            readonly_selected_color=self._font_readonly_selected_color,
+            selected_color=self._font_selected_color
+        )
+        btn.set_padding(
+            padding=self._selection_option_padding
+        )
+        btn.add_self_to_kwargs('btn')
+        btn.set_tab_size(self._tab_size)
+        btn.configured = True
+        btn.set_menu(self._menu)
+        btn._update__repr___(self)
+
+        if self._selection_option_left_space and index != -1:
+            prev_pad = btn._padding  # top, right, bottom, left
+            prev_pad_t: Tuple4IntType = btn._padding_transform
+            dh = int(btn.get_height(apply_padding=False) * self._selection_option_left_space_height_factor)
+            btn.set_attribute('left_space_height', dh)
+            m = self._selection_option_left_space_margin
+            btn._padding = prev_pad[0], prev_pad[1], prev_pad[2], prev_pad[3] + dh + m[0] + m[1]
+            btn._padding_transform = prev_pad_t[0], prev_pad_t[1], prev_pad_t[2], prev_pad_t[3] + dh + m[0] + m[1]
+
+        return btn
+
+    def _get_option_rows(self) -> int:
+        """
+        Return the number of rows of the drop frame, including the placeholder.
+
+        :return: Number of rows
+        """
+        return len(self._items) + (1 if self._placeholder_add_to_selection_box else 0)
+
+    def _get_option_window_rows(self) -> int:
+        """
+        Return the number of rows within the world of the drop frame. The window
+        has one row more than the visible ones, as the view can show two partial rows.
+
+        :return: Number of rows
+        """
+        return min(self._get_option_rows(), self._selection_box_height + 1)
+
+    def _bind_option_button(self, btn: 'Button', index: int) -> None:
+        """
+        Bind an option button to the given item.
+
+        :param btn: Option button
+        :param index: Option index within list
+        :return: None
+        """
+        btn._kwargs['index'] = index
+        if btn.get_title() != self._items[index][0]:
+            btn.set_title(self._items[index][0])
+        btn._rect_size_delta = (0, 0)
+        self._option_max_width = max(self._option_max_width, btn.get_width() - self._selection_option_border_width)
+        btn._rect_size_delta = (self._option_buttons_width - btn.get_width(), 0)
+        self._update_option_button(btn, index)
+
+    def _bind_option_buttons(self, row: int, force: bool = False) -> None:
+        """
+        Move the window of the drop frame world to the given row, and bind the
+        option buttons to the items within the window. The margin of the first
+        button places the buttons at the rows of the items.
+
+        :param row: First row of the window, the placeholder is the row ``0`` if added to the selection box
+        :param force: Bind the buttons even if the window has not changed
+        :return: None
+        """
+        scrollarea = self._drop_frame.get_scrollarea(inner=True)
+        placeholder_button: Optional['Button'] = self._drop_frame.get_attribute('placeholder_button')
+        row = max(0, min(int(row), self._get_option_rows() - self._get_option_window_rows()))
+        world_y = row * self._option_buttons_row_height
+        offset = row - (1 if placeholder_button is not None else 0)
+        offset = max(0, min(offset, len(self._items) - len(self._option_buttons)))
+        if offset == self._option_buttons_offset and world_y == scrollarea.get_world_offset()[1] and not force:
+            return
+        self._option_buttons_offset = offset
+        scrollarea.set_world_offset(0, world_y)
+        for b_ind_x in range(len(self._option_buttons)):
+            self._bind_option_button(self._option_buttons[b_ind_x], offset + b_ind_x)
+        if self._option_max_width > self._option_buttons_width:
+            self._update_option_buttons_width()
+
+        # Place the buttons within the window
+        margin = offset * self._option_buttons_row_height - self._selection_option_border_width
+        if placeholder_button is not None:
+            placeholder_button.set_margin(0, -world_y)
+        else:
+            margin -= world_y
+        self._option_buttons[0].set_margin(0, margin)
+        self._drop_frame.update_position()
+        if placeholder_button is not None:
+            placeholder_button.set_position_relative_to_frame()
+        for btn in self._option_buttons:
+            btn.set_position_relative_to_frame()
+
+    def _update_option_buttons_width(self) -> None:
+        """
+        Update the width of the option rows to the widest row measured, resizing
+        the world of the drop frame.
+
+        :return: None
+        """
+        frame = self._drop_frame
+        width = max(frame.get_attribute('width'), self._option_max_width)
+        if width == self._option_buttons_width:
+            return
+        self._option_buttons_width = width
+        placeholder_button: Optional['Button'] = frame.get_attribute('placeholder_button')
+        buttons = self._option_buttons if placeholder_button is None else [placeholder_button] + self._option_buttons
+        for btn in buttons:
+            btn._rect_size_delta = (0, 0)
+            btn._rect_size_delta = (width - btn.get_width(), 0)
+        scrollarea = frame.get_scrollarea(inner=True)
+        world_height = scrollarea.get_world_size()[1]
+        frame._resize_world(width, frame.get_inner_size()[1])
+        scrollarea.set_world_size((width, world_height))
+        scrollarea.show_scrollbars(ORIENTATION_HORIZONTAL)
+
+    def _update_option_buttons_offset(self) -> None:
+        """
+        Bind the option buttons to the items within the visible area of the drop frame.
+
+        :return: None
+        """
+        if self._drop_frame is None or not self._drop_frame.get_attribute('virtual', False):
+            return
+        row = int(self._drop_frame.get_scrollarea(inner=True).get_offsets()[1] / self._option_buttons_row_height)
+        self._bind_option_buttons(row)
+
+    def _update_option_button(self, btn: 'Button', index: int) -> None:
+        """
+        Update the option button style.
+
+        :param btn: Option button
+        :param index: Option index within list
+        :return: None
+        """
+        if index == self._index:
+            btn.set_background_color(self._selection_option_selected_bgcolor)
+            btn.update_font({'color': self._selection_option_font_style['color_selected']})
+        else:
+            btn.set_background_color(self._selection_box_bgcolor)
+            btn.update_font({'color': self._selection_option_font_style['color']})
+
+    def _update_option_buttons(self) -> None:
+        """
+        Update the style of all option buttons.
+
+        :return: None
+        """
+        for b_ind_x in range(len(self._option_buttons)):
+            self._update_option_button(self._option_buttons[b_ind_x], self._option_buttons_offset + b_ind_x)
+
+    def _scroll_to_option(self, index: int) -> None:
+        """
+        Scroll the drop frame to the given option.
+
+        :param index: Option index within list
+        :return: None
+        """
+        if self._drop_frame is None or index == -1 or len(self._option_buttons) == 0:
+            return
+        row = index + (1 if self._placeholder_add_to_selection_box else 0)
+        if index < self._option_buttons_offset:
+            self._bind_option_buttons(row)
+        elif index >= self._option_buttons_offset + len(self._option_buttons):
+            self._bind_option_buttons(row - self._get_option_window_rows() + 1)
+        btn = self._option_buttons[index - self._option_buttons_offset]
+        btn.scroll_to_widget(margin=btn.get_height() if self._open_middle else 5, scroll_parent=False)
+        self._update_option_buttons_offset()
+
+    def _update_drop_frame_items(self) -> bool:
+        """
+        Update the drop frame to the current items without rebuilding it. This is
+        only possible if the frame world remains a window of the rows.
+
+        :return: ``True`` if the frame has been updated
+        """
+        frame = self._drop_frame
+        if not frame.get_attribute('virtual', False) or \
+                self._get_option_rows() <= self._get_option_window_rows():
+            return False
+
+        # Resize the frame world, the widest row is measured again
+        placeholder_button: Optional['Button'] = frame.get_attribute('placeholder_button')
+        self._option_max_width = 0
+        if placeholder_button is not None:
+            placeholder_button._rect_size_delta = (0, 0)
+            self._option_max_width = placeholder_button.get_width() - self._selection_option_border_width
+        scrollarea = frame.get_scrollarea(inner=True)
+        scrollarea.set_world_size((self._option_buttons_width, self._get_option_rows() *
+                                   self._option_buttons_row_height - self._selection_box_border_width))
+        frame.scrollv(0)
+        self._bind_option_buttons(0, force=True)
+        self._update_option_buttons_width()
+        return True
+
     def on_remove_from_menu(self) -> 'DropSelect':
         if self._drop_frame is not None:
             self._drop_frame.set_menu(None)
@@ -540,6 +761,7 @@ class DropSelect(Widget):
         """
         if self._drop_frame is not None:
             self._drop_frame.scrollh(value)
+            self._update_option_buttons_offset()
         return self
 
     def scrollv(self, value: NumberType) -> 'DropSelect':
@@ -551,6 +773,7 @@ class DropSelect(Widget):
         """
         if self._drop_frame is not None:
             self._drop_frame.scrollv(value)
+            self._update_option_buttons_offset()
         return self
 
     def get_scroll_value_percentage(self, orientation: str) -> float:
@@ -652,6 +875,7 @@ class DropSelect(Widget):
     def draw_after_if_selected(self, surface: Optional['pygame.Surface']) -> 'DropSelect':
         if self.active and self.is_visible():
             self._check_drop_maked()
+            self._update_option_buttons_offset()
 
             if not self._open_middle:
                 self._drop_frame.draw(surface)
@@ -791,10 +1015,11 @@ class DropSelect(Widget):
             else:
                 arrow_right_pos = arrow_down
 
-        self._surface = make_surface(title.get_width() + self._selection_box_margin[0] +
-                                     self._selection_box_width + self._selection_box_inflate[0] / 2 +
-                                     self._selection_box_border_width,
-                                     max(title.get_height() + self._selection_box_inflate[1], current_rect_bg.height))
+        release_surface(self._surface)
+        self._surface = borrow_surface(title.get_width() + self._selection_box_margin[0] +
+                                       self._selection_box_width + self._selection_box_inflate[0] / 2 +
+                                       self._selection_box_border_width,
+                                       max(title.get_height() + self._selection_box_inflate[1], current_rect_bg.height))
         self._surface.blit(title, (0, self._selection_box_inflate[1] / 2 + delta_title_height))
         pygame.draw.rect(self._surface, self._selection_box_bgcolor, current_rect_bg)
         pygame.draw.rect(self._surface, self._selection_box_border_color, current_rect_bg,
@@ -805,12 +1030,14 @@ class DropSelect(Widget):
                             self._selection_box_arrow_margin[1] - h / 2 - h / 16 - self._selection_box_text_margin
         assert cropped_current_w > 0, \
             'there is no left space for text width, try increasing selection_box_width size'
-        new_current = make_surface(cropped_current_w, current.get_height())
+        new_current = borrow_surface(cropped_current_w, current.get_height())
         new_current.blit(current, (0, 0))
         # new_current.fill((0, 0, 0))
         self._surface.blit(new_current,
                            (title.get_width() + self._selection_box_margin[0] + self._selection_box_text_margin,
                             self._selection_box_inflate[1] / 2 + vi - 1 + self._selection_box_margin[1]))
+        release_surface(new_current)
+        release_surface(title)
         if len(self._items) > 0:
             pygame.draw.polygon(self._surface, self._selection_box_arrow_color, arrow_right_pos)
 
@@ -887,6 +1114,23 @@ class DropSelect(Widget):
         self.change(*self._items[self._index][1:])
         self._sound.play_key_add()
 
+    def _search(self, event: EventType) -> bool:
+        """
+        Select the option that matches the typed text (type-ahead).
+
+        :param event: Key event
+        :return: ``True`` if the selected option changed
+        """
+        if not self.active:
+            return False
+        index = self._items_index.search(event, self._index)
+        if index == -1 or index == self._index:
+            return False
+        self.set_value(index)
+        self.change(*self._items[self._index][1:])
+        self._sound.play_key_add()
+        return True
+
     def set_value(self, item: Union[str, int]) -> None:
         """
         Set the current value of the widget, selecting the item that matches
@@ -908,34 +1152,24 @@ class DropSelect(Widget):
         assert isinstance(item, (str, int)), 'item must be an string or an integer'
 
         if isinstance(item, str):
-            found = False
-            for i in self._items:
-                if i[0] == item:
-                    self._index = self._items.index(i)
-                    found = True
-                    break
-            if not found:
+            index = self._items_index.get(item)
+            if index == -1:
                 raise ValueError('no value "{}" found in drop select'.format(item))
+            self._index = index
         elif isinstance(item, int):
             assert -1 <= item < len(self._items), \
                 'item index must be greater than zero and lower than the number of items on the drop select'
             self._index = item
 
         # Update options background selection
-        for b_ind_x in range(len(self._option_buttons)):
-            btn = self._option_buttons[b_ind_x]
-            if b_ind_x == self._index:
-                btn.set_background_color(self._selection_option_selected_bgcolor)
-                btn.update_font({'color': self._selection_option_font_style['color_selected']})
-                if not self._drop_frame.has_attribute('ignorescroll'):
-                    btn.scroll_to_widget(margin=btn.get_height() if self._open_middle else 5, scroll_parent=False)
-            else:
-                btn.set_background_color(self._selection_box_bgcolor)
-                btn.update_font({'color': self._selection_option_font_style['color']})
+        self._update_option_buttons()
+        if self._drop_frame is not None and not self._drop_frame.has_attribute('ignorescroll'):
+            self._scroll_to_option(self._index)
 
     def update_items(self, items: Union[List[Tuple[Any, ...]], List[str]]) -> None:
         """
-        Update drop select items.
+        Update drop select items. If the selection drop has been made, the drop
+        frame is updated in place; it is only rebuilt if its scrollbars change.
 
         .. note::
 
@@ -953,6 +1187,7 @@ class DropSelect(Widget):
         else:
             selected_item = None
         self._items = items
+        self._items_index = _SelectorItemsIndex(self._items)
         if selected_item is not None:
             try:
                 self._index = self._items.index(selected_item)
@@ -960,10 +1195,11 @@ class DropSelect(Widget):
                 if self._index >= len(self._items):
                     self._index = -1
                     self._default_value = -1
-        if self._drop_frame is not None:
-            self._drop_frame.set_menu(None)
-        self._drop_frame = None
         self.active = False
+        if self._drop_frame is not None:
+            self._drop_frame.hide()
+            if not self._update_drop_frame_items():
+                self.make_selection_drop(**self._selection_drop_kwargs)
 
     def _check_drop_maked(self) -> None:
         """
@@ -1038,6 +1274,14 @@ class DropSelect(Widget):
             rect.width -= self._selection_box_border_width
         return rect
 
+    def get_event_types(self) -> Optional[FrozenSet[int]]:
+        event_types = frozenset((pygame.ACTIVEEVENT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP,
+                                 pygame.MOUSEMOTION, FINGERDOWN, FINGERUP)) | self._get_controller().get_event_types()
+        if self._drop_frame is None:
+            return event_types
+        frame_event_types = self._drop_frame._get_update_event_types()
+        return None if frame_event_types is None else event_types | frame_event_types
+
     def update(self, events: EventVectorType) -> bool:
         if self.readonly or not self.is_visible():
             return False
@@ -1045,6 +1289,7 @@ class DropSelect(Widget):
         # Check scroll
         self._check_drop_maked()
         updated = self._drop_frame.update(events)
+        self._update_option_buttons_offset()
         if updated:
             return True
 
@@ -1057,33 +1302,25 @@ class DropSelect(Widget):
             # Check mouse over
             self._check_mouseover(event)
 
-            # Events
             keydown = self._keyboard_enabled and event.type == pygame.KEYDOWN
-            joy_hatmotion = self._joystick_enabled and event.type == pygame.JOYHATMOTION
-            joy_axismotion = self._joystick_enabled and event.type == pygame.JOYAXISMOTION
-            joy_button_down = self._joystick_enabled and event.type == pygame.JOYBUTTONDOWN
+            action = self._get_action(event)
 
             # Left button
-            if keydown and event.key == KEY_MOVE_DOWN or \
-                    joy_hatmotion and event.value == JOY_LEFT or \
-                    joy_axismotion and event.axis == JOY_AXIS_X and event.value < JOY_DEADZONE:
+            if action == ACTION_MOVE_DOWN or action == ACTION_LEFT:
                 if not self.active:
                     continue
                 self._down()
                 updated = True
 
             # Right button
-            elif keydown and event.key == KEY_MOVE_UP or \
-                    joy_hatmotion and event.value == JOY_RIGHT or \
-                    joy_axismotion and event.axis == JOY_AXIS_X and event.value > -JOY_DEADZONE:
+            elif action == ACTION_MOVE_UP or action == ACTION_RIGHT:
                 if not self.active:
                     continue
                 self._up()
                 updated = True
 
             # Press enter
-            elif keydown and event.key == KEY_APPLY or \
-                    joy_button_down and event.button == JOY_BUTTON_SELECT:
+            elif action == ACTION_APPLY:
                 if self.active and self._index >= 0:
                     self._sound.play_key_add()
                     self.apply(*self._items[self._index][1:])
@@ -1102,6 +1339,10 @@ class DropSelect(Widget):
                     self._toggle_drop()
                 updated = True
 
+            # Type-ahead search
+            elif keydown and self._search(event):
+                updated = True
+
             # Click on dropselect; don't consider the mouse wheel (button 4 & 5)
             elif self.active and (
                     event.type == pygame.MOUSEBUTTONDOWN and self._mouse_enabled and event.button in (1, 2, 3) or (
@@ -109,6 +109,9 @@ class DropSelectMultiple(DropSelect):
     :param selection_option_selected_font_color: Selected option(s) font color
     :param kwargs: Optional keyword arguments
     """
+    __slots__ = ('_max_selected', '_placeholder_selected', '_selected_indices', '_selection_option_active_bgcolor',
+                 '_selection_option_active_font_color', '_selection_option_selected_box',
+                 '_selection_option_selected_box_color', '_selection_option_selected_box_width')
     _max_selected: int
     _placeholder_selected: str
     _selected_indices: List[int]
@@ -323,6 +326,7 @@ class DropSelectMultiple(DropSelect):
         super(DropSelectMultiple, self).update_items(items)
         self._default_value = []
         self._selected_indices = []
+        self._update_option_buttons()
 
     def _process_index(self) -> None:
         """
@@ -378,14 +382,10 @@ class DropSelectMultiple(DropSelect):
         assert isinstance(item, (str, int)), 'item must be an string or an integer'
 
         if isinstance(item, str):
-            found = False
-            for i in self._items:
-                if i[0] == item:
-                    self._index = self._items.index(i)
-                    found = True
-                    break
-            if not found:
+            index = self._items_index.get(item)
+            if index == -1:
                 raise ValueError('no value "{}" found in drop select multiple'.format(item))
+            self._index = index
         elif isinstance(item, int):
             assert -1 <= item < len(self._items), \
                 'item index must be greater than zero and lower than the number ' \
@@ -404,26 +404,27 @@ class DropSelectMultiple(DropSelect):
 
         :return: None
         """
-        for b_ind_x in range(len(self._option_buttons)):
-            btn = self._option_buttons[b_ind_x]
-            if b_ind_x == self._index:
-                btn.set_background_color(self._selection_option_active_bgcolor)
-                btn.update_font({'color': self._selection_option_active_font_color})
-                btn.scroll_to_widget(margin=btn.get_height() if self._open_middle else 5, scroll_parent=False)
-            elif b_ind_x in self._selected_indices:
-                btn.set_background_color(self._selection_option_selected_bgcolor)
-                btn.update_font({'color': self._selection_option_font_style['color_selected']})
+        self._update_option_buttons()
+        self._scroll_to_option(self._index)
+
+    def _update_option_button(self, btn: 'Button', index: int) -> None:
+        if index == self._index:
+            btn.set_background_color(self._selection_option_active_bgcolor)
+            btn.update_font({'color': self._selection_option_active_font_color})
+        elif index in self._selected_indices:
+            btn.set_background_color(self._selection_option_selected_bgcolor)
+            btn.update_font({'color': self._selection_option_font_style['color_selected']})
+        else:
+            btn.set_background_color(self._selection_box_bgcolor)
+            btn.update_font({'color': self._selection_option_font_style['color']})
+        deco = btn.get_decorator()
+        if btn.has_attribute('deco_on'):
+            if index in self._selected_indices:
+                deco.enable(btn.get_attribute('deco_on'))
+                deco.disable(btn.get_attribute('deco_off'))
             else:
-                btn.set_background_color(self._selection_box_bgcolor)
-                btn.update_font({'color': self._selection_option_font_style['color']})
-            deco = btn.get_decorator()
-            if btn.has_attribute('deco_on'):
-                if b_ind_x in self._selected_indices:
-                    deco.enable(btn.get_attribute('deco_on'))
-                    deco.disable(btn.get_attribute('deco_off'))
-                else:
-                    deco.disable(btn.get_attribute('deco_on'))
-                    deco.enable(btn.get_attribute('deco_off'))
+                deco.disable(btn.get_attribute('deco_on'))
+                deco.enable(btn.get_attribute('deco_off'))
 
     def make_selection_drop(self, **kwargs) -> 'DropSelectMultiple':
         super(DropSelectMultiple, self).make_selection_drop(**kwargs)
@@ -445,6 +446,7 @@ class DropSelectMultiple(DropSelect):
             deco.disable(on)
             btn.set_attribute('deco_on', on)
             btn.set_attribute('deco_off', off)
+        self._update_option_buttons()
         return self
 
     def apply(self, *args) -> Any:
@@ -65,7 +65,7 @@ from pygame_menu.widgets.widget.label import Label
 
 from pygame_menu._types import Optional, NumberType, Dict, Tuple, Union, List, Vector2NumberType, Literal, \
     Tuple2IntType, NumberInstance, Any, ColorInputType, EventVectorType, PaddingType, CallbackType, \
-    ColorInputGradientType, CursorInputType
+    ColorInputGradientType, CursorInputType, FrozenSet
 
 # Constants
 FRAME_DEFAULT_TITLE_BACKGROUND_COLOR = ((10, 36, 106), (166, 202, 240), False, True)
@@ -112,6 +112,10 @@ class Frame(Widget):
     :param orientation: Frame orientation (horizontal or vertical). See :py:mod:`pygame_menu.locals`
     :param frame_id: ID of the frame
     """
+    __slots__ = ('_accepts_title', '_control_widget', '_control_widget_last_pos', '_draggable', '_frame_scrollarea',
+                 '_frame_size', '_frame_title', '_has_frames', '_has_title', '_height', '_orientation',
+                 '_pack_margin_warning', '_pos', '_real_rect', '_recursive_render', '_relax', '_widgets',
+                 '_widgets_props', '_width', 'first_index', 'horizontal', 'last_index')
     _accepts_title: bool
     _control_widget: Optional['Widget']
     _control_widget_last_pos: Optional[Vector2NumberType]
@@ -127,6 +131,7 @@ class Frame(Widget):
     _pos: Dict[str, Tuple[int, int]]  # Widget positioning
     _real_rect: 'pygame.Rect'
     _recursive_render: int
+    _relax: bool
     _widgets: Dict[str, 'Widget']  # widget
     _widgets_props: Dict[str, Tuple[str, str]]  # alignment, vertical position
     _width: int
@@ -688,6 +693,23 @@ class Frame(Widget):
 
         return self
 
+    def _resize_world(self, width: NumberType, height: NumberType) -> None:
+        """
+        Resize the world surface of a scrollable frame, keeping the scrollarea
+        and the packed widgets.
+
+        :param width: New frame width (px)
+        :param height: New frame height (px)
+        :return: None
+        """
+        assert self.is_scrollable, 'only scrollable frames can resize their world'
+        self._width = int(width)
+        self._height = int(height)
+        self._real_rect = pygame.Rect(0, 0, self._width, self._height)
+        self._surface = make_surface(self._width, self._height, alpha=True)
+        self._frame_scrollarea.set_world(self._surface)
+        self.update_position()
+
     def get_indices(self) -> Tuple[int, int]:
         """
         Return first and last selectable indices tuple.
@@ -751,7 +773,7 @@ class Frame(Widget):
         """
         if self.is_scrollable:
             return self._frame_scrollarea.get_decorator()
-        return self._decorator
+        return super(Frame, self).get_decorator()
 
     def get_index(self, widget: 'Widget') -> int:
         """
@@ -789,7 +811,8 @@ class Frame(Widget):
         if not self.is_scrollable:
             self.last_surface = surface
             self._draw_background_color(surface)
-            self._decorator.draw_prev(surface)
+            if self._decorator is not None:
+                self._decorator.draw_prev(surface)
             for widget in self._widgets.values():
                 if widget.is_selected():
                     selected_widget = widget
@@ -797,16 +820,18 @@ class Frame(Widget):
             if selected_widget is not None:
                 selected_widget.draw_after_if_selected(surface)
             self._draw_border(surface)
-            self._decorator.draw_post(surface)
+            if self._decorator is not None:
+                self._decorator.draw_post(surface)
 
         # Scrollarea
         else:
             self.last_surface = self._surface
             self._surface.fill((255, 255, 255, 0))
             self._draw_background_color(self._surface, rect=self._real_rect)
-            scrollarea_decorator = self.get_decorator()
-            scrollarea_decorator.force_cache_update()
-            scrollarea_decorator.draw_prev(self._surface)
+            scrollarea_decorator = self._frame_scrollarea._decorator
+            if scrollarea_decorator is not None:
+                scrollarea_decorator.force_cache_update()
+                scrollarea_decorator.draw_prev(self._surface)
             for widget in self._widgets.values():
                 if widget.is_selected():
                     selected_widget = widget
@@ -1475,6 +1500,22 @@ class Frame(Widget):
         if self.get_frame() is not None:
             self.get_frame()._update_indices()
 
+    def get_event_types(self) -> Optional[FrozenSet[int]]:
+        event_types = frozenset((pygame.ACTIVEEVENT, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION,
+                                 FINGERDOWN, FINGERMOTION, FINGERUP))
+        if self._has_title:
+            for w in self._frame_title.get_widgets():
+                widget_event_types = w._get_update_event_types()
+                if widget_event_types is None:
+                    return None
+                event_types |= widget_event_types
+        if self.is_scrollable:
+            scrollarea_event_types = self._frame_scrollarea.get_event_types()
+            if scrollarea_event_types is None:
+                return None
+            event_types |= scrollarea_event_types
+        return event_types
+
     def update(self, events: EventVectorType) -> bool:
         updated = False
 
@@ -50,6 +50,7 @@ class HMargin(NoneWidget):
     :param margin: Horizontal margin (px)
     :param widget_id: ID of the widget
     """
+    __slots__ = ()
 
     def __init__(
             self,
@@ -41,7 +41,7 @@ from pygame_menu.utils import assert_vector
 from pygame_menu.widgets import Widget
 
 from pygame_menu._types import Union, NumberType, CallbackType, Tuple2NumberType, Optional, \
-    NumberInstance, EventVectorType
+    NumberInstance, EventVectorType, FrozenSet
 
 
 # noinspection PyMissingOrEmptyDocstring
@@ -60,6 +60,7 @@ class Image(Widget):
     :param scale: Scale of the image on x-axis and y-axis (px)
     :param scale_smooth: Scale is smoothed
     """
+    __slots__ = ('_image',)
     _image: 'BaseImage'
 
     def __init__(
@@ -153,6 +154,9 @@ class Image(Widget):
             return True
         self.force_menu_surface_update()
 
+    def get_event_types(self) -> Optional[FrozenSet[int]]:
+        return frozenset((pygame.ACTIVEEVENT, pygame.MOUSEMOTION))
+
     def update(self, events: EventVectorType) -> bool:
         for event in events:
             if self._check_mouseover(event):
@@ -33,11 +33,11 @@ __all__ = ['Label']
 
 import pygame
 
-from pygame_menu.utils import assert_color
+from pygame_menu.utils import assert_color, release_surface
 from pygame_menu.widgets.core import Widget
 
 from pygame_menu._types import Any, CallbackType, List, Union, Tuple, Optional, ColorType, \
-    ColorInputType, EventVectorType
+    ColorInputType, EventVectorType, FrozenSet
 
 
 # noinspection PyMissingOrEmptyDocstring
@@ -49,6 +49,7 @@ class Label(Widget):
     :param label_id: Label ID
     :param onselect: Function when selecting the label widget
     """
+    __slots__ = ('_last_underline',)
     _last_underline: List[Union[str, Optional[Tuple[ColorType, int, int]]]]  # deco id, (color, offset, width)
 
     def __init__(
@@ -112,6 +113,7 @@ class Label(Widget):
             return True
 
         # Render surface
+        release_surface(self._surface)
         self._surface = self._render_string(self._title, self._font_color)
         self._apply_transforms()
         self._rect.width, self._rect.height = self._surface.get_size()
@@ -123,7 +125,7 @@ class Label(Widget):
             h = self._surface.get_height()
             color, offset, width = self._last_underline[1]
             if w > 0 and h > 0:
-                self._last_underline[0] = self._decorator.add_line(
+                self._last_underline[0] = self.get_decorator().add_line(
                     pos1=(-w / 2, h / 2 + offset),
                     pos2=(w / 2, h / 2 + offset),
                     color=color,
@@ -132,6 +134,9 @@ class Label(Widget):
 
         self.force_menu_surface_update()
 
+    def get_event_types(self) -> Optional[FrozenSet[int]]:
+        return frozenset((pygame.ACTIVEEVENT, pygame.MOUSEMOTION))
+
     def update(self, events: EventVectorType) -> bool:
         for event in events:
             if self._check_mouseover(event):
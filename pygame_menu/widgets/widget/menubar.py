@@ -54,13 +54,13 @@ import warnings
 import pygame
 import pygame.gfxdraw as gfxdraw
 
-from pygame_menu.controls import JOY_BUTTON_BACK
+from pygame_menu.controls import ACTION_BACK
 from pygame_menu.locals import FINGERUP, POSITION_EAST
-from pygame_menu.utils import assert_color, get_finger_pos
+from pygame_menu.utils import assert_color, get_finger_pos, make_surface, release_surface
 from pygame_menu.widgets.core import Widget
 
 from pygame_menu._types import Tuple, CallbackType, Tuple2IntType, Literal, NumberType, Any, \
-    Optional, NumberInstance, ColorInputType, EventVectorType
+    Optional, NumberInstance, ColorInputType, EventVectorType, FrozenSet
 
 # Menubar styles
 MENUBAR_STYLE_ADAPTIVE = 1000
@@ -103,10 +103,16 @@ class MenuBar(Widget):
     :param args: Optional arguments for callbacks
     :param kwargs: Optional keyword arguments for callbacks
     """
+    __slots__ = ('_backbox', '_backbox_border_width', '_backbox_pos', '_backbox_rect', '_bar_surface',
+                 '_bar_surface_key', '_bar_surface_pos', '_box_mode', '_modify_scrollarea', '_offsetx', '_offsety',
+                 '_polygon_pos', '_style', '_width')
     _backbox: bool
     _backbox_border_width: int
     _backbox_pos: Any
     _backbox_rect: Optional['pygame.Rect']
+    _bar_surface: Optional['pygame.Surface']
+    _bar_surface_key: Optional[Tuple[Any, ...]]
+    _bar_surface_pos: Tuple2IntType
     _box_mode: int
     _modify_scrollarea: bool
     _offsetx: NumberType
@@ -149,6 +155,9 @@ class MenuBar(Widget):
         self._backbox_pos = None
         self._backbox_rect = None
         self._background_color = background_color
+        self._bar_surface = None
+        self._bar_surface_key = None
+        self._bar_surface_pos = (0, 0)
         self._box_mode = 0
         self._modify_scrollarea = modify_scrollarea
         self._mouseover_check_rect = lambda: self._backbox_rect
@@ -249,18 +258,66 @@ class MenuBar(Widget):
                not (self._box_mode == _MODE_CLOSE and self._menu is not None and self._menu._onclose is None)
 
     def _draw(self, surface: 'pygame.Surface') -> None:
+        backbox_visible = self._backbox_visible()
+
+        # Translucent backgrounds are drawn directly, as the polygon must be blended
+        # only once with the surface
+        if len(self._polygon_pos) > 2 and self._background_color[3] != 255:
+            self._draw_bar(surface, backbox_visible, 0, 0)
+            return
+
+        bar_surface_key = (self._surface, self._polygon_pos, backbox_visible, self._backbox_pos,
+                           self._backbox_border_width, self._background_color, self._font_selected_color)
+        if bar_surface_key != self._bar_surface_key:
+            self._render_bar_surface(backbox_visible)
+            self._bar_surface_key = bar_surface_key
+        surface.blit(self._bar_surface, self._bar_surface_pos)
+
+    def _draw_bar(self, surface: 'pygame.Surface', backbox_visible: bool, x: int, y: int) -> None:
+        """
+        Draw the background polygon, the backbox and the title.
+
+        :param surface: Surface to draw
+        :param backbox_visible: If ``True`` draws the backbox
+        :param x: X position of the surface (px)
+        :param y: Y position of the surface (px)
+        :return: None
+        """
         if len(self._polygon_pos) > 2:
-            gfxdraw.filled_polygon(surface, self._polygon_pos, self._background_color)
+            gfxdraw.filled_polygon(surface, [(p[0] - x, p[1] - y) for p in self._polygon_pos],
+                                   self._background_color)
 
         # Draw backbox if enabled
-        if self._backbox_visible():
+        if backbox_visible:
             # noinspection PyArgumentList
-            pygame.draw.rect(surface, self._font_selected_color, self._backbox_rect, self._backbox_border_width)
-            pygame.draw.polygon(surface, self._font_selected_color, self._backbox_pos)
+            pygame.draw.rect(surface, self._font_selected_color, self._backbox_rect.move(-x, -y),
+                             self._backbox_border_width)
+            pygame.draw.polygon(surface, self._font_selected_color, [(p[0] - x, p[1] - y) for p in self._backbox_pos])
 
-        surface.blit(self._surface,
-                     (self._rect.topleft[0] + self._offsetx,
-                      self._rect.topleft[1] + self._offsety))
+        surface.blit(self._surface, (self._rect.x + self._offsetx - x, self._rect.y + self._offsety - y))
+
+    def _render_bar_surface(self, backbox_visible: bool) -> None:
+        """
+        Render the bar within a cached surface, thus, drawing the menubar only
+        requires one blit.
+
+        :param backbox_visible: If ``True`` draws the backbox
+        :return: None
+        """
+        bar_rect = pygame.Rect((self._rect.x + self._offsetx, self._rect.y + self._offsety), self._surface.get_size())
+        if len(self._polygon_pos) > 2:
+            xs = [p[0] for p in self._polygon_pos]
+            ys = [p[1] for p in self._polygon_pos]
+            bar_rect.union_ip(int(min(xs)), int(min(ys)), int(max(xs) - min(xs)) + 2, int(max(ys) - min(ys)) + 2)
+        if backbox_visible:
+            bar_rect.union_ip(self._backbox_rect)
+        self._bar_surface = make_surface(bar_rect.width, bar_rect.height, alpha=True)
+        self._bar_surface_pos = bar_rect.topleft
+        self._draw_bar(self._bar_surface, backbox_visible, bar_rect.x, bar_rect.y)
+
+        # Most of the pixels are either transparent or opaque, thus, run-length
+        # encoding speeds up the blit
+        self._bar_surface.set_alpha(255, pygame.RLEACCEL)
 
     def get_scrollbar_style_change(self, position: str) -> Tuple[int, Tuple2IntType]:
         """
@@ -295,6 +352,7 @@ class MenuBar(Widget):
         else:
             self._box_mode = _MODE_BACK
 
+        release_surface(self._surface)
         self._surface = self._render_string(self._title, self._font_selected_color)
         self._rect.width, self._rect.height = self._surface.get_size()
         self._apply_transforms()  # Rotation does not affect rect size
@@ -479,6 +537,9 @@ class MenuBar(Widget):
             return 0
         return super(MenuBar, self).get_height(apply_padding, apply_selection)
 
+    def get_event_types(self) -> Optional[FrozenSet[int]]:
+        return frozenset((pygame.ACTIVEEVENT, pygame.JOYBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION, FINGERUP))
+
     def update(self, events: EventVectorType) -> bool:
         if self.readonly or not self.is_visible():
             return False
@@ -499,8 +560,8 @@ class MenuBar(Widget):
                     updated = True
 
             # User applies joy back button
-            elif event.type == pygame.JOYBUTTONDOWN and self._joystick_enabled:
-                if event.button == JOY_BUTTON_BACK:
+            elif event.type == pygame.JOYBUTTONDOWN:
+                if self._get_action(event) == ACTION_BACK:
                     self._sound.play_key_del()
                     self.apply()
                     updated = True
@@ -36,7 +36,7 @@ import pygame
 from pygame_menu.utils import make_surface
 from pygame_menu.widgets.core import Widget
 
-from pygame_menu._types import Optional, NumberType
+from pygame_menu._types import Optional, NumberType, FrozenSet
 
 
 # noinspection PyMissingOrEmptyDocstring
@@ -51,6 +51,7 @@ class NoneWidget(Widget):
 
     :param widget_id: ID of the widget
     """
+    __slots__ = ()
 
     def __init__(
             self,
@@ -204,5 +205,8 @@ class NoneWidget(Widget):
     def set_default_value(self, *args, **kwargs) -> 'NoneWidget':
         return self
 
+    def get_event_types(self) -> Optional[FrozenSet[int]]:
+        return frozenset()
+
     def update(self, *args, **kwargs) -> bool:
         return False
@@ -31,6 +31,7 @@ CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 
 __all__ = ['ScrollBar']
 
+import math
 import pygame
 
 from pygame_menu.locals import ORIENTATION_VERTICAL, ORIENTATION_HORIZONTAL, POSITION_NORTHWEST
@@ -38,7 +39,13 @@ from pygame_menu.utils import make_surface, assert_orientation, assert_color
 from pygame_menu.widgets.core import Widget
 
 from pygame_menu._types import Optional, List, VectorIntType, ColorType, Tuple2IntType, \
-    CallbackType, NumberInstance, ColorInputType, NumberType, Literal, EventVectorType
+    CallbackType, NumberInstance, ColorInputType, NumberType, Literal, EventVectorType, FrozenSet
+
+# Kinetic scrolling
+KINETIC_FRICTION = 4  # Inertia velocity decay rate (1/s)
+KINETIC_MIN_VELOCITY = 20  # Inertia stops below this velocity (px/s)
+KINETIC_RELEASE_TIME = 100  # Max time between the last mouse motion and the release to keep the inertia (ms)
+KINETIC_TIME = 0.08  # Time constant to reach the target position (s)
 
 
 # noinspection PyMissingOrEmptyDocstring
@@ -70,6 +77,16 @@ class ScrollBar(Widget):
     :param page_ctrl_color: Page control color
     :param onchange: Callback when pressing and moving the scroll
     """
+    __slots__ = ('_kinetic', '_kinetic_position', '_kinetic_target', '_kinetic_ticks', '_kinetic_velocity',
+                 '_last_mouse_pos', '_orientation', '_page_ctrl_color', '_page_ctrl_length', '_page_ctrl_thick',
+                 '_page_step', '_shadow', '_shadow_color', '_shadow_offset', '_shadow_position', '_shadow_tuple',
+                 '_single_step', '_slider_color', '_slider_pad', '_slider_position', '_slider_rect', '_slider_surface',
+                 '_values_range', 'scrolling')
+    _kinetic: bool
+    _kinetic_position: float
+    _kinetic_target: Optional[float]
+    _kinetic_ticks: int
+    _kinetic_velocity: float
     _last_mouse_pos: Tuple2IntType
     _orientation: Literal[0, 1]
     _page_ctrl_color: ColorType
@@ -86,6 +103,7 @@ class ScrollBar(Widget):
     _slider_pad: int
     _slider_position: int
     _slider_rect: Optional['pygame.Rect']
+    _slider_surface: Optional['pygame.Surface']
     _values_range: List[NumberType]
     scrolling: bool
 
@@ -120,6 +138,11 @@ class ScrollBar(Widget):
             kwargs=kwargs
         )
 
+        self._kinetic = False
+        self._kinetic_position = 0
+        self._kinetic_target = None
+        self._kinetic_ticks = 0
+        self._kinetic_velocity = 0
         self._last_mouse_pos = (-1, -1)
         self._orientation = 0  # 0: horizontal, 1: vertical
         self._values_range = list(values_range)
@@ -130,6 +153,7 @@ class ScrollBar(Widget):
         self._page_ctrl_color = page_ctrl_color
 
         self._slider_rect = None
+        self._slider_surface = None
         self._slider_pad = slider_pad
         self._slider_color = slider_color
         self._slider_position = 0
@@ -233,10 +257,12 @@ class ScrollBar(Widget):
 
         # Disable font
         self._font_shadow = False
+        self._force_render()
         return self
 
     def _draw(self, surface: 'pygame.Surface') -> None:
         surface.blit(self._surface, self._rect.topleft)
+        surface.blit(self._slider_surface, (self._rect.x + self._slider_rect.x, self._rect.y + self._slider_rect.y))
 
     def get_minimum(self) -> int:
         """
@@ -310,26 +336,44 @@ class ScrollBar(Widget):
     def _render(self) -> Optional[bool]:
         width, height = self._rect.width + self._rect_size_delta[0], self._rect.height + self._rect_size_delta[1]
 
-        if not self._render_hash_changed(width, height, self._slider_rect.x, self._slider_rect.y, self.readonly,
-                                         self._slider_rect.width, self._slider_rect.height, self._visible):
+        # The slider position is not rendered, as the page control and the slider
+        # surfaces are composed while drawing
+        if not self._render_hash_changed(width, height, self.readonly, self._slider_rect.width,
+                                         self._slider_rect.height, self._visible):
             return True
 
-        self._surface = make_surface(width, height)
+        # Render the page control. Surfaces are created only if the size changes
+        if self._surface is None or self._surface.get_size() != (width, height):
+            self._surface = make_surface(width, height)
         self._surface.fill(self._page_ctrl_color)
 
         # Render slider
+        if self._slider_surface is None or self._slider_surface.get_size() != self._slider_rect.size:
+            self._slider_surface = make_surface(*self._slider_rect.size)
         slider_color = self._slider_color if not self.readonly else self._font_readonly_color
         if self._shadow:
-            lit_rect = pygame.Rect(self._slider_rect)
+            lit_rect = self._slider_surface.get_rect()
             slider_rect = lit_rect.inflate(-self._shadow_offset * 2, -self._shadow_offset * 2)
             shadow_rect = lit_rect.inflate(-self._shadow_offset, -self._shadow_offset)
             shadow_rect = shadow_rect.move(self._shadow_tuple[0] / 2, self._shadow_tuple[1] / 2)
 
-            pygame.draw.rect(self._surface, self._font_selected_color, lit_rect)
-            pygame.draw.rect(self._surface, self._shadow_color, shadow_rect)
-            pygame.draw.rect(self._surface, slider_color, slider_rect)
+            self._slider_surface.fill(self._font_selected_color)
+            pygame.draw.rect(self._slider_surface, self._shadow_color, shadow_rect)
+            pygame.draw.rect(self._slider_surface, slider_color, slider_rect)
         else:
-            pygame.draw.rect(self._surface, slider_color, self._slider_rect)
+            self._slider_surface.fill(slider_color)
+
+    def _track_kinetic_velocity(self, pixels: NumberType) -> None:
+        """
+        Update the slider velocity while dragging.
+
+        :param pixels: Pixels moved since the last mouse motion
+        :return: None
+        """
+        ticks = pygame.time.get_ticks()
+        dt = max(1, ticks - self._kinetic_ticks) / 1000
+        self._kinetic_ticks = ticks
+        self._kinetic_velocity = 0.8 * pixels / dt + 0.2 * self._kinetic_velocity
 
     def _scroll(self, rect: 'pygame.Rect', pixels: NumberType) -> bool:
         """
@@ -464,8 +508,142 @@ class ScrollBar(Widget):
         pixels = max(0, pixels)
         pixels = min(self._page_ctrl_length - self._page_step, pixels)
 
+        self._stop_kinetic()
         self._scroll(self.get_rect(), pixels - self._slider_position)
 
+    def _value_to_position(self, value: NumberType) -> float:
+        """
+        Return the slider position of the given value.
+
+        :param value: Value
+        :return: Slider position (px)
+        """
+        position = (value - self._values_range[0]) * (self._page_ctrl_length - self._page_step)
+        position /= (self._values_range[1] - self._values_range[0])
+        return min(max(0, position), self._page_ctrl_length - self._page_step)
+
+    def set_kinetic(self, kinetic: bool) -> 'ScrollBar':
+        """
+        Enable or disable the kinetic scrolling. If enabled, the wheel and the page
+        steps move the slider smoothly towards the target position, and releasing
+        the slider after dragging keeps the inertia.
+
+        .. note::
+
+            The kinetic scrolling advances only within :py:meth:`pygame_menu.widgets.ScrollBar.update_kinetic`.
+
+        :param kinetic: Kinetic scrolling status
+        :return: Self reference
+        """
+        assert isinstance(kinetic, bool)
+        self._kinetic = kinetic
+        self._stop_kinetic()
+        return self
+
+    def is_kinetic(self) -> bool:
+        """
+        Return ``True`` if the kinetic scrolling is enabled.
+
+        :return: Kinetic scrolling status
+        """
+        return self._kinetic
+
+    def is_kinetic_scrolling(self) -> bool:
+        """
+        Return ``True`` if the slider is moving towards a target, or it is moving
+        because of the inertia.
+
+        :return: ``True`` if moving
+        """
+        return self._kinetic_target is not None or self._kinetic_velocity != 0
+
+    def _stop_kinetic(self) -> None:
+        """
+        Stop the kinetic scrolling.
+
+        :return: None
+        """
+        self._kinetic_target = None
+        self._kinetic_velocity = 0
+
+    def _kinetic_scroll_to(self, position: NumberType) -> bool:
+        """
+        Set the target slider position of the kinetic scrolling.
+
+        :param position: Target slider position (px)
+        :return: ``True`` if the target has changed
+        """
+        if not self.is_kinetic_scrolling():
+            self._kinetic_position = self._slider_position
+            self._kinetic_ticks = pygame.time.get_ticks()
+        target = min(max(0, position), self._page_ctrl_length - self._page_step)
+        self._kinetic_velocity = 0
+        if target == (self._kinetic_position if self._kinetic_target is None else self._kinetic_target):
+            return False
+        self._kinetic_target = target
+        return True
+
+    def _kinetic_scroll(self, pixels: NumberType) -> bool:
+        """
+        Move the target slider position of the kinetic scrolling.
+
+        :param pixels: Number of pixels to scroll
+        :return: ``True`` if the target has changed
+        """
+        if self._kinetic_target is not None:
+            return self._kinetic_scroll_to(self._kinetic_target + pixels)
+        return self._kinetic_scroll_to(self._slider_position + pixels)
+
+    def scroll_to_value(self, value: NumberType) -> 'ScrollBar':
+        """
+        Scroll to the given value. If the kinetic scrolling is enabled the slider
+        moves smoothly, otherwise it is the same as :py:meth:`pygame_menu.widgets.ScrollBar.set_value`.
+
+        :param value: Value
+        :return: Self reference
+        """
+        if self._kinetic:
+            self._kinetic_scroll_to(self._value_to_position(value))
+        else:
+            self.set_value(value)
+        return self
+
+    def update_kinetic(self) -> bool:
+        """
+        Advance the kinetic scrolling using the time elapsed since the last call.
+        If the slider is not moving this method does nothing.
+
+        :return: ``True`` if the slider has moved
+        """
+        if not self.is_kinetic_scrolling() or self.scrolling:
+            return False
+        ticks = pygame.time.get_ticks()
+        dt = (ticks - self._kinetic_ticks) / 1000
+        if dt <= 0:
+            return False
+        self._kinetic_ticks = ticks
+        max_position = self._page_ctrl_length - self._page_step
+        position = self._kinetic_position
+
+        # Move towards the target, or keep the inertia
+        if self._kinetic_target is not None:
+            target = min(max(0, self._kinetic_target), max_position)
+            position += (target - position) * (1 - math.exp(-dt / KINETIC_TIME))
+            if abs(target - position) < 0.5:
+                position = target
+                self._kinetic_target = None
+        else:
+            position += self._kinetic_velocity * dt
+            self._kinetic_velocity *= math.exp(-KINETIC_FRICTION * dt)
+            if not 0 < position < max_position or abs(self._kinetic_velocity) < KINETIC_MIN_VELOCITY:
+                self._kinetic_velocity = 0
+        self._kinetic_position = min(max(0, position), max_position)
+
+        if self._scroll(self._rect, round(self._kinetic_position) - self._slider_position):
+            self.change()
+            return True
+        return False
+
     def get_slider_rect(self) -> 'pygame.Rect':
         """
         Get slider rect.
@@ -474,6 +652,10 @@ class ScrollBar(Widget):
         """
         return self._slider_rect.move(*self.get_rect(to_absolute_position=True).topleft)
 
+    def get_event_types(self) -> Optional[FrozenSet[int]]:
+        return frozenset((pygame.ACTIVEEVENT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP,
+                          pygame.MOUSEMOTION))
+
     def update(self, events: EventVectorType) -> bool:
         if self.readonly or not self.is_visible():
             return False
@@ -494,7 +676,9 @@ class ScrollBar(Widget):
                 if keys_pressed[pygame.K_LSHIFT] or keys_pressed[pygame.K_RSHIFT]:
                     step *= 0.35
                 pixels = direction * step
-                if self._scroll(rect, pixels):
+                if self._kinetic:
+                    updated = self._kinetic_scroll(pixels) or updated
+                elif self._scroll(rect, pixels):
                     self.change()
                     updated = True
 
@@ -515,6 +699,8 @@ class ScrollBar(Widget):
                             continue
 
                 # Check scrolling
+                if self._kinetic:
+                    self._track_kinetic_velocity(event.rel[self._orientation])
                 if self._scroll(rect, event.rel[self._orientation]):
                     self.change()
                     updated = True
@@ -541,7 +727,9 @@ class ScrollBar(Widget):
                 if event.button in (4, 5) and self._orientation == 1 and \
                         (self._scrollarea is not None and self._scrollarea.mouse_is_over() or self._scrollarea is None):
                     direction = -1 if event.button == 4 else 1
-                    if self._scroll(rect, direction * self._single_step):
+                    if self._kinetic:
+                        updated = self._kinetic_scroll(direction * self._single_step) or updated
+                    elif self._scroll(rect, direction * self._single_step):
                         self.change()
                         updated = True
 
@@ -551,13 +739,17 @@ class ScrollBar(Widget):
                     if self.get_slider_rect().collidepoint(*event.pos):
                         # Initialize scrolling
                         self.scrolling = True
+                        self._stop_kinetic()
+                        self._kinetic_ticks = pygame.time.get_ticks()
 
                     elif rect.collidepoint(*event.pos):
                         # Moves towards the click by one "page" (= slider length without pad)
                         s_rect = self.get_slider_rect()
                         pos = (s_rect.x, s_rect.y)
                         direction = 1 if event.pos[self._orientation] > pos[self._orientation] else -1
-                        if self._scroll(rect, direction * self._page_step):
+                        if self._kinetic:
+                            updated = self._kinetic_scroll(direction * self._page_step) or updated
+                        elif self._scroll(rect, direction * self._page_step):
                             self.change()
                             updated = True
 
@@ -566,6 +758,13 @@ class ScrollBar(Widget):
                 self.scrolling = False
                 updated = True
 
+                # Keep the inertia if the slider was moving
+                if self._kinetic and pygame.time.get_ticks() - self._kinetic_ticks > KINETIC_RELEASE_TIME:
+                    self._kinetic_velocity = 0
+                if self._kinetic_velocity != 0:
+                    self._kinetic_position = self._slider_position
+                    self._kinetic_ticks = pygame.time.get_ticks()
+
         if updated:
             self.apply_update_callbacks()
 
@@ -47,17 +47,17 @@ __all__ = [
 
 ]
 
+import bisect
 import pygame
 
-from pygame_menu.controls import KEY_LEFT, KEY_RIGHT, JOY_AXIS_X, JOY_LEFT, JOY_RIGHT, JOY_DEADZONE, \
-    KEY_APPLY, JOY_BUTTON_SELECT
+from pygame_menu.controls import ACTION_APPLY, ACTION_LEFT, ACTION_RIGHT
 from pygame_menu.locals import FINGERUP
-from pygame_menu.utils import check_key_pressed_valid, assert_color, assert_vector, make_surface, \
-    get_finger_pos
+from pygame_menu.utils import check_key_pressed_valid, assert_color, assert_vector, borrow_surface, \
+    get_finger_pos, release_surface
 from pygame_menu.widgets.core import Widget
 
 from pygame_menu._types import Tuple, Union, List, Any, Optional, CallbackType, Literal, ColorType, \
-    ColorInputType, Tuple2IntType, Tuple3IntType, EventVectorType, Tuple2NumberType
+    ColorInputType, Tuple2IntType, Tuple3IntType, EventVectorType, Tuple2NumberType, Dict, EventType, FrozenSet
 
 SELECTOR_STYLE_CLASSIC = 'classic'
 SELECTOR_STYLE_FANCY = 'fancy'
@@ -81,6 +81,99 @@ def check_selector_items(items: Union[Tuple, List]) -> None:
         assert isinstance(e[0], (str, bytes)), msg
 
 
+class _SelectorItemsIndex(object):
+    """
+    Index over the item labels of a selector. Provides the lookup of an item by
+    its label in O(1), and the type-ahead search of the items whose label starts
+    with the typed text (case insensitive) in O(log n) using a sorted list of
+    labels.
+
+    :param items: Items list
+    """
+    _keys: List[str]
+    _labels: Dict[Union[str, bytes], int]
+    _search_text: str
+    _search_time: int
+    _sorted: List[Tuple[str, int]]
+    search_timeout: int  # ms
+
+    def __init__(self, items: Union[List[Tuple[Any, ...]], List[str]]) -> None:
+        self._labels = {}
+        for i in range(len(items)):
+            self._labels.setdefault(items[i][0], i)
+        self._sorted = sorted((self._get_key(items[i][0]), i) for i in range(len(items)))
+        self._keys = [k[0] for k in self._sorted]
+        self._search_text = ''
+        self._search_time = 0
+        self.search_timeout = 1000
+
+    @staticmethod
+    def _get_key(label: Union[str, bytes]) -> str:
+        """
+        Return the search key of the given label.
+
+        :param label: Item label
+        :return: Key
+        """
+        if isinstance(label, bytes):
+            label = label.decode('utf-8', 'replace')
+        return label.lower()
+
+    def get(self, label: Union[str, bytes]) -> int:
+        """
+        Return the index of the first item with the given label.
+
+        :param label: Item label
+        :return: Item index, ``-1`` if not found
+        """
+        return self._labels.get(label, -1)
+
+    def find(self, prefix: str, start: int = 0) -> int:
+        """
+        Return the index of the first item whose label starts with the given prefix,
+        looking from ``start`` and wrapping to the beginning of the list.
+
+        :param prefix: Label prefix
+        :param start: Starting index
+        :return: Item index, ``-1`` if not found
+        """
+        prefix = self._get_key(prefix)
+        lo = bisect.bisect_left(self._keys, prefix)
+        hi = bisect.bisect_left(self._keys, prefix + '\U0010ffff', lo)
+        if lo == hi:
+            return -1
+        first, after = -1, -1
+        for k in range(lo, hi):
+            i = self._sorted[k][1]
+            if first == -1 or i < first:
+                first = i
+            if i >= start and (after == -1 or i < after):
+                after = i
+        return first if after == -1 else after
+
+    def search(self, event: EventType, index: int) -> int:
+        """
+        Process a type-ahead key event. The typed characters are appended to the search
+        text if the previous key was pressed within the timeout. Typing the same character
+        repeatedly cycles through the items starting with it.
+
+        :param event: Key event
+        :param index: Current selected index
+        :return: Index of the found item, ``-1`` if not found
+        """
+        char = getattr(event, 'unicode', '')
+        if len(char) != 1 or not char.isprintable():
+            return -1
+        t = pygame.time.get_ticks()
+        if t - self._search_time > self.search_timeout:
+            self._search_text = ''
+        self._search_time = t
+        self._search_text += char
+        if self._search_text == char * len(self._search_text):
+            return self.find(char, index + 1)
+        return self.find(self._search_text, max(index, 0))
+
+
 # noinspection PyMissingOrEmptyDocstring
 class Selector(Widget):
     """
@@ -121,8 +214,12 @@ class Selector(Widget):
     :param style_fancy_box_margin: Box margin (x, y) in fancy style from title in px
     :param kwargs: Optional keyword arguments
     """
+    __slots__ = ('_index', '_items', '_items_index', '_sformat', '_style', '_style_fancy_arrow_color',
+                 '_style_fancy_arrow_margin', '_style_fancy_bgcolor', '_style_fancy_bordercolor',
+                 '_style_fancy_borderwidth', '_style_fancy_box_inflate', '_style_fancy_box_margin', '_title_size')
     _index: int
     _items: Union[List[Tuple[Any, ...]], List[str]]
+    _items_index: '_SelectorItemsIndex'
     _sformat: str
     _style: SelectorStyleType
     _style_fancy_arrow_color: ColorType
@@ -189,6 +286,7 @@ class Selector(Widget):
 
         self._index = 0
         self._items = items.copy()
+        self._items_index = _SelectorItemsIndex(self._items)
         self._sformat = ''
         self._style = style
         self._title_size = 0
@@ -245,6 +343,7 @@ class Selector(Widget):
             return True
 
         color = self.get_font_color_status()
+        release_surface(self._surface)
 
         # Render from different styles
         if self._style == SELECTOR_STYLE_CLASSIC:
@@ -292,11 +391,11 @@ class Selector(Widget):
                 (2 * arrow_right.right - (arrow_right.left + 5), arrow_right.centery)
             )
 
-            self._surface = make_surface(title.get_width() + 2 * self._style_fancy_arrow_margin[0] +
-                                         2 * self._style_fancy_arrow_margin[1] + self._style_fancy_box_margin[0] +
-                                         current.get_width() + 2 * arrow_left.width + self._style_fancy_borderwidth +
-                                         self._style_fancy_box_inflate[0] / 2,
-                                         title.get_height() + self._style_fancy_box_inflate[1])
+            self._surface = borrow_surface(title.get_width() + 2 * self._style_fancy_arrow_margin[0] +
+                                           2 * self._style_fancy_arrow_margin[1] + self._style_fancy_box_margin[0] +
+                                           current.get_width() + 2 * arrow_left.width + self._style_fancy_borderwidth +
+                                           self._style_fancy_box_inflate[0] / 2,
+                                           title.get_height() + self._style_fancy_box_inflate[1])
             self._surface.blit(title, (0, self._style_fancy_box_inflate[1] / 2))
             current_rect_bg = current.get_rect()
             current_rect_bg.x += title.get_width() + self._style_fancy_box_margin[0]
@@ -312,6 +411,8 @@ class Selector(Widget):
                                          self._style_fancy_box_inflate[1] / 2 + self._style_fancy_box_margin[1]))
             pygame.draw.polygon(self._surface, self._style_fancy_arrow_color, arrow_left_pos)
             pygame.draw.polygon(self._surface, self._style_fancy_arrow_color, arrow_right_pos)
+            release_surface(title)
+            release_surface(current)
 
         self._apply_transforms()
         self._rect.width, self._rect.height = self._surface.get_size()
@@ -357,6 +458,21 @@ class Selector(Widget):
         self.change(*self._items[self._index][1:])
         self._sound.play_key_add()
 
+    def _search(self, event: EventType) -> bool:
+        """
+        Select the item that matches the typed text (type-ahead).
+
+        :param event: Key event
+        :return: ``True`` if the selected item changed
+        """
+        index = self._items_index.search(event, self._index)
+        if index == -1 or index == self._index:
+            return False
+        self._index = index
+        self.change(*self._items[self._index][1:])
+        self._sound.play_key_add()
+        return True
+
     def set_value(self, item: Union[str, int]) -> None:
         """
         Set the current value of the widget, selecting the item that matches
@@ -377,14 +493,10 @@ class Selector(Widget):
         """
         assert isinstance(item, (str, int)), 'item must be an string or an integer'
         if isinstance(item, str):
-            found = False
-            for i in self._items:
-                if i[0] == item:
-                    self._index = self._items.index(i)
-                    found = True
-                    break
-            if not found:
+            index = self._items_index.get(item)
+            if index == -1:
                 raise ValueError('no value "{}" found in selector'.format(item))
+            self._index = index
         elif isinstance(item, int):
             assert 0 <= item < len(self._items), \
                 'item index must be greater than zero and lower than the number of items on the selector'
@@ -405,6 +517,7 @@ class Selector(Widget):
         check_selector_items(items)
         selected_item = self._items[self._index]
         self._items = items
+        self._items_index = _SelectorItemsIndex(self._items)
         try:
             self._index = self._items.index(selected_item)
         except ValueError:
@@ -412,6 +525,10 @@ class Selector(Widget):
                 self._index = 0
                 self._default_value = 0
 
+    def get_event_types(self) -> Optional[FrozenSet[int]]:
+        return frozenset((pygame.ACTIVEEVENT, pygame.KEYDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION, FINGERUP)) | \
+            self._get_controller().get_event_types()
+
     def update(self, events: EventVectorType) -> bool:
         if self.readonly or not self.is_visible():
             return False
@@ -428,31 +545,28 @@ class Selector(Widget):
 
             # Events
             keydown = self._keyboard_enabled and event.type == pygame.KEYDOWN
-            joy_hatmotion = self._joystick_enabled and event.type == pygame.JOYHATMOTION
-            joy_axismotion = self._joystick_enabled and event.type == pygame.JOYAXISMOTION
-            joy_button_down = self._joystick_enabled and event.type == pygame.JOYBUTTONDOWN
+            action = self._get_action(event)
 
             # Left button
-            if keydown and event.key == KEY_LEFT or \
-                    joy_hatmotion and event.value == JOY_LEFT or \
-                    joy_axismotion and event.axis == JOY_AXIS_X and event.value < JOY_DEADZONE:
+            if action == ACTION_LEFT:
                 self._left()
                 updated = True
 
             # Right button
-            elif keydown and event.key == KEY_RIGHT or \
-                    joy_hatmotion and event.value == JOY_RIGHT or \
-                    joy_axismotion and event.axis == JOY_AXIS_X and event.value > -JOY_DEADZONE:
+            elif action == ACTION_RIGHT:
                 self._right()
                 updated = True
 
             # Press enter
-            elif keydown and event.key == KEY_APPLY or \
-                    joy_button_down and event.button == JOY_BUTTON_SELECT:
+            elif action == ACTION_APPLY:
                 self._sound.play_key_add()
                 self.apply(*self._items[self._index][1:])
                 updated = True
 
+            # Type-ahead search
+            elif keydown and self._search(event):
+                updated = True
+
             # Click on selector; don't consider the mouse wheel (button 4 & 5)
             elif event.type == pygame.MOUSEBUTTONUP and self._mouse_enabled and event.button in (1, 2, 3) or \
                     event.type == FINGERUP and self._touchscreen_enabled and self._menu is not None:
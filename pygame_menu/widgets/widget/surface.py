@@ -35,7 +35,7 @@ import pygame
 
 from pygame_menu.widgets import Widget
 
-from pygame_menu._types import NumberType, CallbackType, Optional, EventVectorType
+from pygame_menu._types import NumberType, CallbackType, Optional, EventVectorType, FrozenSet
 
 
 # noinspection PyMissingOrEmptyDocstring
@@ -51,6 +51,7 @@ class SurfaceWidget(Widget):
     :param surface_id: Surface ID
     :param onselect: Function when selecting the widget
     """
+    __slots__ = ('_surface_obj',)
     _surface_obj: 'pygame.Surface'
 
     def __init__(
@@ -115,6 +116,9 @@ class SurfaceWidget(Widget):
         self._rect.width, self._rect.height = self._surface_obj.get_size()
         return
 
+    def get_event_types(self) -> Optional[FrozenSet[int]]:
+        return frozenset((pygame.ACTIVEEVENT, pygame.MOUSEMOTION))
+
     def update(self, events: EventVectorType) -> bool:
         for event in events:
             if self._check_mouseover(event):
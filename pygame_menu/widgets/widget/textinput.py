@@ -34,15 +34,18 @@ __all__ = ['TextInput']
 import math
 import warnings
 
+from collections import deque
+
 import pygame
 
-from pygame_menu.controls import KEY_MOVE_UP, KEY_MOVE_DOWN, KEY_APPLY
+from pygame_menu.controls import ACTION_APPLY, ACTION_MOVE_DOWN, ACTION_MOVE_UP
 from pygame_menu.locals import FINGERDOWN, FINGERUP, INPUT_INT, INPUT_FLOAT, INPUT_TEXT
-from pygame_menu.utils import check_key_pressed_valid, make_surface, assert_color, get_finger_pos
+from pygame_menu.utils import check_key_pressed_valid, make_surface, assert_color, get_finger_pos, \
+    borrow_surface, release_surface
 from pygame_menu.widgets.core import Widget
 
 from pygame_menu._types import Optional, Any, CallbackType, Tuple, List, ColorType, NumberType, \
-    Tuple2IntType, Dict, Tuple2NumberType, NumberInstance, ColorInputType, EventVectorType
+    Tuple2IntType, Dict, Tuple2NumberType, NumberInstance, ColorInputType, EventVectorType, FrozenSet
 
 try:
     # noinspection PyProtectedMember
@@ -99,7 +102,9 @@ class TextInput(Widget):
     :param cursor_selection_color: Color of the text selection if the cursor is enabled on certain widgets
     :param cursor_selection_enable: Enables selection of text
     :param cursor_switch_ms: Interval of cursor switch between off and on status. First status is ``off``
-    :param history: Maximum number of editions stored
+    :param history: Maximum number of editions stored (undo steps). If ``0`` the history is disabled
+    :param history_coalesce: Consecutive typing or deletion is merged into a single undo step
+    :param history_maxbytes: Maximum size in bytes of the text stored by the history. Older editions are evicted first. If ``0`` there's no limit
     :param input_type: Type of the input data. See :py:mod:`pygame_menu.locals`
     :param input_underline: Character string drawn under the input
     :param input_underline_len: Total of characters to be drawn under the input. If ``0`` this number is computed automatically to fit the font
@@ -120,6 +125,20 @@ class TextInput(Widget):
     :param valid_chars: List of chars that are valid, ``None`` if all chars are valid
     :param kwargs: Optional keyword arguments
     """
+    __slots__ = ('_absolute_origin', '_apply_widget_update_callback', '_block_copy_paste', '_clock',
+                 '_copy_paste_enabled', '_current_underline_string', '_cursor_color', '_cursor_ms_counter',
+                 '_cursor_offset', '_cursor_position', '_cursor_render', '_cursor_surface', '_cursor_surface_pos',
+                 '_cursor_switch_ms', '_cursor_visible', '_ellipsis', '_ellipsis_size', '_history', '_history_bytes',
+                 '_history_coalesce', '_history_cursor', '_history_index', '_history_renderbox', '_history_string',
+                 '_ignore_keys', '_input_string', '_input_type', '_input_underline', '_input_underline_len',
+                 '_input_underline_size', '_input_underline_vmargin', '_key_is_pressed', '_keychar_size',
+                 '_keyrepeat_counters', '_keyrepeat_initial_interval_ms', '_keyrepeat_interval_ms',
+                 '_keyrepeat_mouse_interval_ms', '_keyrepeat_mouse_ms', '_keyrepeat_touch_interval_ms', '_last_char',
+                 '_last_key', '_last_rendered_string', '_last_selection_render', '_max_history', '_max_history_bytes',
+                 '_maxchar', '_maxwidth', '_maxwidth_base', '_maxwidth_update', '_maxwidthsize', '_mouse_is_pressed',
+                 '_password', '_password_char', '_renderbox', '_selection_active', '_selection_box', '_selection_color',
+                 '_selection_enabled', '_selection_mouse_first_position', '_selection_position', '_selection_surface',
+                 '_title_size', '_underline_cache', '_underline_maxchar_size', '_valid_chars')
     _absolute_origin: Tuple2IntType
     _apply_widget_update_callback: bool  # Used in ColorInput
     _block_copy_paste: bool
@@ -137,10 +156,13 @@ class TextInput(Widget):
     _cursor_visible: bool
     _ellipsis: str
     _ellipsis_size: NumberType
-    _history: List[str]
-    _history_cursor: List[int]
+    _history: 'deque'
+    _history_bytes: int
+    _history_coalesce: bool
+    _history_cursor: int
     _history_index: int
-    _history_renderbox: List[List[int]]
+    _history_renderbox: Tuple[int, int, int]
+    _history_string: str
     _ignore_keys: Tuple[int, ...]
     _input_string: str
     _input_type: str
@@ -158,7 +180,10 @@ class TextInput(Widget):
     _keyrepeat_touch_interval_ms: NumberType
     _last_char: str
     _last_key: int
+    _last_rendered_string: str
     _last_selection_render: List[int]
+    _max_history: int
+    _max_history_bytes: int
     _maxchar: int
     _maxwidth: int
     _maxwidth_base: int
@@ -176,6 +201,8 @@ class TextInput(Widget):
     _selection_position: List[int]
     _selection_surface: Optional['pygame.Surface']
     _title_size: NumberType
+    _underline_cache: Dict[Tuple[int, NumberType, ColorType], Tuple[str, 'pygame.Surface']]
+    _underline_maxchar_size: NumberType
     _valid_chars: Optional[List[str]]
 
     def __init__(
@@ -188,6 +215,8 @@ class TextInput(Widget):
             cursor_selection_enable: bool = True,
             cursor_switch_ms: NumberType = 500,
             history: int = 50,
+            history_coalesce: bool = True,
+            history_maxbytes: int = 0,
             input_type: str = INPUT_TEXT,
             input_underline: str = '',
             input_underline_len: int = 0,
@@ -213,6 +242,8 @@ class TextInput(Widget):
         assert isinstance(cursor_selection_enable, bool)
         assert isinstance(cursor_switch_ms, NumberInstance)
         assert isinstance(history, int)
+        assert isinstance(history_coalesce, bool)
+        assert isinstance(history_maxbytes, int)
         assert isinstance(input_type, str)
         assert isinstance(input_underline, str)
         assert isinstance(input_underline_len, int)
@@ -230,6 +261,7 @@ class TextInput(Widget):
         assert isinstance(valid_chars, (type(None), list))
 
         assert history >= 0, 'history must be equal or greater than zero'
+        assert history_maxbytes >= 0, 'history maxbytes must be equal or greater than zero'
         assert maxchar >= 0, 'maxchar must be equal or greater than zero'
         assert maxwidth >= 0, 'maxwidth must be equal or greater than zero'
         assert len(password_char) == 1, 'password char must be a character'
@@ -253,9 +285,7 @@ class TextInput(Widget):
         )
 
         self._input_string = ''
-        self._ignore_keys = (  # Ignore keys on keyrepeat event
-            KEY_MOVE_DOWN,
-            KEY_MOVE_UP,
+        self._ignore_keys = (  # Ignore keys on keyrepeat event, also the keys bound to move actions
             pygame.K_CAPSLOCK,
             pygame.K_END,
             pygame.K_ESCAPE,
@@ -302,12 +332,16 @@ class TextInput(Widget):
         self._cursor_switch_ms = cursor_switch_ms
         self._cursor_visible = False  # Switches every self._cursor_switch_ms ms
 
-        # History of editions
-        self._history = []
-        self._history_cursor = []
-        self._history_renderbox = []
+        # History of editions, stored as diffs (see _TextInputEdit)
+        self._history = deque()
+        self._history_bytes = 0  # Size of the text stored within the history
+        self._history_coalesce = history_coalesce
+        self._history_cursor = 0  # Cursor of the last status known by the history
         self._history_index = 0  # Index at which the new editions are added
+        self._history_renderbox = (0, 0, 0)  # Renderbox of the last status known by the history
+        self._history_string = ''  # String of the last status known by the history
         self._max_history = history
+        self._max_history_bytes = history_maxbytes
 
         # Text selection
         self._last_selection_render = [0, 0]  # Position, int
@@ -350,11 +384,17 @@ class TextInput(Widget):
         self._password = password
         self._password_char = password_char
         self._title_size = 0
+        self._underline_cache = {}  # (underline len, width, color): (string, surface)
+        self._underline_maxchar_size = -1  # Width of the maxchar probe string, computed on first render
 
     def _apply_font(self) -> None:
         self._ellipsis_size = self._font.size(self._ellipsis)[0]
         self._title_size = self._font.size(self._title)[0]
 
+        # Underline depends on the font and the title size
+        self._underline_cache.clear()
+        self._underline_maxchar_size = -1
+
         # Generate the underline surface
         self._input_underline_size = self._font.size(self._input_underline * 3)[0] / 3
 
@@ -417,15 +457,18 @@ class TextInput(Widget):
         return self
 
     def _draw(self, surface: 'pygame.Surface') -> None:
-        # Draw selection surface
-        if pygame.vernum[0] >= 2:  # pygame 1.9.3 don't have vernum.major
-            surface.blit(self._surface, (self._rect.x, self._rect.y))  # Draw string
-            if self._selection_surface is not None:  # Draw selection
-                surface.blit(self._selection_surface, (self._selection_position[0], self._selection_position[1]))
-        else:
-            if self._selection_surface is not None:  # Draw selection
-                surface.blit(self._selection_surface, (self._selection_position[0], self._selection_position[1]))
-            surface.blit(self._surface, (self._rect.x, self._rect.y))  # Draw string
+        # Cursor and selection are drawn within the overlay, as these change without
+        # changing the widget surface (see Widget.draw). pygame 1.9.3 requires the
+        # selection to be drawn before the string
+        if pygame.vernum[0] < 2 and self._selection_surface is not None:  # pygame 1.9.3 don't have vernum.major
+            surface.blit(self._selection_surface, (self._selection_position[0], self._selection_position[1]))
+        surface.blit(self._surface, (self._rect.x, self._rect.y))  # Draw string
+
+    def _draw_overlay(self, surface: 'pygame.Surface', offset: Tuple2IntType) -> None:
+        # Draw selection
+        if pygame.vernum[0] >= 2 and self._selection_surface is not None:
+            surface.blit(self._selection_surface, (self._selection_position[0] + offset[0],
+                                                   self._selection_position[1] + offset[1]))
 
         # Draw cursor
         if self._selected and self._cursor_surface and \
@@ -434,17 +477,35 @@ class TextInput(Widget):
             x = self._rect.x + self._cursor_surface_pos[0]
             if self._flip[0]:  # Flip on x axis (bug)
                 x = self._surface.get_width() - x
-            surface.blit(self._cursor_surface, (x, self._rect.y + self._cursor_surface_pos[1]))
+            surface.blit(self._cursor_surface, (x + offset[0], self._rect.y + self._cursor_surface_pos[1] + offset[1]))
+
+    def _get_overlay_key(self) -> Optional[Tuple[Any, ...]]:
+        selection = None
+        if pygame.vernum[0] >= 2 and self._selection_surface is not None:
+            selection = (self._selection_surface.get_size(), tuple(self._selection_position))
+        cursor = None
+        if self._selected and self._cursor_surface and \
+                (self._cursor_visible or (self._mouse_is_pressed or self._key_is_pressed)) and \
+                not self.readonly:
+            cursor = (self._cursor_surface.get_size(), tuple(self._cursor_surface_pos), self._flip[0])
+        return tuple(self._rect), selection, cursor, self._cursor_color, self._selection_color
 
     def _render(self) -> Optional[bool]:
         string = self._title + self._get_input_string()  # Render string
 
-        if not self._render_hash_changed(string, self._selected, self._cursor_render,
-                                         self._selection_enabled, self.active, self._visible, self.readonly,
-                                         self._get_max_container_width()):
+        if not self._render_hash_changed(string, self._selected, self._selection_enabled, self.active,
+                                         self._visible, self.readonly, self._get_max_container_width()):
+            # If only the cursor moved, the widget surface does not change, as the cursor
+            # and the selection box are drawn within the overlay
+            if self._cursor_render:
+                self._render_cursor()
+                self._render_selection_box()
+                if pygame.vernum[0] < 2:  # Selection is drawn within the widget surface
+                    self.force_menu_surface_cache_update()
             return True
 
         # Apply underline if exists
+        release_surface(self._surface)
         self._surface = self._render_string_underline(string, self.get_font_color_status())
         self._apply_transforms()
 
@@ -570,11 +631,9 @@ class TextInput(Widget):
 
         current_rect = surface.get_rect()
 
-        # Compute initial char guess
-        if self._input_underline_len != 0:  # User defined the amount of underline chars to use
-            char = self._input_underline_len
-
-        else:  # Compute available width and propose the maximum chars needed (fill all width)
+        # Compute the available width of the underline
+        delta_ch = 0
+        if self._input_underline_len == 0:  # Compute available width to fill with underline chars
 
             # Calculate total available space
             #  |---------------------------------------------------|
@@ -589,33 +648,22 @@ class TextInput(Widget):
                         self._padding[1] - self._padding[3],
                         current_rect.width)
             delta_ch = posx2 - self._title_size - self._selection_effect.get_width()
-            char = math.ceil(delta_ch / self._input_underline_size)
-            for i in range(10):  # Find the best guess for
-                fw = self._font_render_string(self._input_underline * int(char), color).get_width()
-                char += 1
-                if fw >= delta_ch:
-                    break
-
-        # If char limit
-        if self._maxchar != 0 or self._maxwidth_base != 0:
-            max_chars = max(self._maxchar, self._maxwidth_base)
-            basechar = 'O'
-            if self._password:
-                basechar = self._password_char
-            max_size = self._font_render_string(basechar * max_chars)
-            max_size = max_size.get_size()[0]
-            maxchar_char = math.ceil((max_size + self._ellipsis_size) / self._input_underline_size)
-            char = min(char, maxchar_char)
 
-        underline_string = self._input_underline * max(int(char), 0)
-
-        # Render char
+        # The underline only depends on the available width and the color, not on the text
+        cache_key = (self._input_underline_len, delta_ch, color)
+        if cache_key in self._underline_cache:
+            underline_string, underline = self._underline_cache[cache_key]
+        else:
+            underline_string = self._input_underline * max(int(self._get_underline_chars(delta_ch)), 0)
+            underline = self._font_render_string(underline_string, color, use_background_color=False)
+            if len(self._underline_cache) >= 16:  # Text overflowing the container changes the width
+                self._underline_cache.clear()
+            self._underline_cache[cache_key] = (underline_string, underline)
         self._current_underline_string = underline_string
-        underline = self._font_render_string(underline_string, color, use_background_color=False)
 
         # Create a new surface
         new_width = max(self._title_size + underline.get_size()[0], current_rect.width)
-        new_surface = make_surface(new_width, current_rect.height + 3 + self._input_underline_vmargin, alpha=True)
+        new_surface = borrow_surface(new_width, current_rect.height + 3 + self._input_underline_vmargin, alpha=True)
 
         # Compute underline vmargin by its height
         uvm = 5  # underline vertical margin
@@ -627,10 +675,41 @@ class TextInput(Widget):
         # Blit current surface
         new_surface.blit(surface, (0, 0))
         new_surface.blit(underline, (self._title_size, uvm + self._input_underline_vmargin))  # Position (x, y)
+        release_surface(surface)
 
         # Return new surface
         return new_surface
 
+    def _get_underline_chars(self, delta_ch: NumberType) -> int:
+        """
+        Return the number of underline chars that fill the given width.
+
+        :param delta_ch: Available width (px), not used if the user defined the underline length
+        :return: Number of chars
+        """
+        if self._input_underline_len != 0:  # User defined the amount of underline chars to use
+            char = self._input_underline_len
+        else:
+            char = math.ceil(delta_ch / self._input_underline_size)
+            for i in range(10):  # Find the best guess for
+                fw = self._font.size(self._input_underline * int(char))[0]
+                char += 1
+                if fw >= delta_ch:
+                    break
+
+        # If char limit
+        if self._maxchar != 0 or self._maxwidth_base != 0:
+            if self._underline_maxchar_size == -1:
+                basechar = 'O'
+                if self._password:
+                    basechar = self._password_char
+                max_chars = max(self._maxchar, self._maxwidth_base)
+                self._underline_maxchar_size = self._font.size(basechar * max_chars)[0]
+            maxchar_char = math.ceil((self._underline_maxchar_size + self._ellipsis_size) / self._input_underline_size)
+            char = min(char, maxchar_char)
+
+        return char
+
     def _render_cursor(self) -> None:
         """
         Cursor is rendered and stored.
@@ -1041,6 +1120,20 @@ class TextInput(Widget):
         self._update_renderbox()  # Updates cursor
         self._render()  # Renders the selection box
 
+    def set_default_value(self, value: Any) -> 'TextInput':
+        # If there's no edition yet, the default value is the base status of the
+        # history instead of an edition that can be undone
+        seed_history = len(self._history) == 0
+        super(TextInput, self).set_default_value(value)
+        if seed_history:
+            self._history.clear()
+            self._history_bytes = 0
+            self._history_index = 0
+            self._history_string = self._input_string
+            self._history_cursor = self._cursor_position
+            self._history_renderbox = tuple(self._renderbox)
+        return self
+
     def _check_input_size(self) -> bool:
         """
         Check input size.
@@ -1152,30 +1245,36 @@ class TextInput(Widget):
         assert isinstance(new_string, str)
         assert isinstance(update_history, bool)
 
-        l_history = len(self._history)
-
         # If last edition is different than the new one -> updates the history
-        if update_history and \
-                ((l_history > 0 and self._history[
-                    l_history - 1] != new_string) or l_history == 0) and self._max_history > 0:
-
-            # If index is not at last add the current status as new
-            if self._history_index != l_history:
-                last_string = self._history[self._history_index]
-                self._history_index = len(self._history)
-                self._update_input_string(last_string)
-
-            # Add new status to history
-            self._history.insert(self._history_index, new_string)
-            self._history_cursor.insert(self._history_index, self._cursor_position)
-            self._history_renderbox.insert(self._history_index,
-                                           [self._renderbox[0], self._renderbox[1], self._renderbox[2]])
-
-            if len(self._history) > self._max_history:
-                self._history.pop(0)
-                self._history_cursor.pop(0)
-                self._history_renderbox.pop(0)
-            self._history_index = len(self._history)  # This can be changed with undo/redo
+        if update_history and self._max_history > 0 and self._history_string != new_string:
+            pos, removed, inserted = _diff_strings(self._history_string, new_string)
+            edit = _TextInputEdit(pos, removed, inserted,
+                                  self._history_cursor, self._history_renderbox,
+                                  self._cursor_position, tuple(self._renderbox))
+
+            # Discard the editions that were undone, the new one replaces them
+            coalesce = self._history_coalesce and len(self._history) > 0 and \
+                       self._history_index == len(self._history)
+            while len(self._history) > self._history_index:
+                self._history_bytes -= self._history.pop().size
+
+            # Merge consecutive typing within the last edition, else add a new one
+            if coalesce and self._history[-1].merge(edit):
+                self._history_bytes += edit.size
+            else:
+                self._history.append(edit)
+                self._history_bytes += edit.size
+                self._history_index += 1
+
+            # Evict the oldest editions if limits are exceeded
+            while len(self._history) > self._max_history or \
+                    (0 < self._max_history_bytes < self._history_bytes and len(self._history) > 1):
+                self._history_bytes -= self._history.popleft().size
+                self._history_index -= 1
+
+            self._history_string = new_string
+            self._history_cursor = self._cursor_position
+            self._history_renderbox = tuple(self._renderbox)
 
         # Updates string
         self._input_string = new_string
@@ -1309,17 +1408,21 @@ class TextInput(Widget):
 
         return True
 
-    def _update_from_history(self) -> None:
+    def _update_from_history(self, cursor: int, renderbox: Tuple[int, int, int]) -> None:
         """
         Update all from history.
 
+        :param cursor: Cursor position
+        :param renderbox: Renderbox
         :return: None
         """
-        self._input_string = self._history[self._history_index]
-        self._renderbox[0] = self._history_renderbox[self._history_index][0]
-        self._renderbox[1] = self._history_renderbox[self._history_index][1]
-        self._renderbox[2] = self._history_renderbox[self._history_index][2]
-        self._cursor_position = self._history_cursor[self._history_index]
+        self._history_string = self._input_string
+        self._history_cursor = cursor
+        self._history_renderbox = renderbox
+        self._renderbox[0] = renderbox[0]
+        self._renderbox[1] = renderbox[1]
+        self._renderbox[2] = renderbox[2]
+        self._cursor_position = cursor
         self._cursor_render = True
 
     def _undo(self) -> bool:
@@ -1330,10 +1433,10 @@ class TextInput(Widget):
         """
         if self._history_index == 0:  # There's no back history
             return False
-        if self._history_index == len(self._history):  # If the actual is the last
-            self._history_index -= 1
-        self._history_index = max(0, self._history_index - 1)
-        self._update_from_history()
+        self._history_index -= 1
+        edit: '_TextInputEdit' = self._history[self._history_index]
+        self._input_string = edit.undo(self._input_string)
+        self._update_from_history(edit.cursor_before, edit.renderbox_before)
         return True
 
     def _redo(self) -> bool:
@@ -1342,10 +1445,12 @@ class TextInput(Widget):
 
         :return: ``True`` if redo
         """
-        if self._history_index == len(self._history) - 1:  # There's no forward history
+        if self._history_index == len(self._history):  # There's no forward history
             return False
-        self._history_index = min(len(self._history) - 1, self._history_index + 1)
-        self._update_from_history()
+        edit: '_TextInputEdit' = self._history[self._history_index]
+        self._history_index += 1
+        self._input_string = edit.redo(self._input_string)
+        self._update_from_history(edit.cursor_after, edit.renderbox_after)
         return True
 
     def _remove_selection(self) -> None:
@@ -1475,6 +1580,18 @@ class TextInput(Widget):
                 self._sound.play_event_error()
         return False
 
+    def get_event_types(self) -> Optional[FrozenSet[int]]:
+        return frozenset((pygame.ACTIVEEVENT, pygame.KEYDOWN, pygame.KEYUP, pygame.MOUSEBUTTONDOWN,
+                          pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION, FINGERDOWN, FINGERUP)) | \
+            self._get_controller().get_event_types()
+
+    def _get_idle_timeout(self) -> Optional[int]:
+        if self.readonly or not self.is_visible():
+            return None
+        if self._mouse_is_pressed or len(self._keyrepeat_counters) > 0 or len(self._events) > 0:
+            return 0
+        return max(0, int(self._cursor_switch_ms - self._cursor_ms_counter))
+
     def update(self, events: EventVectorType) -> bool:
         self._clock.tick(60)
 
@@ -1493,8 +1610,7 @@ class TextInput(Widget):
         self._cursor_ms_counter += time_clock
         if self._cursor_ms_counter >= self._cursor_switch_ms:
             self._cursor_ms_counter %= self._cursor_switch_ms
-            self._cursor_visible = not self._cursor_visible
-            self.force_menu_surface_cache_update()
+            self._cursor_visible = not self._cursor_visible  # Cursor is drawn within the overlay
 
         updated = False
         events = self._merge_events(events)  # Extend events with custom events
@@ -1515,10 +1631,11 @@ class TextInput(Widget):
                 self._cursor_visible = True  # So the user sees where he writes
                 self._key_is_pressed = True
                 self._last_key = event.key
+                action = self._get_action(event)
 
                 # If None exist, create counter for that key:
                 if event.key not in self._keyrepeat_counters and event.key not in self._ignore_keys and \
-                        'unicode' in event.dict:
+                        action not in (ACTION_MOVE_DOWN, ACTION_MOVE_UP) and 'unicode' in event.dict:
                     self._keyrepeat_counters[event.key] = [0, event.unicode]
 
                 # User press ctrl+something
@@ -1681,11 +1798,11 @@ class TextInput(Widget):
                     updated = True
 
                 # Up arrow
-                elif event.key == KEY_MOVE_UP:
+                elif action == ACTION_MOVE_UP:
                     self.active = False
 
                 # Down arrow
-                elif event.key == KEY_MOVE_DOWN:
+                elif action == ACTION_MOVE_DOWN:
                     self.active = False
 
                 # End
@@ -1714,7 +1831,7 @@ class TextInput(Widget):
                     self.active = True
 
                 # Enter
-                elif event.key == KEY_APPLY:
+                elif action == ACTION_APPLY:
                     self._sound.play_open_menu()
                     self.apply()
                     self._unselect_text()
@@ -1836,3 +1953,119 @@ class TextInput(Widget):
             self.apply_update_callbacks()
 
         return updated
+
+
+def _diff_strings(old: str, new: str) -> Tuple[int, str, str]:
+    """
+    Compute the single edition that transforms ``old`` into ``new``. The common
+    prefix and suffix are found by bisection, so the comparisons run in C.
+
+    :param old: Old string
+    :param new: New string
+    :return: Position of the edition, removed text, inserted text
+    """
+    max_common = min(len(old), len(new))
+
+    # Common prefix
+    lo, hi = 0, max_common
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if old[:mid] == new[:mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    prefix = lo
+
+    # Common suffix, it cannot overlap the prefix
+    lo, hi = 0, max_common - prefix
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if old[len(old) - mid:] == new[len(new) - mid:]:
+            lo = mid
+        else:
+            hi = mid - 1
+    suffix = lo
+
+    return prefix, old[prefix:len(old) - suffix], new[prefix:len(new) - suffix]
+
+
+class _TextInputEdit(object):
+    """
+    Edition stored within the TextInput history. Only the changed text is kept,
+    thus, the memory used does not depend on the length of the input.
+
+    :param pos: Position of the edition within the string
+    :param removed: Removed text
+    :param inserted: Inserted text
+    :param cursor_before: Cursor position before the edition
+    :param renderbox_before: Renderbox before the edition
+    :param cursor_after: Cursor position after the edition
+    :param renderbox_after: Renderbox after the edition
+    """
+    __slots__ = ('cursor_after', 'cursor_before', 'inserted', 'pos', 'removed', 'renderbox_after',
+                 'renderbox_before', 'size')
+
+    def __init__(
+            self,
+            pos: int,
+            removed: str,
+            inserted: str,
+            cursor_before: int,
+            renderbox_before: Tuple[int, int, int],
+            cursor_after: int,
+            renderbox_after: Tuple[int, int, int]
+    ) -> None:
+        self.cursor_after = cursor_after
+        self.cursor_before = cursor_before
+        self.inserted = inserted
+        self.pos = pos
+        self.removed = removed
+        self.renderbox_after = renderbox_after
+        self.renderbox_before = renderbox_before
+        self.size = len(removed.encode('utf-8')) + len(inserted.encode('utf-8'))
+
+    def merge(self, edit: '_TextInputEdit') -> bool:
+        """
+        Merge the given edition if both are consecutive typing (or deletion) of
+        single characters. Typing a space after a word starts a new edition.
+
+        :param edit: Edition that follows this one
+        :return: ``True`` if merged
+        """
+        if self.removed == '' and edit.removed == '' and len(edit.inserted) == 1:  # Typing
+            if edit.pos != self.pos + len(self.inserted) or \
+                    (edit.inserted.isspace() and not self.inserted[-1].isspace()):
+                return False
+            self.inserted += edit.inserted
+        elif self.inserted == '' and edit.inserted == '' and len(edit.removed) == 1:
+            if edit.pos == self.pos - 1:  # Backspace
+                self.pos = edit.pos
+                self.removed = edit.removed + self.removed
+            elif edit.pos == self.pos:  # Delete
+                self.removed += edit.removed
+            else:
+                return False
+        else:
+            return False
+        self.cursor_after = edit.cursor_after
+        self.renderbox_after = edit.renderbox_after
+        self.size += edit.size
+        return True
+
+    def undo(self, string: str) -> str:
+        """
+        Revert the edition.
+
+        :param string: String after the edition
+        :return: String before the edition
+        """
+        return string[:self.pos] + self.removed + string[self.pos + len(self.inserted):]
+
+    def redo(self, string: str) -> str:
+        """
+        Apply the edition.
+
+        :param string: String before the edition
+        :return: String after the edition
+        """
+        return string[:self.pos] + self.inserted + string[self.pos + len(self.removed):]
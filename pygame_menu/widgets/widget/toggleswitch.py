@@ -34,16 +34,15 @@ __all__ = ['ToggleSwitch']
 import pygame
 import pygame_menu
 
-from pygame_menu.controls import JOY_BUTTON_SELECT, JOY_LEFT, JOY_RIGHT, JOY_AXIS_X, JOY_DEADZONE, \
-    KEY_APPLY, KEY_LEFT, KEY_RIGHT
+from pygame_menu.controls import ACTION_APPLY, ACTION_LEFT, ACTION_RIGHT
 from pygame_menu.font import FontType, assert_font
 from pygame_menu.locals import FINGERUP
-from pygame_menu.utils import check_key_pressed_valid, assert_color, assert_vector, make_surface, \
-    get_finger_pos
+from pygame_menu.utils import check_key_pressed_valid, assert_color, assert_vector, \
+    get_finger_pos, borrow_surface, release_surface
 from pygame_menu.widgets.core import Widget
 
 from pygame_menu._types import Any, CallbackType, Union, List, Tuple, Optional, ColorType, NumberType, \
-    Tuple2NumberType, Tuple2IntType, NumberInstance, ColorInputType, EventVectorType
+    Tuple2NumberType, Tuple2IntType, NumberInstance, ColorInputType, EventVectorType, FrozenSet
 
 
 # noinspection PyMissingOrEmptyDocstring
@@ -88,6 +87,12 @@ class ToggleSwitch(Widget):
     :param args: Optional arguments for callbacks
     :param kwargs: Optional keyword arguments
     """
+    __slots__ = ('_infinite', '_slider', '_slider_color', '_slider_height', '_slider_height_factor', '_slider_pos',
+                 '_slider_thickness', '_slider_vmargin', '_state', '_state_color', '_state_font', '_state_text',
+                 '_state_text_font', '_state_text_font_color', '_state_text_font_size', '_state_text_position',
+                 '_state_values', '_state_width', '_state_width_accum', '_switch', '_switch_border_color',
+                 '_switch_border_width', '_switch_font_rendered', '_switch_height', '_switch_height_factor',
+                 '_switch_margin', '_switch_pos', '_switch_width', '_total_states')
     _infinite: bool
     _slider: Optional['pygame.Surface']
     _slider_color: ColorType
@@ -104,6 +109,7 @@ class ToggleSwitch(Widget):
     _state_text_font_color: Tuple[ColorType, ...]
     _state_text_font_size: Optional[int]
     _state_text_position: Tuple2NumberType
+    _state_width_accum: List[int]
     _state_values: Tuple[Any, ...]
     _state_width: List[int]
     _switch: Optional['pygame.Surface']
@@ -211,6 +217,7 @@ class ToggleSwitch(Widget):
         self._switch_border_color = switch_border_color
         self._switch_border_width = switch_border_width
         self._infinite = infinite
+        self._slider = None
         self._slider_color = slider_color
         self._slider_height_factor = slider_height_factor
         self._slider_thickness = slider_thickness
@@ -224,6 +231,7 @@ class ToggleSwitch(Widget):
         self._state_text_position = state_text_position
         self._state_values = state_values
         self._state_width = state_width
+        self._switch = None
         self._switch_height_factor = float(switch_height)
         self._switch_margin = switch_margin
 
@@ -324,17 +332,20 @@ class ToggleSwitch(Widget):
             return True
 
         # Create basic title
+        release_surface(self._surface)
         self._surface = self._render_string(self._title, self.get_font_color_status())
         self._rect.width, self._rect.height = self._surface.get_size()
 
         # Create slider
-        self._slider = make_surface(self._slider_thickness, self._slider_height,
-                                    fill_color=self._slider_color)
+        release_surface(self._slider)
+        self._slider = borrow_surface(self._slider_thickness, self._slider_height,
+                                      fill_color=self._slider_color)
         self._slider_pos = (self._state_width_accum[self._state], self._slider_vmargin * self._switch_height)
 
         # Create the switch surface
-        self._switch = make_surface(self._switch_width, self._switch_height,
-                                    fill_color=self._state_color[self._state])
+        release_surface(self._switch)
+        self._switch = borrow_surface(self._switch_width, self._switch_height,
+                                      fill_color=self._state_color[self._state])
         self._switch_pos = (self._rect.width, int((self._switch_height - self._rect.height) / 2))
 
         # Update maximum rect height
@@ -378,6 +389,10 @@ class ToggleSwitch(Widget):
             self.change()
             self._sound.play_key_add()
 
+    def get_event_types(self) -> Optional[FrozenSet[int]]:
+        return frozenset((pygame.ACTIVEEVENT, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION, FINGERUP)) | \
+            self._get_controller().get_event_types()
+
     def update(self, events: EventVectorType) -> bool:
         if self.readonly or not self.is_visible():
             return False
@@ -393,28 +408,20 @@ class ToggleSwitch(Widget):
             self._check_mouseover(event)
 
             # Events
-            keydown = self._keyboard_enabled and event.type == pygame.KEYDOWN
-            joy_hatmotion = self._joystick_enabled and event.type == pygame.JOYHATMOTION
-            joy_axismotion = self._joystick_enabled and event.type == pygame.JOYAXISMOTION
+            action = self._get_action(event)
 
             # Left button
-            if keydown and event.key == KEY_LEFT or \
-                    joy_hatmotion and event.value == JOY_LEFT or \
-                    joy_axismotion and event.axis == JOY_AXIS_X and event.value < JOY_DEADZONE:
+            if action == ACTION_LEFT:
                 self._left()
                 updated = True
 
             # Right button
-            elif keydown and event.key == KEY_RIGHT or \
-                    joy_hatmotion and event.value == JOY_RIGHT or \
-                    joy_axismotion and event.axis == JOY_AXIS_X and event.value > -JOY_DEADZONE:
+            elif action == ACTION_RIGHT:
                 self._right()
                 updated = True
 
             # Press enter
-            elif keydown and event.key == KEY_APPLY and self._total_states == 2 or \
-                    event.type == pygame.JOYBUTTONDOWN and self._joystick_enabled and \
-                    event.button == JOY_BUTTON_SELECT and self._total_states == 2:
+            elif action == ACTION_APPLY and self._total_states == 2:
                 self._sound.play_key_add()
                 self._state = int(not self._state)
                 self.change()
@@ -50,6 +50,7 @@ class VMargin(NoneWidget):
     :param margin: Vertical margin (px)
     :param widget_id: ID of the widget
     """
+    __slots__ = ()
 
     def __init__(
             self,
@@ -43,6 +43,7 @@ import pygame_menu
 
 from pygame_menu.baseimage import IMAGE_MODE_CENTER, IMAGE_MODE_FILL, IMAGE_MODE_REPEAT_X, \
     IMAGE_MODE_REPEAT_XY, IMAGE_MODE_REPEAT_Y, IMAGE_MODE_SIMPLE
+from pygame_menu.utils import convert_surface, get_display_format
 
 
 class BaseImageTest(unittest.TestCase):
@@ -403,3 +404,69 @@ class BaseImageTest(unittest.TestCase):
         image.draw(surface, r)
         self.assertNotEqual(image._last_transform[2], s)
         self.assertEqual(image._last_transform[0], 300)
+
+    def test_display_format(self) -> None:
+        """
+        Test the conversion to the display format.
+        """
+        # Opaque surfaces are converted without alpha
+        s = pygame.Surface((10, 10), pygame.SRCALPHA, 32)
+        s.fill((255, 0, 0, 255))
+        self.assertFalse(convert_surface(s).get_flags() & pygame.SRCALPHA)
+        s.set_at((0, 0), (255, 0, 0, 100))
+        self.assertTrue(convert_surface(s).get_flags() & pygame.SRCALPHA)
+        s.set_alpha(None)  # Disables blending
+        self.assertFalse(convert_surface(s).get_flags() & pygame.SRCALPHA)
+
+        # Colorkey and surface alpha are kept
+        s = pygame.Surface((10, 10))
+        s.set_colorkey((0, 0, 0))
+        s.set_alpha(100)
+        c = convert_surface(s)
+        self.assertEqual(c.get_colorkey(), (0, 0, 0, 255))
+        self.assertEqual(c.get_alpha(), 100)
+        self.assertTrue(c.get_flags() & (pygame.RLEACCEL | pygame.RLEACCELOK))
+        self.assertFalse(convert_surface(s, rle=False).get_flags() & (pygame.RLEACCEL | pygame.RLEACCELOK))
+
+        # Image draw uses the converted surface
+        image = pygame_menu.BaseImage(pygame_menu.baseimage.IMAGE_EXAMPLE_WALLPAPER)
+        image.set_drawing_mode(pygame_menu.baseimage.IMAGE_MODE_SIMPLE)
+        self.assertIsNone(image._display_surface[2])
+        image.draw(surface)
+        converted = image._display_surface[2]
+        self.assertEqual(image._display_surface[1], get_display_format())
+        self.assertEqual(converted.get_masks()[0:3], surface.get_masks()[0:3])
+        image.draw(surface)
+        self.assertIs(image._display_surface[2], converted)
+
+        # Modifying the image, or changing the display format, converts it again
+        image.set_at((0, 0), (255, 0, 0))
+        image.draw(surface)
+        self.assertIsNot(image._display_surface[2], converted)
+        self.assertEqual(image._display_surface[2].get_at((0, 0)), (255, 0, 0, 255))
+        converted = image._display_surface[2]
+        image.flip(True, False)
+        image.draw(surface)
+        self.assertIsNot(image._display_surface[2], converted)
+        converted = image._display_surface[2]
+        image._display_surface = (image._surface, (8, (0, 0, 0, 0)), converted)
+        image.draw(surface)
+        self.assertIsNot(image._display_surface[2], converted)
+
+        # Returning the raw surface drops the converted copy, as it may be modified
+        image.get_surface(new=False).fill((0, 255, 0))
+        self.assertIsNone(image._display_surface[2])
+        image.draw(surface)
+        self.assertEqual(image._display_surface[2].get_at((0, 0)), (0, 255, 0, 255))
+
+        # Menu widgets surface is also converted
+        menu = pygame_menu.Menu('Menu', 300, 300)
+        menu.add.button('button')
+        menu.draw(surface)
+        widgets_surface = menu._widgets_surface
+        self.assertEqual(menu._widgets_surface_last[3], get_display_format())
+        menu.draw(surface)
+        self.assertIs(menu._widgets_surface, widgets_surface)
+        menu._widgets_surface_last = menu._widgets_surface_last[0:3] + ((8, (0, 0, 0, 0)),)
+        menu.draw(surface)
+        self.assertIsNot(menu._widgets_surface, widgets_surface)
@@ -0,0 +1,187 @@
+"""
+pygame-menu
+https://github.com/ppizarror/pygame-menu
+
+TEST CONTROLS
+Test controls.
+
+License:
+-------------------------------------------------------------------------------
+The MIT License (MIT)
+Copyright 2017-2021 Pablo Pizarro R. @ppizarror
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the Software
+is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+-------------------------------------------------------------------------------
+"""
+
+__all__ = ['ControlsTest']
+
+from test._utils import MenuUtils, PygameEventUtils
+import unittest
+
+import pygame
+import pygame_menu
+
+from pygame_menu.controls import Controller, ACTION_APPLY, ACTION_LEFT, ACTION_MOVE_DOWN, ACTION_MOVE_UP, \
+    ACTION_RIGHT, KEY_APPLY, KEY_MOVE_DOWN, JOY_AXIS_X, JOY_BUTTON_BACK, JOY_BUTTON_SELECT, JOY_UP
+
+
+class ControlsTest(unittest.TestCase):
+
+    def test_controller(self) -> None:
+        """
+        Test the controller bindings.
+        """
+        ctrl = Controller()
+        self.assertEqual(ctrl.get_action(PygameEventUtils.key(KEY_APPLY, keydown=True, inlist=False)), ACTION_APPLY)
+        self.assertIsNone(ctrl.get_action(PygameEventUtils.key(KEY_APPLY, keyup=True, inlist=False)))
+        self.assertEqual(ctrl.get_action(PygameEventUtils.joy_key(JOY_UP, inlist=False)), ACTION_MOVE_DOWN)
+        self.assertEqual(ctrl.get_action(pygame.event.Event(pygame.JOYBUTTONDOWN, {'button': JOY_BUTTON_SELECT})),
+                         ACTION_APPLY)
+        self.assertIsNone(ctrl.get_action(pygame.event.Event(pygame.USEREVENT)))
+        self.assertIn((pygame.KEYDOWN, KEY_APPLY), ctrl.get_bindings(ACTION_APPLY))
+
+        # Joy axis, the value must be outside the deadzone
+        self.assertEqual(ctrl.get_key(PygameEventUtils.joy_motion(-1, inlist=False)), (JOY_AXIS_X, -1))
+        self.assertEqual(ctrl.get_action(PygameEventUtils.joy_motion(-1, inlist=False)), ACTION_LEFT)
+        self.assertEqual(ctrl.get_action(PygameEventUtils.joy_motion(1, inlist=False)), ACTION_RIGHT)
+        self.assertEqual(ctrl.get_action(PygameEventUtils.joy_motion(y=-1, inlist=False)), ACTION_MOVE_DOWN)
+        self.assertEqual(ctrl.get_action(PygameEventUtils.joy_motion(y=1, inlist=False)), ACTION_MOVE_UP)
+        self.assertIsNone(ctrl.get_key(PygameEventUtils.joy_motion(0.1, inlist=False)))
+        self.assertIsNone(ctrl.get_action(PygameEventUtils.center_joy()[0]))
+        self.assertEqual(Controller(joy_deadzone=0).get_action(PygameEventUtils.joy_motion(0.1, inlist=False)),
+                         ACTION_RIGHT)
+        self.assertRaises(AssertionError, lambda: Controller(joy_deadzone=1))
+
+        # Rebind
+        ctrl.bind(ACTION_APPLY, pygame.KEYDOWN, pygame.K_SPACE)
+        ctrl.unbind(pygame.KEYDOWN, KEY_APPLY)
+        self.assertEqual(ctrl.get_action(PygameEventUtils.key(pygame.K_SPACE, keydown=True, inlist=False)),
+                         ACTION_APPLY)
+        self.assertIsNone(ctrl.get_action(PygameEventUtils.key(KEY_APPLY, keydown=True, inlist=False)))
+        self.assertNotIn((pygame.KEYDOWN, KEY_APPLY), ctrl.get_bindings(ACTION_APPLY))
+        self.assertRaises(AssertionError, lambda: ctrl.bind(ACTION_APPLY, pygame.KEYDOWN, None))
+
+        # Reset
+        ctrl.reset()
+        self.assertIsNone(ctrl.get_action(PygameEventUtils.key(pygame.K_SPACE, keydown=True, inlist=False)))
+        self.assertEqual(ctrl.get_action(PygameEventUtils.key(KEY_APPLY, keydown=True, inlist=False)), ACTION_APPLY)
+
+    def test_menu(self) -> None:
+        """
+        Test the controller shared by the Menu and its widgets.
+        """
+        menu = MenuUtils.generic_menu()
+        self.assertIsInstance(menu.get_controller(), Controller)
+        self.assertRaises(AssertionError, lambda: menu.set_controller(None))
+        applied = []
+        btn = menu.add.button('button', lambda: applied.append(True))
+        sel = menu.add.selector('selector', [('a', 1), ('b', 2)])
+        menu.add.button('button 2')
+        self.assertEqual(menu.get_selected_widget(), btn)
+
+        # Rebind the controls without modifying the module
+        ctrl = Controller()
+        ctrl.bind(ACTION_APPLY, pygame.KEYDOWN, pygame.K_SPACE)
+        ctrl.bind(ACTION_MOVE_UP, pygame.KEYDOWN, pygame.K_s)
+        ctrl.bind(ACTION_RIGHT, pygame.KEYDOWN, pygame.K_d)
+        ctrl.unbind(pygame.KEYDOWN, KEY_MOVE_DOWN)
+        menu.set_controller(ctrl)
+        self.assertEqual(menu.get_controller(), ctrl)
+
+        menu.update(PygameEventUtils.key(pygame.K_SPACE, keydown=True))
+        self.assertEqual(applied, [True])
+        menu.update(PygameEventUtils.key(KEY_APPLY, keydown=True))
+        self.assertEqual(applied, [True, True])  # Default binding is kept
+        menu.update(PygameEventUtils.key(pygame.K_s, keydown=True))
+        self.assertEqual(menu.get_selected_widget(), sel)
+        menu.update(PygameEventUtils.key(KEY_MOVE_DOWN, keydown=True))
+        self.assertEqual(menu.get_selected_widget(), sel)
+        menu.update(PygameEventUtils.key(pygame.K_d, keydown=True))
+        self.assertEqual(sel.get_value(), (('b', 2), 1))
+
+        # Widgets without menu use the default bindings
+        sel = pygame_menu.widgets.Selector('selector', [('a', 1), ('b', 2)])
+        self.assertIsNone(sel.get_menu())
+        sel.update(PygameEventUtils.key(pygame.K_d, keydown=True))
+        self.assertEqual(sel.get_value(), (('a', 1), 0))
+
+        # The joy axis within the deadzone does not change the selector
+        sel.update(PygameEventUtils.joy_motion(-0.1))
+        self.assertEqual(sel.get_value(), (('a', 1), 0))
+        sel.update(PygameEventUtils.joy_motion(1))
+        self.assertEqual(sel.get_value(), (('b', 2), 1))
+
+        # Disabled devices ignore the bindings
+        sel.set_controls(joystick=False)
+        sel.update(PygameEventUtils.joy_motion(1))
+        self.assertEqual(sel.get_value(), (('b', 2), 1))
+
+        # The joystick back button returns to the previous Menu, even without menubar
+        theme = pygame_menu.themes.THEME_DEFAULT.copy()
+        theme.title_bar_style = pygame_menu.widgets.MENUBAR_STYLE_NONE
+        menu = MenuUtils.generic_menu(theme=theme)
+        submenu = MenuUtils.generic_menu()
+        menu.add.button('submenu', submenu).apply()
+        self.assertEqual(menu.get_current(), submenu)
+        menu.update([pygame.event.Event(pygame.JOYBUTTONDOWN, {'button': JOY_BUTTON_BACK})])
+        self.assertEqual(menu.get_current(), menu)
+
+    def test_dropselect(self) -> None:
+        """
+        Test the dropselect actions do not depend on the input device.
+        """
+        menu = MenuUtils.generic_menu()
+        drop = menu.add.dropselect('drop', [('a', 1), ('b', 2), ('c', 3)])
+        ctrl = Controller()
+        ctrl.bind(ACTION_MOVE_UP, pygame.JOYBUTTONDOWN, 5)
+        ctrl.bind(ACTION_LEFT, pygame.KEYDOWN, pygame.K_a)
+        menu.set_controller(ctrl)
+        menu.update(PygameEventUtils.key(KEY_APPLY, keydown=True))
+        self.assertTrue(drop.active)
+        menu.update([pygame.event.Event(pygame.JOYBUTTONDOWN, {'button': 5})])
+        self.assertEqual(drop.get_index(), 0)
+        menu.update([pygame.event.Event(pygame.JOYBUTTONDOWN, {'button': 5})])
+        self.assertEqual(drop.get_index(), 1)
+        menu.update(PygameEventUtils.key(pygame.K_a, keydown=True))
+        self.assertEqual(drop.get_index(), 0)
+
+    def test_textinput(self) -> None:
+        """
+        Test the textinput ignores the keys bound to the move actions of the controller.
+        """
+        menu = MenuUtils.generic_menu()
+        text = menu.add.text_input('text: ')
+        btn = menu.add.button('button')
+        ctrl = Controller()
+        ctrl.bind(ACTION_MOVE_DOWN, pygame.KEYDOWN, pygame.K_s)
+        menu.set_controller(ctrl)
+        self.assertEqual(menu.get_selected_widget(), text)
+
+        # The bound key is neither typed nor repeated
+        menu.update(PygameEventUtils.key(pygame.K_s, keydown=True, char='s'))
+        self.assertEqual(text.get_value(), '')
+        self.assertNotIn(pygame.K_s, text._keyrepeat_counters)
+        self.assertEqual(menu.get_selected_widget(), btn)
+
+        # Once unbound, the key is typed again
+        ctrl.unbind(pygame.KEYDOWN, pygame.K_s)
+        text.select(update_menu=True)
+        menu.update(PygameEventUtils.key(pygame.K_s, keydown=True, char='s'))
+        self.assertEqual(text.get_value(), 's')
+        self.assertIn(pygame.K_s, text._keyrepeat_counters)
@@ -144,6 +144,28 @@ class DecoratorTest(unittest.TestCase):
         self.assertRaises(Exception, lambda: copy.copy(deco))
         self.assertRaises(Exception, lambda: copy.deepcopy(deco))
 
+    def test_lazy(self) -> None:
+        """
+        Test the decorators are created on first access.
+        """
+        menu = MenuUtils.generic_menu()
+        btn = menu.add.button('button')
+        frame = menu.add.frame_v(300, 400, max_height=100)
+        sa = menu.get_scrollarea()
+        menu.draw(surface)
+        self.assertIsNone(btn._decorator)
+        self.assertIsNone(frame._frame_scrollarea._decorator)
+        self.assertIsNone(sa._decorator)
+
+        # Create the decorators
+        deco = btn.get_decorator()
+        self.assertEqual(btn.get_decorator(), deco)
+        deco.add_rect(0, 0, pygame.Rect(0, 0, 10, 10), (0, 0, 0))
+        self.assertEqual(frame.get_decorator(), frame._frame_scrollarea._decorator)
+        sa.get_decorator().add_rect(0, 0, pygame.Rect(0, 0, 10, 10), (0, 0, 0))
+        menu.draw(surface)
+        self.assertEqual(deco._total_decor(), 1)
+
     def test_add_remove(self) -> None:
         """
         Test add remove.
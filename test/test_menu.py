@@ -38,6 +38,7 @@ import copy
 import math
 import timeit
 import unittest
+from unittest import mock
 
 import pygame
 import pygame_menu
@@ -46,11 +47,12 @@ from pygame_menu import events
 from pygame_menu.controls import KEY_MOVE_DOWN, KEY_MOVE_UP, KEY_LEFT, KEY_RIGHT, JOY_DOWN, JOY_UP, \
     JOY_LEFT, JOY_RIGHT
 from pygame_menu.locals import FINGERDOWN, FINGERMOTION
-from pygame_menu.utils import set_pygame_cursor
+from pygame_menu.utils import set_pygame_cursor, convert_surface, get_display_format
 from pygame_menu.widgets import Label, Button
 
 # Configure the tests
 TEST_TIME_DRAW = False
+TEST_TIME_EVENTS = False
 
 
 def dummy_function() -> None:
@@ -113,6 +115,31 @@ class MenuTest(unittest.TestCase):
         # (decorator) with surface cache, 0.1033874000000008
         print(timeit.timeit(lambda: draw_and_update(), number=100))
 
+    @staticmethod
+    def test_time_events() -> None:
+        """
+        This test the time that takes to menu to process several events.
+        """
+        if not TEST_TIME_EVENTS:
+            return
+        menu = MenuUtils.generic_menu(title='EPIC')
+        for i in range(30):
+            menu.add.button(title='epic', action=events.BACK)
+            menu.add.selector(title='epic selector', items=[('1', '3'), ('2', '4')])
+
+        # Events which do not update the menu, thus, all of them are processed
+        ev = []
+        for i in range(2500):
+            ev.append(PygameEventUtils.key(pygame.K_a, keydown=True, inlist=False))
+            ev.append(PygameEventUtils.key(pygame.K_a, keyup=True, inlist=False))
+            ev.append(pygame.event.Event(pygame.JOYAXISMOTION, {'axis': 0, 'value': 0.01, 'test': True}))
+            ev.append(pygame.event.Event(pygame.USEREVENT, {'test': True}))
+
+        # (if/elif chain) 10k events, 0.408
+        # (dispatch table) 10k events, 0.196
+        # (event types filter) 10k events, 0.146
+        print(timeit.timeit(lambda: menu.update(list(ev)), number=10) / 10)
+
     def test_copy(self) -> None:
         """
         Test menu copy.
@@ -801,6 +828,187 @@ class MenuTest(unittest.TestCase):
         self.menu.update(PygameEventUtils.key(pygame_menu.controls.KEY_BACK, keydown=True))  # go back
         self.assertEqual(self.menu._get_depth(), 0)
 
+    def test_event_binding(self) -> None:
+        """
+        Test custom event bindings.
+        """
+        menu = MenuUtils.generic_menu()
+        menu.add.button('button 1')
+        menu.add.button('button 2')
+        self.assertEqual(menu.get_index(), 0)
+        self.assertRaises(AssertionError, lambda: menu.add_event_binding(pygame.KEYDOWN, 1))
+
+        # Bind a key, this replaces the default handler
+        pressed = []
+
+        def on_key(event: 'pygame.event.Event', m: 'pygame_menu.Menu') -> bool:
+            pressed.append(event.key)
+            self.assertEqual(m, menu)
+            return True
+
+        menu.add_event_binding(pygame.KEYDOWN, on_key, KEY_MOVE_DOWN)
+        self.assertTrue(menu.update(PygameEventUtils.key(KEY_MOVE_DOWN, keydown=True)))
+        self.assertEqual(pressed, [KEY_MOVE_DOWN])
+        self.assertEqual(menu.get_index(), 0)
+
+        # The callback stops the processing of the remaining events
+        self.assertTrue(menu.update(PygameEventUtils.keydown([KEY_MOVE_DOWN, KEY_MOVE_UP])))
+        self.assertEqual(pressed, [KEY_MOVE_DOWN, KEY_MOVE_DOWN])
+        self.assertEqual(menu.get_index(), 0)
+
+        # Bind all the keys, the keys with handlers are not affected
+        menu.add_event_binding(pygame.KEYDOWN, lambda e, m: pressed.append(e.key))
+        self.assertFalse(menu.update(PygameEventUtils.keydown([pygame.K_a, pygame.K_b])))
+        self.assertEqual(pressed, [KEY_MOVE_DOWN, KEY_MOVE_DOWN, pygame.K_a, pygame.K_b])
+        self.assertTrue(menu.update(PygameEventUtils.key(KEY_MOVE_UP, keydown=True)))
+        self.assertEqual(menu.get_index(), 1)
+
+        # Custom events
+        event_type = pygame.USEREVENT + 1
+        menu.add_event_binding(event_type, lambda e, m: pressed.append(e.type))
+        menu.update([pygame.event.Event(event_type)])
+        self.assertEqual(pressed[-1], event_type)
+
+        # Remove the bindings, the default handler is restored
+        menu.remove_event_binding(pygame.KEYDOWN, KEY_MOVE_DOWN)
+        menu.remove_event_binding(pygame.KEYDOWN)
+        menu.remove_event_binding(event_type)
+        self.assertNotIn((event_type, None), menu._event_handlers)
+        self.assertTrue(menu.update(PygameEventUtils.key(KEY_MOVE_DOWN, keydown=True)))
+        self.assertEqual(menu.get_index(), 0)
+        self.assertEqual(len(pressed), 5)
+
+    def test_event_types(self) -> None:
+        """
+        Test the events are filtered by the types consumed by the widgets.
+        """
+        received = []
+
+        class EventButton(pygame_menu.widgets.Button):
+            """
+            Button which stores the received events.
+            """
+
+            def get_event_types(self) -> Any:
+                return event_types[0]
+
+            def update(self, events: Any) -> bool:
+                received.append([e.type for e in events])
+                return False
+
+        event_types = [frozenset((pygame.USEREVENT,))]
+        menu = MenuUtils.generic_menu()
+        btn = EventButton('button')
+        menu.add.generic_widget(btn, configure_defaults=True)
+        self.assertEqual(menu.get_selected_widget(), btn)
+
+        events = [pygame.event.Event(pygame.KEYUP, key=pygame.K_a), pygame.event.Event(pygame.USEREVENT),
+                  pygame.event.Event(pygame.USEREVENT + 1), pygame.event.Event(pygame.USEREVENT)]
+        menu.update(events)
+        self.assertEqual(received[-1], [pygame.USEREVENT, pygame.USEREVENT])
+        menu.update(events[0:1])
+        self.assertEqual(received[-1], [])
+
+        # Widgets which do not declare the types receive all events
+        event_types[0] = None
+        menu.update(events)
+        self.assertEqual(received[-1], [e.type for e in events])
+
+        # Filter keeps the order, and returns the same list if all events are consumed
+        f = pygame_menu.Menu._filter_events
+        types = frozenset(e.type for e in events)
+        self.assertIs(f(events, types, types), events)
+        self.assertIs(f(events, types, None), events)
+        self.assertEqual(f(events, types, frozenset((pygame.QUIT,))), [])
+        self.assertEqual(f(events, types, frozenset((pygame.USEREVENT, pygame.KEYUP))),
+                         [events[0], events[1], events[3]])
+
+        # Built-in widgets declare their types
+        self.assertIn(pygame.MOUSEBUTTONUP, menu.add.button('button').get_event_types())
+        self.assertIn(pygame.KEYDOWN, menu.add.button('button').get_event_types())  # Controller
+        self.assertEqual(menu.add.vertical_margin(10).get_event_types(), frozenset())
+        self.assertNotIn(pygame.USEREVENT, menu.get_scrollarea().get_event_types())
+
+        # Subclasses that only override update receive all events
+        class UpdateButton(pygame_menu.widgets.Button):
+            """
+            Button which stores the received events, without declaring the types.
+            """
+
+            def update(self, events: Any) -> bool:
+                received.append([e.type for e in events])
+                return False
+
+        btn = UpdateButton('button')
+        menu.add.generic_widget(btn, configure_defaults=True)
+        menu.select_widget(btn)
+        self.assertIsNotNone(btn.get_event_types())
+        self.assertIsNone(btn._get_update_event_types())
+        menu.update(events)
+        self.assertEqual(received[-1], [e.type for e in events])
+
+    def test_mainloop_idle(self) -> None:
+        """
+        Test the mainloop in idle mode, the Menu is drawn only if it may have changed.
+        """
+        menu = MenuUtils.generic_menu()
+        menu.add.button('button')
+        updates = []
+
+        def onupdate(events: Any, m: 'pygame_menu.Menu') -> None:
+            """
+            Post an event not consumed by the Menu, and close after 5 updates.
+            """
+            updates.append([e.type for e in events])
+            if len(updates) == 5:
+                m.disable()
+            else:
+                pygame.event.post(pygame.event.Event(pygame.USEREVENT))
+
+        menu.set_onupdate(onupdate)
+        pygame.time.set_timer(menu._joy_event_repeat, 0)  # Stop the joy repeat of previous tests
+        pygame.event.clear()
+        draw = menu._stats.draw
+        menu.mainloop(surface, idle=True, fps_limit=0)
+        self.assertEqual(len(updates), 5)
+        self.assertEqual(updates[1], [pygame.USEREVENT])
+        self.assertEqual(menu._stats.draw - draw, 1)  # Only the first frame
+        self.assertIsNone(menu._get_idle_timeout())
+        self.assertFalse(menu._need_draw([pygame.event.Event(pygame.USEREVENT)]))
+        self.assertTrue(menu._need_draw([pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a)]))
+
+        # Events consumed by the Menu are drawn
+        menu.enable()
+        updates.clear()
+        menu.set_onupdate(lambda e, m: (updates.append(e), m.disable() if len(updates) == 3 else
+                                        pygame.event.post(pygame.event.Event(pygame.MOUSEMOTION, pos=(1, 1)))))
+        draw = menu._stats.draw
+        menu.mainloop(surface, idle=True, fps_limit=0)
+        self.assertEqual(menu._stats.draw - draw, 2)
+
+        # The cursor of the text input wakes the loop
+        menu = MenuUtils.generic_menu()
+        textinput = menu.add.text_input('text')
+        textinput._cursor_switch_ms = 10
+        self.assertEqual(menu.get_selected_widget(), textinput)
+        self.assertLessEqual(menu._get_idle_timeout(), 10)
+        textinput.readonly = True
+        self.assertIsNone(menu._get_idle_timeout())
+        textinput.readonly = False
+        updates.clear()
+        menu.set_onupdate(lambda e, m: (updates.append(e), m.disable() if len(updates) == 4 else None))
+        pygame.event.clear()
+        draw = menu._stats.draw
+        menu.mainloop(surface, idle=True, fps_limit=0)
+        self.assertEqual(updates, [[], [], [], []])
+        self.assertEqual(menu._stats.draw - draw, 3)
+
+        # Wait events
+        pygame.event.post(pygame.event.Event(pygame.USEREVENT))
+        self.assertEqual([e.type for e in pygame_menu.utils.wait_events()], [pygame.USEREVENT])
+        self.assertEqual(pygame_menu.utils.wait_events(0), [])
+        self.assertEqual(pygame_menu.utils.wait_events(5), [])
+
     def test_mouse_empty_submenu(self) -> None:
         """
         Test mouse event where the following submenu has less elements.
@@ -1968,3 +2176,59 @@ class MenuTest(unittest.TestCase):
         menu.force_surface_cache_update()
         menu.force_surface_update()
         self.assertTrue(menu._widgets_surface_need_update)
+
+        # Widgets that depend on the column width do not render again on each draw
+        menu = MenuUtils.generic_menu()
+        menu.add.text_input('name: ', default='text')
+        menu.add.button('button')
+        menu.draw(surface)
+        cached = menu._stats.draw_update_cached
+        menu.draw(surface)
+        menu.draw(surface)
+        self.assertEqual(menu._stats.draw_update_cached, cached)
+
+    def test_opaque_background(self) -> None:
+        """
+        Test the opaque widgets surface.
+        """
+        theme = pygame_menu.themes.THEME_DEFAULT.copy()
+        self.assertIsNone(theme.background_opaque)
+        menu = MenuUtils.generic_menu(theme=theme)
+        menu.add.button('button')
+        menu.add.selector('selector', [('a', 1), ('b', 2)])
+        menu.draw(surface)
+        self.assertEqual(menu._widgets_surface_color, (220, 220, 220, 255))
+        self.assertFalse(menu._widgets_surface.get_flags() & pygame.SRCALPHA)
+        opaque_draw = pygame.image.tostring(surface, 'RGB')
+
+        # The output must be the same as the transparent surface
+        theme.background_opaque = False
+        menu = MenuUtils.generic_menu(theme=theme)
+        menu.add.button('button')
+        menu.add.selector('selector', [('a', 1), ('b', 2)])
+        menu.draw(surface)
+        self.assertEqual(menu._widgets_surface_color, (255, 255, 255, 0))
+        self.assertTrue(menu._widgets_surface.get_flags() & pygame.SRCALPHA)
+        self.assertEqual(pygame.image.tostring(surface, 'RGB'), opaque_draw)
+
+        # The transparent surface is converted to the display format
+        with mock.patch('pygame_menu.menu.convert_surface', wraps=convert_surface) as convert:
+            menu = MenuUtils.generic_menu(theme=theme)
+            menu.draw(surface)
+        convert.assert_called()
+        self.assertEqual(convert.call_args[1], {'rle': False})
+        self.assertTrue(menu._widgets_surface.get_flags() & pygame.SRCALPHA)
+        self.assertEqual(menu._widgets_surface_last[3], get_display_format())
+
+        # Transparent background, the user can also declare it as opaque
+        theme.background_opaque = None
+        theme.background_color = (220, 220, 220, 100)
+        self.assertEqual(MenuUtils.generic_menu(theme=theme)._widgets_surface_color, (255, 255, 255, 0))
+        theme.background_opaque = True
+        self.assertEqual(MenuUtils.generic_menu(theme=theme)._widgets_surface_color, (220, 220, 220, 255))
+
+        # Image backgrounds cannot be opaque
+        theme.background_color = pygame_menu.BaseImage(pygame_menu.baseimage.IMAGE_EXAMPLE_GRAY_LINES)
+        self.assertRaises(AssertionError, lambda: MenuUtils.generic_menu(theme=theme))
+        theme.background_opaque = None
+        self.assertEqual(MenuUtils.generic_menu(theme=theme)._widgets_surface_color, (255, 255, 255, 0))
@@ -0,0 +1,168 @@
+"""
+pygame-menu
+https://github.com/ppizarror/pygame-menu
+
+TEST RENDERER
+Test Menu SDL2 renderer.
+
+License:
+-------------------------------------------------------------------------------
+The MIT License (MIT)
+Copyright 2017-2021 Pablo Pizarro R. @ppizarror
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the Software
+is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+-------------------------------------------------------------------------------
+"""
+
+__all__ = ['RendererTest']
+
+import unittest
+from test._utils import MenuUtils, test_reset_surface
+
+import pygame
+import pygame_menu
+
+from pygame_menu.renderer import MenuRenderer, SDL2_AVAILABLE, TEXTURE_TILE_SIZE
+
+if SDL2_AVAILABLE:
+    # noinspection PyProtectedMember
+    from pygame._sdl2.video import Window, Renderer
+
+
+@unittest.skipIf(not SDL2_AVAILABLE, 'pygame._sdl2 is not available')
+class RendererTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        """
+        Setup renderer.
+        """
+        test_reset_surface()
+        self.window = Window('Renderer', size=(600, 600), hidden=True)
+        self.renderer = Renderer(self.window, accelerated=0)
+
+    def tearDown(self) -> None:
+        """
+        Destroy the window.
+        """
+        del self.renderer
+        self.window.destroy()
+
+    def test_draw(self) -> None:
+        """
+        Test the renderer draws the same as the software surface.
+        """
+        menu = MenuUtils.generic_menu(theme=pygame_menu.themes.THEME_BLUE)
+        for i in range(30):
+            menu.add.button('button {0}'.format(i))
+        menu.add.text_input('text: ', default='epic')
+        self.assertRaises(AssertionError, lambda: MenuRenderer(None))
+        mr = MenuRenderer(self.renderer)
+        self.assertEqual(mr.get_renderer(), self.renderer)
+
+        def compare() -> None:
+            """
+            Compare the renderer output against the software draw.
+            """
+            self.renderer.draw_color = (0, 0, 0, 255)
+            self.renderer.clear()
+            mr.draw(menu)
+            texture_surface = self.renderer.to_surface()
+            software_surface = pygame.Surface((600, 600))
+            menu.draw(software_surface)
+            for x in range(0, 600, 15):
+                for y in range(0, 600, 15):
+                    self.assertEqual(texture_surface.get_at((x, y)), software_surface.get_at((x, y)))
+
+        compare()
+        self.assertEqual(mr.world_updates, 1)
+        self.assertEqual(mr.back_updates, 1)
+        self.assertEqual(mr.scrollbar_updates, 1)
+
+        # Scrolling does not upload the widgets surface nor the front layer, only the scrollbar
+        menu.get_scrollarea().scroll_to(pygame_menu.locals.ORIENTATION_VERTICAL, 0.5)
+        compare()
+        self.assertEqual(mr.world_updates, 1)
+        self.assertEqual(mr.back_updates, 1)
+        self.assertEqual(mr.front_updates, 1)
+        self.assertEqual(mr.scrollbar_updates, 2)
+
+        # The layers are uploaded only if these change
+        compare()
+        self.assertEqual(mr.front_updates, 1)
+        self.assertEqual(mr.scrollbar_updates, 2)
+        self.assertEqual(mr.overlay_updates, 0)
+
+        # Selecting other widget draws the widgets again
+        menu.select_widget(menu.get_widgets()[-1])
+        compare()
+        self.assertEqual(mr.world_updates, 2)
+
+        # The text input cursor is drawn within the overlay, uploaded only if it changes
+        text = menu.get_selected_widget()
+        text._cursor_visible = True
+        compare()
+        self.assertEqual(mr.overlay_updates, 1)
+        front_updates = mr.front_updates
+        compare()
+        self.assertEqual(mr.overlay_updates, 1)
+        text._cursor_visible = False
+        compare()
+        self.assertEqual(mr.overlay_updates, 2)
+        self.assertEqual(mr.front_updates, front_updates)
+        self.assertEqual(mr.world_updates, 2)
+
+        # Callable decorations are drawn on each frame
+        menu.get_decorator().add_callable(lambda *_: None, prev=False)
+        compare()
+        compare()
+        self.assertEqual(mr.front_updates, front_updates + 2)
+
+        # Disabled menu does not draw
+        menu.disable()
+        self.assertRaises(RuntimeError, lambda: mr.draw(menu))
+
+    def test_large_world(self) -> None:
+        """
+        Test the widgets surface larger than the texture tile size.
+        """
+        menu = MenuUtils.generic_menu()
+        for i in range(20):
+            menu.add.button('button {0}'.format(i), margin=(0, 300))
+        mr = MenuRenderer(self.renderer)
+        mr.draw(menu)
+        world_height = menu._widgets_surface.get_height()
+        self.assertGreater(world_height, TEXTURE_TILE_SIZE)
+        self.assertEqual(len(mr._world), world_height // TEXTURE_TILE_SIZE + 1)
+        for texture, rect in mr._world:
+            self.assertLessEqual(texture.height, TEXTURE_TILE_SIZE)
+
+        # Draw the view across two tiles
+        scrollarea = menu.get_scrollarea()
+        scrollarea.scroll_to(pygame_menu.locals.ORIENTATION_VERTICAL,
+                             (TEXTURE_TILE_SIZE - 100) / scrollarea.get_hidden_height())
+        self.assertLess(scrollarea.get_offsets()[1], TEXTURE_TILE_SIZE)
+        self.assertGreater(scrollarea.get_offsets()[1] + scrollarea.get_view_rect().height, TEXTURE_TILE_SIZE)
+        self.renderer.draw_color = (0, 0, 0, 255)
+        self.renderer.clear()
+        mr.draw(menu)
+        texture_surface = self.renderer.to_surface()
+        software_surface = pygame.Surface((600, 600))
+        menu.draw(software_surface)
+        for x in range(0, 600, 15):
+            for y in range(0, 600, 5):
+                self.assertEqual(texture_surface.get_at((x, y)), software_surface.get_at((x, y)))
@@ -35,6 +35,7 @@ import copy
 import unittest
 from test._utils import MenuUtils, PygameEventUtils, surface, TEST_THEME
 
+import pygame
 import pygame_menu
 
 from pygame_menu.locals import POSITION_SOUTHEAST, POSITION_CENTER, POSITION_NORTHWEST, POSITION_SOUTH, \
@@ -204,3 +205,99 @@ class ScrollAreaTest(unittest.TestCase):
         rect_virtual = sa.to_real_position(btn.get_rect())
         event_click_widget = PygameEventUtils.middle_rect_click(rect_virtual, inlist=False)
         self.assertTrue(sa.collide(btn, event_click_widget))
+
+    def test_kinetic(self) -> None:
+        """
+        Test kinetic scrolling.
+        """
+        theme = TEST_THEME.override(scrollarea_kinetic=True)
+        menu = MenuUtils.generic_menu(theme=theme)
+        for i in range(30):
+            menu.add.button(i)
+        menu.draw(surface)
+        sa = menu.get_scrollarea()
+        sbar = sa._scrollbars[1]
+        self.assertEqual(sbar.get_orientation(), ORIENTATION_VERTICAL)
+        self.assertTrue(sbar.is_kinetic())
+        self.assertFalse(sa.is_kinetic_scrolling())
+        self.assertFalse(sa.update_kinetic())
+
+        # Page step only sets the target
+        self.assertTrue(menu.update(PygameEventUtils.key(pygame.K_PAGEDOWN, keydown=True)))
+        self.assertEqual(sa.get_offsets(), (0, 0))
+        self.assertTrue(sa.is_kinetic_scrolling())
+
+        # Scrolling does not draw the widgets again
+        menu.draw(surface)
+        draw_update_cached = menu._stats.draw_update_cached
+        sbar._kinetic_ticks -= 40
+        self.assertTrue(menu.update([]))
+        offset = sa.get_offsets()[1]
+        self.assertGreater(offset, 0)
+        sbar._kinetic_ticks -= 1000
+        self.assertTrue(menu.update([]))
+        self.assertGreater(sa.get_offsets()[1], offset)
+        self.assertFalse(sa.is_kinetic_scrolling())
+        self.assertFalse(menu.update([]))
+        menu.draw(surface)
+        self.assertEqual(menu._stats.draw_update_cached, draw_update_cached)
+
+        # Select the last widget scrolls smoothly
+        menu.select_widget(menu.get_widgets()[-1])
+        self.assertTrue(sa.is_kinetic_scrolling())
+        sbar._kinetic_ticks -= 1000
+        sa.update_kinetic()
+        self.assertEqual(sa.get_offsets()[1], sbar.get_maximum())
+
+        # Set value stops the scrolling
+        sbar._kinetic_scroll(-100)
+        self.assertTrue(sa.is_kinetic_scrolling())
+        sa.scroll_to(ORIENTATION_VERTICAL, 0)
+        self.assertFalse(sa.is_kinetic_scrolling())
+        self.assertEqual(sa.get_offsets(), (0, 0))
+
+        # Inertia after releasing the slider
+        sbar.update(PygameEventUtils.middle_rect_click(sbar.get_slider_rect(), evtype=pygame.MOUSEBUTTONDOWN))
+        self.assertTrue(sbar.scrolling)
+        sbar._kinetic_ticks -= 10
+        sbar.update(PygameEventUtils.middle_rect_click(sbar.get_slider_rect(), rel=(0, 10),
+                                                       evtype=pygame.MOUSEMOTION))
+        self.assertGreater(sbar._kinetic_velocity, 0)
+        sbar.update(PygameEventUtils.middle_rect_click(sbar.get_slider_rect(), evtype=pygame.MOUSEBUTTONUP))
+        self.assertFalse(sbar.scrolling)
+        self.assertTrue(sa.is_kinetic_scrolling())
+        offset = sa.get_offsets()[1]
+        sbar._kinetic_ticks -= 100
+        self.assertTrue(sa.update_kinetic())
+        self.assertGreater(sa.get_offsets()[1], offset)
+        sbar._kinetic_ticks -= 5000
+        sa.update_kinetic()
+        self.assertFalse(sa.is_kinetic_scrolling())
+
+        # Disable kinetic
+        sa.set_kinetic(False)
+        self.assertFalse(sbar.is_kinetic())
+        sbar.scroll_to_value(0)
+        self.assertEqual(sa.get_offsets(), (0, 0))
+
+        # The Menu also advances the scrollable frames, which update the widgets surface
+        menu = MenuUtils.generic_menu()
+        frame = menu.add.frame_v(300, 500, max_height=100)
+        for i in range(8):
+            frame.pack(menu.add.button(i))
+        menu.draw(surface)
+        sa = frame.get_scrollarea(inner=True)
+        sa.set_kinetic(True)
+        sbar = sa._scrollbars[1]
+        self.assertEqual(sbar.get_orientation(), ORIENTATION_VERTICAL)
+        sbar.scroll_to_value(sbar.get_maximum())
+        self.assertTrue(sa.is_kinetic_scrolling())
+        self.assertEqual(menu._get_idle_timeout(), 0)
+        sbar._kinetic_ticks -= 40
+        self.assertTrue(menu.update([]))
+        self.assertGreater(sa.get_offsets()[1], 0)
+        self.assertTrue(menu._widget_surface_cache_need_update)
+        sbar._kinetic_ticks -= 5000
+        menu.update([])
+        self.assertEqual(sa.get_offsets()[1], sbar.get_maximum())
+        self.assertFalse(sa.is_kinetic_scrolling())
@@ -71,6 +71,46 @@ class SelectionTest(unittest.TestCase):
         w.set_selection_effect(RightArrowSelection())
         self.menu.draw(surface)
 
+    def test_arrow_blink(self) -> None:
+        """
+        Test arrow selection blinking within the Menu timeline.
+        """
+        menu = MenuUtils.generic_menu()
+        w = menu.add.button('epic')
+        w2 = menu.add.button('epic')
+        sel = LeftArrowSelection(blink_ms=100)
+        w.set_selection_effect(sel)
+        timeline = menu._timeline
+        self.assertIsNone(timeline.get_timeout())
+
+        # Drawing the selected widget starts the blinking
+        menu.draw(surface)
+        self.assertTrue(sel._blink_status)
+        self.assertEqual(timeline.get_timeout(), 100)
+        self.assertEqual(menu._get_idle_timeout(), 100)
+        menu.draw(surface)
+        self.assertEqual(len(timeline._timers), 1)
+
+        # Blinking toggles the visibility, and requests the repaint
+        menu._widget_surface_cache_need_update = False
+        self.assertFalse(timeline.advance(99))
+        self.assertTrue(timeline.advance(1))
+        self.assertFalse(sel._blink_status)
+        self.assertTrue(menu._widget_surface_cache_need_update)
+        timeline.advance(100)
+        self.assertTrue(sel._blink_status)
+
+        # Blinking stops if the widget is not selected, and restarts visible
+        timeline.advance(100)
+        self.assertFalse(sel._blink_status)
+        menu.select_widget(w2)
+        timeline.advance(100)
+        self.assertIsNone(timeline.get_timeout())
+        menu.select_widget(w)
+        menu.draw(surface)
+        self.assertTrue(sel._blink_status)
+        self.assertEqual(timeline.get_timeout(), 100)
+
     def test_highlight(self) -> None:
         """
         Test highlight selection.
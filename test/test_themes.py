@@ -32,6 +32,7 @@ CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 __all__ = ['ThemeTest']
 
 from pathlib import Path
+from test._utils import MenuUtils
 import unittest
 
 import pygame_menu
@@ -76,6 +77,46 @@ class ThemeTest(unittest.TestCase):
         self.assertNotEqual(theme.background_color, theme_copy.background_color)
         self.assertNotEqual(theme.background_color, pygame_menu.themes.THEME_DEFAULT.background_color)
 
+    def test_frozen(self) -> None:
+        """
+        Test frozen themes and overrides.
+        """
+        # Predefined themes can be modified, freeze() returns a frozen copy
+        self.assertFalse(pygame_menu.themes.THEME_BLUE.is_frozen())
+        theme = pygame_menu.themes.THEME_BLUE.freeze()
+        self.assertIsNot(theme, pygame_menu.themes.THEME_BLUE)
+        self.assertFalse(pygame_menu.themes.THEME_BLUE.is_frozen())
+        self.assertTrue(theme.is_frozen())
+        self.assertIs(theme.freeze(), theme)
+        self.assertIs(theme.widget_selection_effect, pygame_menu.themes.THEME_BLUE.widget_selection_effect)
+        self.assertRaises(AttributeError, lambda: setattr(theme, 'title_font_size', 10))
+
+        # Override shares the non modified values
+        theme_new = theme.override(title_font_size=10, widget_font_size=20)
+        self.assertTrue(theme_new.is_frozen())
+        self.assertEqual(theme_new.title_font_size, 10)
+        self.assertEqual(theme_new.widget_font_size, 20)
+        self.assertNotEqual(theme.title_font_size, 10)
+        self.assertIs(theme_new.widget_selection_effect, theme.widget_selection_effect)
+        self.assertRaises(ValueError, lambda: theme.override(invalid_key=True))
+        self.assertRaises(ValueError, lambda: theme.override(_frozen=False))
+        self.assertRaises(AssertionError, lambda: theme.override(widget_padding='Epic'))
+
+        # The copy of a frozen theme can be modified
+        theme_copy = theme.copy()
+        self.assertFalse(theme_copy.is_frozen())
+        theme_copy.title_font_size = 10
+
+        # Validation runs only if the theme has been modified
+        self.assertTrue(theme_copy.validate()._validated)
+        theme_copy.widget_padding = 'Epic'
+        self.assertFalse(theme_copy._validated)
+        self.assertRaises(AssertionError, lambda: theme_copy.validate())
+
+        # Menus share the frozen theme
+        menu = MenuUtils.generic_menu(theme=theme_new)
+        self.assertIs(menu.get_theme(), theme_new)
+
     def test_methods(self) -> None:
         """
         Test theme method.
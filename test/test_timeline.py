@@ -0,0 +1,121 @@
+"""
+pygame-menu
+https://github.com/ppizarror/pygame-menu
+
+TEST TIMELINE
+Test Menu timeline.
+
+License:
+-------------------------------------------------------------------------------
+The MIT License (MIT)
+Copyright 2017-2021 Pablo Pizarro R. @ppizarror
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the Software
+is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+-------------------------------------------------------------------------------
+"""
+
+__all__ = ['TimelineTest']
+
+from test._utils import MenuUtils
+import unittest
+
+import pygame
+
+from pygame_menu._timeline import Timeline
+from pygame_menu.tween import TWEEN_ALPHA
+
+
+class TimelineTest(unittest.TestCase):
+
+    def test_timers(self) -> None:
+        """
+        Test the timers are called in order once they are due.
+        """
+        timeline = Timeline()
+        called = []
+        self.assertIsNone(timeline.get_timeout())
+        timeline.schedule(20, lambda: called.append('b'))
+        timeline.schedule(10, lambda: called.append('a'))
+        timeline.schedule(20, lambda: called.append('c'))
+        self.assertEqual(timeline.get_timeout(), 10)
+        self.assertFalse(timeline.advance(9))
+        self.assertEqual(timeline.get_timeout(), 1)
+        self.assertTrue(timeline.advance(1))
+        self.assertEqual(called, ['a'])
+        timeline.advance(50)
+        self.assertEqual(called, ['a', 'b', 'c'])
+        self.assertEqual(timeline.get_time(), 60)
+        self.assertIsNone(timeline.get_timeout())
+
+        # Invalid
+        self.assertRaises(AssertionError, lambda: timeline.schedule(-1, lambda: None))
+        self.assertRaises(AssertionError, lambda: timeline.schedule(1, None))
+        self.assertRaises(AssertionError, lambda: timeline.advance(-1))
+
+    def test_menu(self) -> None:
+        """
+        Test the Menu update advances its timeline without sleeping.
+        """
+        menu = MenuUtils.generic_menu()
+        timeline = menu._timeline
+        ticks = pygame.time.get_ticks()  # Read before the update, the timeline cannot advance more
+        menu.update([])
+        t0 = timeline.get_time()
+        pygame.time.wait(20)
+        menu.update([])
+        self.assertGreaterEqual(timeline.get_time() - t0, 20)
+        self.assertLessEqual(timeline.get_time() - t0, pygame.time.get_ticks() - ticks)
+
+        # Paused timelines do not advance
+        timeline.pause()
+        self.assertTrue(timeline.is_paused())
+        t0 = timeline.get_time()
+        pygame.time.wait(10)
+        self.assertFalse(timeline.update())
+        self.assertEqual(timeline.get_time(), t0)
+        timeline.resume()
+        self.assertFalse(timeline.is_paused())
+
+    def test_submenu(self) -> None:
+        """
+        Test the animations of a Menu do not advance while a submenu is opened.
+        """
+        menu = MenuUtils.generic_menu()
+        submenu = MenuUtils.generic_menu()
+        btn = menu.add.button('submenu', submenu)
+        menu.update([])
+        menu.get_tweens().add(btn, TWEEN_ALPHA, 0, 1000)
+        menu.update([])
+        t0 = menu._timeline.get_time()
+
+        # Open the submenu for 1s
+        btn.apply()
+        self.assertEqual(menu.get_current(), submenu)
+        self.assertTrue(menu._timeline.is_paused())
+        self.assertFalse(submenu._timeline.is_paused())
+        pygame.time.wait(1000)
+        menu.update([])
+
+        # Go back, the tween continues from the same time
+        menu.reset(1)
+        self.assertEqual(menu.get_current(), menu)
+        self.assertFalse(menu._timeline.is_paused())
+        self.assertTrue(submenu._timeline.is_paused())
+        menu.update([])
+        self.assertLess(menu._timeline.get_time() - t0, 1000)
+        self.assertTrue(menu.get_tweens().is_active())
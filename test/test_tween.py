@@ -0,0 +1,210 @@
+"""
+pygame-menu
+https://github.com/ppizarror/pygame-menu
+
+TEST TWEEN
+Test widget tweens.
+
+License:
+-------------------------------------------------------------------------------
+The MIT License (MIT)
+Copyright 2017-2021 Pablo Pizarro R. @ppizarror
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the Software
+is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+-------------------------------------------------------------------------------
+"""
+
+__all__ = ['TweenTest']
+
+from test._utils import MenuUtils, surface
+import unittest
+
+from pygame_menu.tween import TWEEN_ALPHA, TWEEN_COLOR, TWEEN_SCALE, TWEEN_TRANSLATE, ease_in_cubic, \
+    ease_in_out_cubic, ease_in_out_quad, ease_in_out_sine, ease_in_quad, ease_linear, ease_out_cubic, ease_out_quad
+
+
+class TweenTest(unittest.TestCase):
+
+    def test_easing(self) -> None:
+        """
+        Test the easing functions.
+        """
+        for easing in (ease_in_cubic, ease_in_out_cubic, ease_in_out_quad, ease_in_out_sine, ease_in_quad,
+                       ease_linear, ease_out_cubic, ease_out_quad):
+            self.assertAlmostEqual(easing(0), 0)
+            self.assertAlmostEqual(easing(1), 1)
+            self.assertLessEqual(easing(0.25), easing(0.75))
+        self.assertAlmostEqual(ease_in_out_quad(0.5), 0.5)
+        self.assertLess(ease_in_quad(0.5), 0.5)
+        self.assertGreater(ease_out_quad(0.5), 0.5)
+
+    def test_paint(self) -> None:
+        """
+        Test tweens which keep the widget size only update the Menu surface cache.
+        """
+        menu = MenuUtils.generic_menu()
+        btn = menu.add.button('button')
+        label = menu.add.label('label')
+        tweens = menu.get_tweens()
+        timeline = menu._timeline
+        menu.draw(surface)
+        self.assertFalse(tweens.update())  # No tweens
+        color = label.get_font_info()['color']
+        x, y = btn.get_position()
+        render = menu._stats.render_private
+
+        finished = []
+        tweens.add(btn, TWEEN_TRANSLATE, (100, -10), 100, onfinish=lambda w, m: finished.append(w))
+        tweens.add(label, TWEEN_ALPHA, 0, 100)
+        tweens.add(label, TWEEN_COLOR, (255, 0, 0), 100, delay=50)
+        self.assertTrue(tweens.is_active())
+        self.assertEqual(menu._get_idle_timeout(), 0)
+        self.assertEqual(len(tweens.get_tweens()), 3)
+
+        menu._widget_surface_cache_need_update = False
+        timeline.advance(50)
+        self.assertTrue(tweens.update())
+        self.assertEqual(btn.get_translate(), (50, -5))
+        self.assertEqual(btn.get_position(), (x + 50, y - 5))
+        self.assertEqual(label.get_alpha(), 128)
+        self.assertFalse(menu._widgets_surface_need_update)
+        self.assertTrue(menu._widget_surface_cache_need_update)
+        menu.draw(surface)
+        self.assertEqual(menu._stats.render_private, render)  # Layout is not computed again
+
+        # Finish
+        timeline.advance(50)
+        tweens.update()
+        self.assertEqual(btn.get_translate(), (100, -10))
+        self.assertEqual(label.get_alpha(), 0)
+        self.assertEqual(label.get_font_info()['color'][0:2], (round((255 + color[0]) / 2), round(color[1] / 2)))
+        self.assertEqual(finished, [btn])
+        self.assertEqual(len(tweens.get_tweens()), 1)
+        timeline.advance(50)
+        tweens.update()
+        self.assertEqual(label.get_font_info()['color'], (255, 0, 0, 255))
+        self.assertFalse(tweens.is_active())
+        self.assertFalse(menu._widgets_surface_need_update)
+
+        # The transparency does not modify the widget surface
+        menu.draw(surface)
+        self.assertEqual(label._surface.get_alpha(), 255)
+
+        # The layout keeps the translation
+        menu.render()
+        self.assertEqual(btn.get_position(), (x + 100, y - 10))
+
+    def test_color_status(self) -> None:
+        """
+        Test the color tween animates the font color rendered by the widget status.
+        """
+        menu = MenuUtils.generic_menu()
+        btn = menu.add.button('button')
+        btn_readonly = menu.add.button('readonly')
+        btn_readonly.readonly = True
+        tweens = menu.get_tweens()
+        self.assertTrue(btn.is_selected())
+        color = btn.get_font_info()['color']
+        readonly_selected_color = btn_readonly.get_font_info()['readonly_selected_color']
+
+        tweens.add(btn, TWEEN_COLOR, (255, 0, 0), 100)
+        tweens.add(btn_readonly, TWEEN_COLOR, (0, 255, 0), 100)
+        menu._timeline.advance(100)
+        tweens.update()
+        self.assertEqual(btn.get_font_info()['selected_color'], (255, 0, 0, 255))
+        self.assertEqual(btn.get_font_info()['color'], color)
+        self.assertEqual(btn_readonly.get_font_info()['readonly_color'], (0, 255, 0, 255))
+        self.assertEqual(btn_readonly.get_font_info()['readonly_selected_color'], readonly_selected_color)
+        menu.draw(surface)
+        self.assertEqual(btn.get_font_color_status(), (255, 0, 0, 255))
+
+        # The tween starts from the color of the current status
+        btn_readonly.readonly = False
+        menu.select_widget(btn_readonly)
+        start = btn_readonly.get_font_info()['selected_color']
+        tweens.add(btn_readonly, TWEEN_COLOR, (0, 0, 255), 100)
+        menu._timeline.advance(50)
+        tweens.update()
+        self.assertEqual(btn_readonly.get_font_color_status()[2], round(255 / 2 + start[2] / 2))
+
+    def test_layout(self) -> None:
+        """
+        Test tweens which change the widget size update the Menu layout.
+        """
+        menu = MenuUtils.generic_menu()
+        btn = menu.add.button('button')
+        frame = menu.add.frame_v(300, 100)
+        tweens = menu.get_tweens()
+        menu.draw(surface)
+        w, h = btn.get_size()
+
+        tweens.add(btn, TWEEN_SCALE, (2, 2), 100, easing=ease_out_cubic)
+        menu._timeline.advance(100)
+        tweens.update()
+        self.assertGreater(btn.get_width(), w)
+        self.assertGreater(btn.get_height(), h)
+        self.assertTrue(menu._widgets_surface_need_update)
+        menu.draw(surface)
+
+        # Frames are translated using the layout
+        tweens.add(frame, TWEEN_TRANSLATE, (10, 0), 0)
+        tweens.update()
+        self.assertEqual(frame.get_translate(), (10, 0))
+        self.assertTrue(menu._widgets_surface_need_update)
+
+    def test_scheduler(self) -> None:
+        """
+        Test the tween scheduler methods.
+        """
+        menu = MenuUtils.generic_menu()
+        btn = menu.add.button('button')
+        tweens = menu.get_tweens()
+
+        # Invalid
+        self.assertRaises(ValueError, lambda: tweens.add(btn, 'invalid', 1, 100))
+        self.assertRaises(AssertionError, lambda: tweens.add(btn, TWEEN_ALPHA, 256, 100))
+        self.assertRaises(AssertionError, lambda: tweens.add(btn, TWEEN_SCALE, (0, 1), 100))
+        self.assertRaises(AssertionError, lambda: tweens.add(btn, TWEEN_TRANSLATE, (1, 1), -1))
+        self.assertRaises(AssertionError, lambda: tweens.add(btn, TWEEN_TRANSLATE, (1, 1), 100, delay=-1))
+        self.assertRaises(AssertionError, lambda: tweens.add(MenuUtils.generic_menu().add.button('b'),
+                                                             TWEEN_ALPHA, 0, 100))
+
+        # A new tween replaces the previous one of the same property
+        tweens.add(btn, TWEEN_TRANSLATE, (10, 10), 100)
+        tween = tweens.add(btn, TWEEN_TRANSLATE, (20, 0), 100)
+        tweens.add(btn, TWEEN_ALPHA, 0, 100)
+        self.assertEqual(len(tweens.get_tweens()), 2)
+        self.assertEqual(tween.get_widget(), btn)
+        self.assertEqual(tween.get_property(), TWEEN_TRANSLATE)
+        tweens.cancel(btn, TWEEN_ALPHA)
+        self.assertEqual(tweens.get_tweens(), [tween])
+        tweens.cancel(btn)
+        self.assertFalse(tweens.is_active())
+        tweens.add(btn, TWEEN_ALPHA, 0, 100)
+        tweens.clear()
+        self.assertFalse(tweens.is_active())
+
+        # Menu update advances the tweens
+        tweens.add(btn, TWEEN_ALPHA, 0, 0, delay=1)
+        menu.update([])
+        menu._timeline.advance(1)
+        menu.update([])
+        self.assertEqual(btn.get_alpha(), 0)
+        self.assertFalse(tweens.is_active())
+        self.assertRaises(AssertionError, lambda: btn.set_alpha(-1))
+        self.assertEqual(btn.set_alpha(255).get_alpha(), 255)
@@ -0,0 +1,117 @@
+"""
+pygame-menu
+https://github.com/ppizarror/pygame-menu
+
+TEST UTILS
+Test utility functions.
+
+License:
+-------------------------------------------------------------------------------
+The MIT License (MIT)
+Copyright 2017-2021 Pablo Pizarro R. @ppizarror
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the Software
+is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+-------------------------------------------------------------------------------
+"""
+
+
+__all__ = ['UtilsTest']
+
+from test._utils import test_reset_surface
+import unittest
+
+import pygame
+import pygame_menu.utils as ut
+
+
+class UtilsTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        """
+        Setup utils test.
+        """
+        test_reset_surface()
+
+    def test_fill_gradient(self) -> None:
+        """
+        Test gradient fill.
+        """
+        ut._GRADIENT_CACHE.clear()
+        s = pygame.Surface((100, 50))
+
+        # Vertical
+        ut.fill_gradient(s, (0, 0, 0), (100, 200, 250))
+        self.assertEqual(s.get_at((0, 0)), (0, 0, 0, 255))
+        self.assertEqual(s.get_at((99, 0)), (0, 0, 0, 255))
+        self.assertEqual(s.get_at((50, 49)), (100, 200, 250, 255))
+        self.assertEqual(len(ut._GRADIENT_CACHE), 1)
+        ut.fill_gradient(s, (0, 0, 0), (100, 200, 250))  # Cached
+        self.assertEqual(len(ut._GRADIENT_CACHE), 1)
+
+        # Horizontal, reversed
+        ut.fill_gradient(s, (0, 0, 0), (255, 0, 0), vertical=False, forward=False)
+        self.assertEqual(s.get_at((0, 25)), (255, 0, 0, 255))
+        self.assertEqual(s.get_at((99, 25)), (0, 0, 0, 255))
+        self.assertEqual(len(ut._GRADIENT_CACHE), 2)
+
+        # Multi-stop
+        s = pygame.Surface((101, 10))
+        ut.fill_gradient(s, (0, 0, 0), (0, 0, 255), vertical=False, stops=[(0, 255, 0)])
+        self.assertEqual(s.get_at((50, 0)), (0, 255, 0, 255))
+        self.assertEqual(s.get_at((25, 0)), (0, 128, 0, 255))
+        self.assertEqual(s.get_at((75, 0)), (0, 128, 128, 255))
+        self.assertEqual(s.get_at((100, 9)), (0, 0, 255, 255))
+
+        # Diagonal
+        s = pygame.Surface((20, 10))
+        ut.fill_gradient(s, (0, 0, 0), (255, 255, 255), diagonal=True)
+        self.assertEqual(s.get_at((0, 0)), (0, 0, 0, 255))
+        self.assertEqual(s.get_at((19, 9)), (255, 255, 255, 255))
+        self.assertEqual(s.get_at((5, 0)), s.get_at((0, 5)))
+        self.assertEqual(s.get_at((10, 3)), s.get_at((7, 6)))
+
+        # Area
+        s = pygame.Surface((20, 20))
+        s.fill((1, 2, 3))
+        ut.fill_gradient(s, (0, 0, 0), (255, 255, 255), rect=pygame.Rect(5, 5, 10, 10))
+        self.assertEqual(s.get_at((4, 4)), (1, 2, 3, 255))
+        self.assertEqual(s.get_at((15, 15)), (1, 2, 3, 255))
+        self.assertEqual(s.get_at((5, 5)), (0, 0, 0, 255))
+        self.assertEqual(s.get_at((14, 14)), (255, 255, 255, 255))
+        ut.fill_gradient(s, (0, 0, 0), (255, 255, 255), rect=pygame.Rect(0, 0, 0, 10))  # Empty
+        self.assertRaises(AssertionError, lambda: ut.fill_gradient(s, (0, 0, 0), (255, 255, 255), stops='red'))
+
+    def test_uuid4(self) -> None:
+        """
+        Test the uuid generation.
+        """
+        ids = [ut.uuid4() for _ in range(100)] + [ut.uuid4(short=True) for _ in range(100)]
+        self.assertEqual(len(set(ids)), 200)
+        self.assertEqual(len(ids[0]), 18)
+        self.assertEqual(len(ids[-1]), 8)
+        self.assertEqual(int(ids[1][9:], 16), int(ids[0][9:], 16) + 1)
+
+        # Random uuid
+        ut.set_random_uuid(True)
+        try:
+            self.assertEqual(len(ut.uuid4()), 18)
+            self.assertEqual(len(ut.uuid4(short=True)), 8)
+            self.assertNotEqual(ut.uuid4()[:8], ut.uuid4()[:8])  # Not sequential
+        finally:
+            ut.set_random_uuid(False)
+        self.assertRaises(AssertionError, lambda: ut.set_random_uuid(1))
@@ -31,10 +31,16 @@ CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 
 __all__ = ['VersionTest']
 
+import os
+import subprocess
+import sys
 import unittest
 
 import pygame_menu
 
+# Configure the tests
+TEST_TIME_IMPORT = False
+
 
 class VersionTest(unittest.TestCase):
 
@@ -45,3 +51,41 @@ class VersionTest(unittest.TestCase):
         self.assertTrue(isinstance(pygame_menu.version.ver, str))
         self.assertTrue(isinstance(repr(pygame_menu.version.vernum), str))
         self.assertTrue(isinstance(str(pygame_menu.version.vernum), str))
+
+    @unittest.skipIf(sys.version_info < (3, 7), 'lazy import requires python 3.7 or higher')
+    def test_import(self) -> None:
+        """
+        Test the package import is lazy, the modules are imported on first access.
+        The import time of the package modules is measured by ``python -X importtime``.
+        """
+        code = 'import sys, pygame_menu; print(sorted(m for m in sys.modules if m.startswith("pygame_menu")))'
+        env = dict(os.environ, PYGAME_HIDE_SUPPORT_PROMPT='1')
+        result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], stdout=subprocess.PIPE,
+                                stderr=subprocess.PIPE, env=env, universal_newlines=True)
+        self.assertEqual(result.stdout.strip(), "['pygame_menu', 'pygame_menu.version']")
+
+        # Sum the self import time of the package modules (us)
+        import_time = 0
+        for line in result.stderr.splitlines():
+            if not line.startswith('import time:'):
+                continue
+            self_time, _, module = line[len('import time:'):].split('|')
+            if module.strip().startswith('pygame_menu'):
+                import_time += int(self_time)
+        self.assertGreater(import_time, 0)
+        if TEST_TIME_IMPORT:
+            print('pygame_menu import time: {0}us'.format(import_time))
+
+        # Modules are imported on access
+        self.assertIn('Menu', dir(pygame_menu))
+        self.assertEqual(pygame_menu.Menu, pygame_menu.menu.Menu)
+        self.assertEqual(pygame_menu.themes.THEME_DARK.background_color, (40, 41, 35, 255))
+        self.assertRaises(AttributeError, lambda: pygame_menu.unknown)
+        self.assertRaises(AttributeError, lambda: pygame_menu.themes.THEME_UNKNOWN)
+
+        # The submodules are reachable after the package import, and the import
+        # helpers do not leak into the package namespace
+        code = 'import pygame_menu; print(pygame_menu._decorator.__name__, pygame_menu.utils.__name__, ' \
+               '[n for n in ("importlib", "sys", "Any", "List") if hasattr(pygame_menu, n)])'
+        result = subprocess.run([sys.executable, '-c', code], stdout=subprocess.PIPE, env=env, universal_newlines=True)
+        self.assertEqual(result.stdout.strip(), 'pygame_menu._decorator pygame_menu.utils []')
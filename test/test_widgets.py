@@ -34,7 +34,10 @@ __all__ = ['WidgetsTest']
 from test._utils import MenuUtils, surface, PygameEventUtils, test_reset_surface, TEST_THEME, \
     PYGAME_V2, WINDOW_SIZE
 import copy
+import gc
+import tracemalloc
 import unittest
+import weakref
 
 import pygame
 import pygame_menu
@@ -42,11 +45,15 @@ import pygame_menu
 from pygame_menu.controls import KEY_LEFT, KEY_RIGHT, KEY_APPLY, JOY_RIGHT, JOY_LEFT, \
     KEY_MOVE_DOWN, KEY_MOVE_UP
 from pygame_menu.locals import ORIENTATION_VERTICAL, FINGERDOWN, ALIGN_LEFT, POSITION_SOUTHEAST
+from pygame_menu.utils import SurfacePool
 from pygame_menu.widgets import MENUBAR_STYLE_ADAPTIVE, MENUBAR_STYLE_NONE, \
     MENUBAR_STYLE_SIMPLE, MENUBAR_STYLE_UNDERLINE, MENUBAR_STYLE_UNDERLINE_TITLE, \
     MENUBAR_STYLE_TITLE_ONLY, MENUBAR_STYLE_TITLE_ONLY_DIAGONAL
 from pygame_menu.widgets import ScrollBar, Label, Button, MenuBar, NoneWidget, NoneSelection
 
+# Configure the tests
+TEST_MEMORY_WIDGET = False
+
 
 class WidgetsTest(unittest.TestCase):
 
@@ -187,6 +194,130 @@ class WidgetsTest(unittest.TestCase):
         w.set_background_color(pygame_menu.BaseImage(pygame_menu.baseimage.IMAGE_EXAMPLE_GRAY_LINES))
         w.draw(surface)
 
+    def test_slots(self) -> None:
+        """
+        Test the widgets do not have a dict, and the attributes and the callbacks
+        are created on first use. Prints the memory used by each widget if
+        ``TEST_MEMORY_WIDGET`` is enabled.
+        """
+        for w in (Button('button'), Label('label'), NoneWidget(), ScrollBar(100, (0, 1)),
+                  pygame_menu.widgets.TextInput('text'), pygame_menu.widgets.Frame(100, 100, ORIENTATION_VERTICAL)):
+            self.assertFalse(hasattr(w, '__dict__'))
+            self.assertRaises(AttributeError, lambda: setattr(w, 'unknown', True))
+        w = Button('button')
+        self.assertIsNone(w._attributes)
+        self.assertIsNone(w._draw_callbacks)
+        self.assertIsNone(w._update_callbacks)
+        self.assertFalse(w.has_attribute('epic'))
+        self.assertEqual(w.get_attribute('epic', 1), 1)
+        w.set_attribute('epic', 2)
+        self.assertEqual(w.get_attribute('epic'), 2)
+        w.apply_draw_callbacks()
+        w.apply_update_callbacks()
+        self.assertRaises(IndexError, lambda: w.remove_draw_callback('id'))
+        self.assertRaises(IndexError, lambda: w.remove_update_callback('id'))
+        w.remove_draw_callback(w.add_draw_callback(lambda *_: None))
+        self.assertEqual(w._draw_callbacks, {})
+
+        # Subclasses without slots still have a dict
+        class CustomButton(Button):
+            pass
+
+        w = CustomButton('button')
+        w.unknown = True
+        self.assertTrue(w.unknown)
+
+        # Widgets and menus can be weakly referenced
+        w = Button('button')
+        self.assertIs(weakref.ref(w)(), w)
+        menu = MenuUtils.generic_menu()
+        self.assertIs(weakref.ref(menu)(), menu)
+
+        if not TEST_MEMORY_WIDGET:
+            return
+        total = 1000
+        for widget in (Button, Label, NoneWidget):
+            gc.collect()
+            tracemalloc.start()
+            widgets = [widget() if widget == NoneWidget else widget('widget') for _ in range(total)]
+            size = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+            print('{0}: {1} bytes per widget'.format(widget.__name__, size // len(widgets)))
+
+    def test_surface_pool(self) -> None:
+        """
+        Test the surface pool used by the widget render.
+        """
+        pool = SurfacePool(bucket=16, max_free=1)
+        s = pool.borrow(10, 20, fill_color=(255, 0, 0))
+        self.assertEqual(s.get_size(), (10, 20))
+        self.assertEqual(s.get_parent().get_size(), (16, 32))
+        self.assertEqual(s.get_at((5, 5)), (255, 0, 0, 255))
+        self.assertEqual(pool.allocated, 0)  # Counted by the module pool
+        self.assertEqual(pool.borrowed, 1)
+        self.assertEqual(pool.get_free(), 0)
+
+        # Release the surface, and borrow it again within the same bucket
+        parent = s.get_parent()
+        pool.release(s)
+        pool.release(s)  # Released twice is ignored
+        pool.release(pygame.Surface((10, 10)))  # Not from the pool
+        pool.release(None)
+        self.assertEqual(pool.released, 1)
+        self.assertEqual(pool.get_free(), 1)
+        s = pool.borrow(16, 17)
+        self.assertEqual(s.get_size(), (16, 17))
+        self.assertIs(s.get_parent(), parent)
+        self.assertEqual(s.get_at((5, 5)), (0, 0, 0, 0))  # Cleared
+        self.assertEqual(pool.reused, 1)
+        self.assertEqual(pool.get_free(), 0)
+
+        # Different bucket or flags allocates a new surface
+        self.assertIsNot(pool.borrow(16, 40).get_parent(), parent)
+        self.assertIsNot(pool.borrow(16, 17, alpha=True).get_parent(), parent)
+        self.assertEqual(pool.reused, 1)
+
+        # Free list is limited
+        s2 = pool.borrow(1, 20)  # Same bucket as s
+        pool.release(s)
+        pool.release(s2)
+        self.assertEqual(pool.get_free(), 1)
+        pool.clear()
+        self.assertEqual(pool.get_free(), 0)
+        self.assertEqual(pool.borrow(0, 0).get_size(), (0, 0))
+
+        # Detached surfaces are not returned to the pool
+        s = pool.borrow(10, 20)
+        pool.detach(s)
+        pool.detach(pygame.Surface((10, 10)))
+        pool.detach(None)
+        self.assertEqual(pool.detached, 1)
+        pool.release(s)
+        self.assertEqual(pool.get_free(), 0)
+
+        # Widgets return the previous surface to the pool on render
+        menu = MenuUtils.generic_menu()
+        btn = menu.add.button('button')
+        sel = menu.add.selector('selector', [('a', 1), ('b', 2)], style=pygame_menu.widgets.SELECTOR_STYLE_FANCY)
+        menu.draw(surface)
+        reused = menu._stats.surface_reused
+        for i in range(10):
+            btn.set_title('button {0}'.format(i % 2))
+            sel.set_value(i % 2)
+            menu.draw(surface)
+        self.assertGreater(menu._stats.surface_borrowed, 0)
+        self.assertGreater(menu._stats.surface_reused, reused)
+        self.assertEqual(btn.get_surface().get_size(), btn.get_size(apply_padding=False))
+
+        # The surface returned by get_surface is not overwritten by the next renders
+        btn_surface = btn.get_surface()
+        btn_draw = pygame.image.tostring(btn_surface, 'RGBA')
+        for i in range(10):
+            btn.set_title('other {0}'.format(i % 2))
+            menu.draw(surface)
+        self.assertIsNot(btn.get_surface(), btn_surface)
+        self.assertEqual(pygame.image.tostring(btn_surface, 'RGBA'), btn_draw)
+
     def test_transform(self) -> None:
         """
         Transform widgets.
@@ -389,6 +520,22 @@ class WidgetsTest(unittest.TestCase):
         self.assertRaises(AssertionError, lambda: mb.set_backbox_border_width(-1))
         self.assertEqual(mb._backbox_border_width, 2)
         menu.draw(surface)
+
+        # The bar surface is rendered only if the title or the geometry change
+        mb = menu.get_menubar()
+        bar_surface = mb._bar_surface
+        self.assertIsNotNone(bar_surface)
+        menu.draw(surface)
+        self.assertIs(mb._bar_surface, bar_surface)
+        menu.set_title('New title')
+        menu.draw(surface)
+        self.assertIsNot(mb._bar_surface, bar_surface)
+
+        # Translucent backgrounds are not cached
+        mb = MenuBar('Menu', 500, (0, 0, 0, 100), back_box=True)
+        menu.add.generic_widget(mb)
+        mb.draw(surface)
+        self.assertIsNone(mb._bar_surface)
         menu.disable()
 
     # noinspection PyArgumentEqualDefault,PyTypeChecker
@@ -455,6 +602,45 @@ class WidgetsTest(unittest.TestCase):
         selector.update(PygameEventUtils.key(KEY_LEFT, keydown=True))
         self.assertEqual(selector.get_value()[0][0], '4 - Easy')
 
+        # Type-ahead search
+        selector = menu.add.selector('fruit', [('Apple', 1), ('banana', 2), ('Avocado', 3), ('Blueberry', 4),
+                                               ('cherry', 5), ('apple', 6)])
+        self.assertEqual(selector._items_index.get('apple'), 5)
+        self.assertEqual(selector._items_index.get('orange'), -1)
+        self.assertEqual(selector._items_index.find('a', 1), 2)
+        self.assertEqual(selector._items_index.find('AP', 1), 5)
+        self.assertEqual(selector._items_index.find('ap', 6), 0)
+        self.assertEqual(selector._items_index.find('z'), -1)
+        selector.set_value('apple')
+        self.assertEqual(selector.get_index(), 5)
+
+        def type_text(text: str) -> None:
+            """
+            Type the given text.
+            """
+            for ch in text:
+                selector.update(PygameEventUtils.key(pygame.K_a, keydown=True, char=ch))
+
+        selector.set_value(0)
+        selector._items_index.search_timeout = 1e6
+        type_text('b')
+        self.assertEqual(selector.get_index(), 1)
+        type_text('b')  # Same char cycles
+        self.assertEqual(selector.get_index(), 3)
+        type_text('b')
+        self.assertEqual(selector.get_index(), 1)
+        selector._items_index.search_timeout = -1  # Reset the text at each key
+        type_text('c')
+        self.assertEqual(selector.get_index(), 4)
+        type_text('a')
+        self.assertEqual(selector.get_index(), 5)
+        selector._items_index.search_timeout = 1e6
+        type_text('v')  # Search "av"
+        self.assertEqual(selector.get_index(), 2)
+        type_text('x')  # Not found
+        self.assertEqual(selector.get_index(), 2)
+        self.assertFalse(selector.update(PygameEventUtils.key(pygame.K_TAB, keydown=True, char='\t')))
+
         # Test fancy selector
         menu.add.selector('Fancy ',
                           [('1 - Easy', 'EASY'),
@@ -733,7 +919,7 @@ class WidgetsTest(unittest.TestCase):
 
         # Add underline
         label = menu.add.label('nice')
-        self.assertEqual(label._decorator._total_decor(), 0)
+        self.assertIsNone(label._decorator)
         label.add_underline((0, 0, 0), 1, 1, force_render=True)
         self.assertEqual(label._decorator._total_decor(), 1)
 
@@ -835,8 +1021,8 @@ class WidgetsTest(unittest.TestCase):
         # Ctrl events
         textinput.update(PygameEventUtils.keydown_mod_ctrl(pygame.K_c))  # copy
         textinput.update(PygameEventUtils.keydown_mod_ctrl(pygame.K_v))  # paste
-        textinput.update(PygameEventUtils.keydown_mod_ctrl(pygame.K_z))  # undo
-        self.assertEqual(textinput.get_value(), 'tes')
+        textinput.update(PygameEventUtils.keydown_mod_ctrl(pygame.K_z))  # undo, typing is a single step
+        self.assertEqual(textinput.get_value(), '')
         textinput.update(PygameEventUtils.keydown_mod_ctrl(pygame.K_y))  # redo
         self.assertEqual(textinput.get_value(), 'test')
         textinput.update(PygameEventUtils.keydown_mod_ctrl(pygame.K_x))  # cut
@@ -881,6 +1067,56 @@ class WidgetsTest(unittest.TestCase):
         textinput._cursor_render = True
         textinput._render_cursor()
 
+        # The cursor is drawn within the overlay, blinking does not update the menu cache
+        menu = MenuUtils.generic_menu()
+        textinput = menu.add.text_input('title', default='abc')
+        menu.add.button('button')
+        textinput.select(update_menu=True)
+        menu.draw(surface)
+        rect = textinput.get_rect(to_real_position=True, apply_padding=False)
+        cursor_pos = (rect.x + textinput._cursor_surface_pos[0], rect.y + textinput._cursor_surface_pos[1] + 2)
+        textinput._cursor_ms_counter = textinput._cursor_switch_ms
+        textinput._cursor_visible = False
+        textinput.update([])
+        self.assertTrue(textinput._cursor_visible)
+        self.assertFalse(menu._widget_surface_cache_need_update)
+        menu.draw(surface)
+        self.assertEqual(surface.get_at(cursor_pos), textinput._cursor_color)
+        textinput._cursor_visible = False
+        menu.draw(surface)
+        self.assertNotEqual(surface.get_at(cursor_pos), textinput._cursor_color)
+
+        # Without a Menu, the overlay is drawn at the widget position
+        textinput = pygame_menu.widgets.TextInput('title')
+        textinput.set_font(pygame_menu.font.FONT_OPEN_SANS, 20, (100, 100, 100), (100, 100, 100),
+                           (100, 100, 100), (100, 100, 100), None)
+        textinput.set_value('abc')
+        textinput.set_position(10, 20)
+        textinput.select()
+        textinput._cursor_visible = True
+        self.assertIsNone(textinput._scrollarea)
+        rect = textinput.get_rect(apply_padding=False)
+        cursor_pos = (rect.x + textinput._cursor_surface_pos[0], rect.y + textinput._cursor_surface_pos[1] + 2)
+        surface.fill((255, 255, 255))
+        textinput.draw(surface)
+        self.assertEqual(surface.get_at(cursor_pos), textinput._cursor_color)
+        surface.fill((255, 255, 255))
+        textinput.draw_overlay(surface)
+        self.assertEqual(surface.get_at(cursor_pos), textinput._cursor_color)
+
+        # A widget within a Menu drawn outside the Menu also draws its overlay
+        menu = MenuUtils.generic_menu()
+        textinput = menu.add.text_input('title', default='abc')
+        textinput.select(update_menu=True)
+        textinput._cursor_visible = True
+        menu.draw(surface)
+        self.assertFalse(menu._drawing_widgets_surface)
+        rect = textinput.get_rect(apply_padding=False)
+        cursor_pos = (rect.x + textinput._cursor_surface_pos[0], rect.y + textinput._cursor_surface_pos[1] + 2)
+        surface.fill((255, 255, 255))
+        textinput.draw(surface)
+        self.assertEqual(surface.get_at(cursor_pos), textinput._cursor_color)
+
         # Test underline edge cases
         theme = TEST_THEME.copy()
         theme.title_font_size = 35
@@ -944,6 +1180,14 @@ class WidgetsTest(unittest.TestCase):
         textinput = menu.add.text_input('title: ', input_underline='_', input_underline_len=10)
         self.assertEqual(textinput._current_underline_string, '_' * 10)
 
+        # The underline is cached, typing does not render it again
+        underline_cache = textinput._underline_cache.copy()
+        textinput.set_value('abc')
+        self.assertEqual(textinput._underline_cache, underline_cache)
+        self.assertEqual(textinput._current_underline_string, '_' * 10)
+        textinput.set_title('new title: ')
+        self.assertEqual(len(textinput._underline_cache), 1)
+
         # Text underline with different column widths
         menu = pygame_menu.Menu(
             column_max_width=200,
@@ -966,6 +1210,100 @@ class WidgetsTest(unittest.TestCase):
         self.assertEqual(textinput.get_width(), 134)
         self.assertEqual(textinput._current_underline_string, '________')
 
+    def test_textinput_history(self) -> None:
+        """
+        Test TextInput undo/redo history.
+        """
+        menu = MenuUtils.generic_menu()
+        textinput = menu.add.text_input('title')
+
+        def type_text(text: str) -> None:
+            """
+            Type the given text.
+            """
+            for ch in text:
+                textinput.update(PygameEventUtils.key(pygame.K_a, keydown=True, char=ch))
+
+        # Words are coalesced within a single edition
+        type_text('hello world')
+        self.assertEqual(len(textinput._history), 2)
+        self.assertEqual(textinput._history[0].inserted, 'hello')
+        self.assertEqual(textinput._history[1].inserted, ' world')
+        self.assertTrue(textinput._undo())
+        self.assertEqual(textinput.get_value(), 'hello')
+        self.assertEqual(textinput._cursor_position, 5)
+        self.assertTrue(textinput._undo())
+        self.assertEqual(textinput.get_value(), '')
+        self.assertFalse(textinput._undo())
+        self.assertTrue(textinput._redo())
+        self.assertTrue(textinput._redo())
+        self.assertEqual(textinput.get_value(), 'hello world')
+        self.assertEqual(textinput._cursor_position, 11)
+        self.assertFalse(textinput._redo())
+
+        # Backspace is also coalesced
+        for _ in range(3):
+            textinput.update(PygameEventUtils.key(pygame.K_BACKSPACE, keydown=True))
+        self.assertEqual(textinput.get_value(), 'hello wo')
+        self.assertEqual(textinput._history[-1].removed, 'rld')
+        textinput._undo()
+        self.assertEqual(textinput.get_value(), 'hello world')
+
+        # A new edition discards the redo history
+        textinput._undo()
+        type_text('!')
+        self.assertEqual(textinput.get_value(), 'hello!')
+        self.assertFalse(textinput._redo())
+        textinput._undo()
+        self.assertEqual(textinput.get_value(), 'hello')
+
+        # Only the diff is stored, not the whole string
+        textinput = menu.add.text_input('title', history_coalesce=False)
+        textinput.set_value('x' * 1000)
+        type_text('abc')
+        self.assertEqual(len(textinput._history), 4)
+        self.assertEqual(textinput._history_bytes, 1003)
+        textinput._undo()
+        self.assertEqual(textinput.get_value(), 'x' * 1000 + 'ab')
+
+        # Limit by number of editions
+        textinput = menu.add.text_input('title', history=2, history_coalesce=False)
+        type_text('abcd')
+        self.assertEqual(len(textinput._history), 2)
+        self.assertTrue(textinput._undo())
+        self.assertTrue(textinput._undo())
+        self.assertFalse(textinput._undo())
+        self.assertEqual(textinput.get_value(), 'ab')
+
+        # Limit by bytes, the oldest editions are evicted first
+        textinput = menu.add.text_input('title', history_maxbytes=10)
+        type_text('aaaa bbbb cccc')
+        self.assertEqual([e.inserted for e in textinput._history], [' bbbb', ' cccc'])
+        self.assertEqual(textinput._history_bytes, 10)
+        textinput._undo()
+        textinput._undo()
+        self.assertEqual(textinput.get_value(), 'aaaa')
+        self.assertFalse(textinput._undo())
+
+        # The default value is the base status, not an edition
+        textinput = menu.add.text_input('title', default='hello')
+        self.assertEqual(len(textinput._history), 0)
+        self.assertFalse(textinput._undo())
+        self.assertEqual(textinput.get_value(), 'hello')
+        type_text(' world')
+        self.assertTrue(textinput._undo())
+        self.assertFalse(textinput._undo())
+        self.assertEqual(textinput.get_value(), 'hello')
+        textinput.reset_value()
+        self.assertEqual(len(textinput._history), 1)
+
+        # History disabled
+        textinput = menu.add.text_input('title', history=0)
+        type_text('abc')
+        self.assertEqual(len(textinput._history), 0)
+        self.assertFalse(textinput.update(PygameEventUtils.keydown_mod_ctrl(pygame.K_z)))
+        self.assertEqual(textinput.get_value(), 'abc')
+
     def test_button(self) -> None:
         """
         Test button widget.
@@ -1089,7 +1427,7 @@ class WidgetsTest(unittest.TestCase):
         # Test underline
         # Add underline
         btn = menu.add.button('epic', pygame_menu.events.NONE)
-        self.assertEqual(btn._decorator._total_decor(), 0)
+        self.assertIsNone(btn._decorator)
         btn.add_underline((0, 0, 0), 1, 1, force_render=True)
         self.assertEqual(btn._decorator._total_decor(), 1)
 
@@ -1404,27 +1742,6 @@ class WidgetsTest(unittest.TestCase):
                    (1, 0, 0, 0, 0, 1, 1)),
                   ('Button-item3',
                    (-1, -1, -1, 0, 155, 356, 40, 261, 348, 0, 310),
-                   (1, 0, 0, 0, 0, 1, 1)),
-                  ('Button-item4',
-                   (-1, -1, -1, 0, 194, 356, 40, 261, 348, 0, 349),
-                   (1, 0, 0, 0, 0, 1, 1)),
-                  ('Button-item5',
-                   (-1, -1, -1, 0, 233, 356, 40, 261, 348, 0, 388),
-                   (1, 0, 0, 0, 0, 1, 1)),
-                  ('Button-item6',
-                   (-1, -1, -1, 0, 272, 356, 40, 261, 348, 0, 427),
-                   (1, 0, 0, 0, 0, 1, 1)),
-                  ('Button-item7',
-                   (-1, -1, -1, 0, 311, 356, 40, 261, 348, 0, 466),
-                   (1, 0, 0, 0, 0, 1, 1)),
-                  ('Button-item8',
-                   (-1, -1, -1, 0, 350, 356, 40, 261, 348, 0, 505),
-                   (1, 0, 0, 0, 0, 1, 1)),
-                  ('Button-item9',
-                   (-1, -1, -1, 0, 389, 356, 40, 261, 348, 0, 544),
-                   (1, 0, 0, 0, 0, 1, 1)),
-                  ('Button-item10',
-                   (-1, -1, -1, 0, 428, 356, 40, 261, 348, 0, 583),
                    (1, 0, 0, 0, 0, 1, 1))),)
             ))
         self.assertEqual(drop._drop_frame.get_attribute('height'), 135 if PYGAME_V2 else 138)
@@ -1520,8 +1837,8 @@ class WidgetsTest(unittest.TestCase):
 
         # Test change items
         drop.update_items([])
-        self.assertRaises(pygame_menu.widgets.widget.dropselect._SelectionDropNotMakedException,
-                          lambda: drop._check_drop_maked())
+        drop._check_drop_maked()  # The drop is updated, not discarded
+        self.assertEqual(drop._option_buttons, [])
         drop.make_selection_drop()  # This selection drop is empty
         self.assertEqual(drop._drop_frame.get_attribute('height'), 0)
         self.assertEqual(drop._drop_frame.get_attribute('width'), 0)
@@ -1842,6 +2159,117 @@ class WidgetsTest(unittest.TestCase):
         menu2.translate(0, 0)
         self.assertEqual(drop3.get_focus_rect(), pygame.Rect(108, 468, 320, 28))
 
+    def test_dropselect_large(self) -> None:
+        """
+        Test dropselect with many items, which only creates the visible option buttons.
+        """
+        menu = MenuUtils.generic_menu()
+        items = [('item{}'.format(i), i) for i in range(1000)]
+        drop = menu.add.dropselect('drop', items, selection_box_height=5)
+        self.assertEqual(len(drop._option_buttons), 6)
+        self.assertEqual(drop._option_buttons[0].get_title(), 'item0')
+        frame = drop._drop_frame
+        self.assertTrue(frame.is_scrollable)
+        scrollarea = frame.get_scrollarea(inner=True)
+        self.assertEqual(scrollarea.get_world_size()[1], 1001 * drop._option_buttons_row_height - 1)
+
+        # The world surface only contains the window of rows
+        self.assertEqual(frame.get_inner_size()[1], 6 * drop._option_buttons_row_height - 1)
+        self.assertEqual(frame.get_surface().get_height(), frame.get_inner_size()[1])
+
+        # Select an item far from the visible window, this binds the buttons
+        drop.select(update_menu=True)
+        drop._toggle_drop()
+        self.assertTrue(drop.active)
+        drop.set_value(500)
+        offset = drop._option_buttons_offset
+        self.assertTrue(offset <= 500 < offset + 6)
+        btn = drop._option_buttons[500 - offset]
+        self.assertEqual(btn.get_title(), 'item500')
+        self.assertEqual(btn.get_rect().y + scrollarea.get_world_offset()[1], 501 * drop._option_buttons_row_height)
+        self.assertEqual(btn._background_color, drop._selection_option_selected_bgcolor)
+
+        # Scroll the frame, buttons are recycled
+        drop.scrollv(1)
+        self.assertEqual(drop._option_buttons_offset, 994)
+        self.assertEqual(scrollarea.get_world_offset()[1], 995 * drop._option_buttons_row_height)
+        self.assertEqual(drop._option_buttons[-1].get_title(), 'item999')
+        self.assertNotEqual(drop._option_buttons[0]._background_color, drop._selection_option_selected_bgcolor)
+        drop.scrollv(0)
+        self.assertEqual(drop._option_buttons_offset, 0)
+        self.assertEqual(drop._option_buttons[0].get_title(), 'item0')
+
+        # Click a recycled button
+        drop.scrollv(0.5)
+        offset = drop._option_buttons_offset
+        self.assertGreater(offset, 0)
+        drop.update(PygameEventUtils.middle_rect_click(drop._option_buttons[3]))
+        self.assertEqual(drop.get_index(), offset + 3)
+        self.assertFalse(drop.active)
+
+        # Type-ahead jumps to the option, only if the drop is opened
+        self.assertFalse(drop.update(PygameEventUtils.key(pygame.K_9, keydown=True, char='9')))
+        drop._toggle_drop()
+        drop._items_index.search_timeout = 1e6
+        for ch in 'item99':
+            drop.update(PygameEventUtils.key(pygame.K_a, keydown=True, char=ch))
+        self.assertEqual(drop.get_index(), 990)  # Search starts at the current option
+        offset = drop._option_buttons_offset
+        self.assertEqual(drop._option_buttons[990 - offset].get_title(), 'item990')
+        drop.update(PygameEventUtils.key(pygame.K_a, keydown=True, char='9'))
+        self.assertEqual(drop.get_index(), 999)
+        drop.set_value(0)
+        drop._items_index.search_timeout = -1
+        drop.update(PygameEventUtils.key(pygame.K_a, keydown=True, char='i'))
+        self.assertEqual(drop.get_index(), 1)
+        drop.set_value('item7')
+        self.assertEqual(drop.get_index(), 7)
+        self.assertRaises(ValueError, lambda: drop.set_value('item1000'))
+        drop._toggle_drop()
+
+        # Update the items in place
+        drop.update_items([('new{}'.format(i), i) for i in range(2000)])
+        self.assertEqual(drop._drop_frame, frame)
+        self.assertEqual(scrollarea.get_world_size()[1], 2001 * drop._option_buttons_row_height - 1)
+        self.assertEqual(scrollarea.get_world_offset(), (0, 0))
+        self.assertEqual(drop._option_buttons_offset, 0)
+        self.assertEqual(drop._option_buttons[0].get_title(), 'new0')
+        self.assertEqual(drop._option_buttons[0]._kwargs['index'], 0)
+
+        # Few items rebuild the frame
+        drop.update_items([('a', 0), ('b', 1)])
+        self.assertNotEqual(drop._drop_frame, frame)
+        self.assertEqual(len(drop._option_buttons), 2)
+
+        # Multiple selection keeps the decoration of the recycled buttons
+        drop2 = menu.add.dropselect_multiple('drop2', items, selection_box_height=5)
+        self.assertEqual(len(drop2._option_buttons), 6)
+        drop2.scrollv(0.1)
+        btn = drop2._option_buttons[1]
+        index = btn._kwargs['index']
+        self.assertGreater(index, 1)
+        self.assertEqual(btn.get_title(), 'item{}'.format(index))
+        drop2.set_value(index, process_index=True)
+        self.assertEqual(drop2.get_index(), [index])
+        self.assertTrue(btn.get_decorator()._decor_enabled[btn.get_attribute('deco_on')])
+        drop2.scrollv(0)
+        self.assertFalse(btn.get_decorator()._decor_enabled[btn.get_attribute('deco_on')])
+
+        # The size of the surfaces does not depend on the number of items, and
+        # the width of the rows is updated as these are bound
+        items = [('item{}'.format(i), i) for i in range(5000)]
+        items[4000] = ('widest item of the list', 4000)
+        drop3 = menu.add.dropselect('drop3', items, selection_box_height=5)
+        frame = drop3._drop_frame
+        scrollarea = frame.get_scrollarea(inner=True)
+        self.assertEqual(frame.get_surface().get_height(), 6 * drop3._option_buttons_row_height - 1)
+        self.assertEqual(scrollarea.get_world_size()[1], 5001 * drop3._option_buttons_row_height - 1)
+        width = frame.get_surface().get_width()
+        drop3.set_value(4000)
+        self.assertGreater(frame.get_surface().get_width(), width)
+        self.assertEqual(scrollarea.get_world_size()[0], frame.get_surface().get_width())
+        self.assertEqual(frame.get_surface().get_height(), 6 * drop3._option_buttons_row_height - 1)
+
     def test_none(self) -> None:
         """
         Test none widget.
@@ -2098,6 +2526,19 @@ class WidgetsTest(unittest.TestCase):
                                                      evtype=pygame.MOUSEMOTION))
         self.assertIn(sb.get_value_percentage(), (0.976, 1))
 
+        # Moving the slider does not render the page control and the slider again
+        sb.draw(surface)
+        sb_surface, slider_surface = sb._surface, sb._slider_surface
+        sb.set_value(400)
+        sb.draw(surface)
+        self.assertIs(sb._surface, sb_surface)
+        self.assertIs(sb._slider_surface, slider_surface)
+        self.assertEqual(surface.get_at(sb.get_slider_rect().center), sb._slider_color)
+        sb.set_page_step(length / 2)
+        sb.draw(surface)
+        self.assertIs(sb._surface, sb_surface)
+        self.assertIsNot(sb._slider_surface, slider_surface)
+
         # Test remove onreturn
         sb = ScrollBar(length, world_range, 'sb', ORIENTATION_VERTICAL, onreturn=-1)
         self.assertIsNone(sb._onreturn)